@@ -27,6 +27,7 @@ from processdesignagents.default_config import DEFAULT_CONFIG
 from processdesignagents.agents.utils.equipment_stream_markdown import (
     equipments_and_streams_dict_to_markdown,
 )
+from processdesignagents.agents.utils.flowsheet import Flowsheet
 from cli.utils import *
 
 console = Console()
@@ -357,17 +358,19 @@ def convert_section_to_markdown(section: str, content: Any) -> Any:
     Attempt to convert JSON payloads for specific sections into markdown
     before storing or saving them.
     """
-    if not isinstance(content, str):
-        return content
-
-    text = content.strip()
-    if not text:
+    if isinstance(content, Flowsheet):
+        parsed = content.to_dict()
+    elif not isinstance(content, str):
         return content
+    else:
+        text = content.strip()
+        if not text:
+            return content
 
-    try:
-        parsed = json.loads(text)
-    except json.JSONDecodeError:
-        return content
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            return content
 
     markdown = ""
     if section == "research_concepts":
@@ -377,6 +380,8 @@ def convert_section_to_markdown(section: str, content: Any) -> Any:
     elif section in {"equipment_list_template", "equipment_list_results"}:
         markdown = _equipments_to_markdown(parsed)
 
+    if isinstance(content, Flowsheet):
+        return markdown or content.to_json()
     return markdown or content
 
 
@@ -906,13 +911,16 @@ def run_analysis():
                 message_buffer.update_agent_status("Stream Data Estimator", "in_progress")
 
             if chunk.get("stream_list_results"):
-                message_buffer.update_report_section("stream_list_results", chunk["stream_list_results"])
+                # The parsed flowsheet already holds these streams; skip re-parsing the JSON string.
+                message_buffer.update_report_section(
+                    "stream_list_results", chunk.get("flowsheet") or chunk["stream_list_results"]
+                )
                 message_buffer.update_agent_status("Stream Data Estimator", "completed")
                 message_buffer.update_agent_status("Equipment Sizing Agent", "in_progress")
 
             if chunk.get("equipment_list_results"):
                 message_buffer.update_report_section(
-                    "equipment_list_results", chunk["equipment_list_results"]
+                    "equipment_list_results", chunk.get("flowsheet") or chunk["equipment_list_results"]
                 )
                 message_buffer.update_agent_status("Equipment Sizing Agent", "completed")
                 message_buffer.update_agent_status("Safety Risk Analyst", "in_progress")
@@ -1,17 +1,57 @@
+"""Agent factories, imported on first use.
+
+Importing this package is cheap: each agent module (and the LLM, CoolProp and
+tool dependencies it pulls in) is only imported when its factory is first
+accessed, e.g. `processdesignagents.agents.create_equipment_sizing_agent`.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .utils.agent_states import DesignState
 
-from .analysts.design_basis_analyst import create_design_basis_analyst
-from .analysts.process_requirements_analyst import create_process_requiruments_analyst
-from .analysts.safety_risk_analyst import create_safety_risk_analyst
-from .designers.equipment_sizing_agent import create_equipment_sizing_agent
-from .designers.equipment_stream_catalog_agent import create_equipment_stream_catalog_agent
-from .designers.flowsheet_design_agent import create_flowsheet_design_agent
-from .designers.stream_property_estimation_agent import create_stream_property_estimation_agent
-from .project_manager.project_manager import create_project_manager
-from .researchers.component_list_researcher import create_component_list_researcher
-from .researchers.conservative_researcher import create_conservative_researcher
-from .researchers.detail_concept_researcher import create_concept_detailer
-from .researchers.innovative_researcher import create_innovative_researcher
+_LAZY_ATTRIBUTES = {
+    "create_design_basis_analyst": ".analysts.design_basis_analyst",
+    "create_process_requiruments_analyst": ".analysts.process_requirements_analyst",
+    "create_safety_risk_analyst": ".analysts.safety_risk_analyst",
+    "create_equipment_sizing_agent": ".designers.equipment_sizing_agent",
+    "create_equipment_stream_catalog_agent": ".designers.equipment_stream_catalog_agent",
+    "create_flowsheet_design_agent": ".designers.flowsheet_design_agent",
+    "create_stream_property_estimation_agent": ".designers.stream_property_estimation_agent",
+    "create_project_manager": ".project_manager.project_manager",
+    "create_component_list_researcher": ".researchers.component_list_researcher",
+    "create_conservative_researcher": ".researchers.conservative_researcher",
+    "create_concept_detailer": ".researchers.detail_concept_researcher",
+    "create_innovative_researcher": ".researchers.innovative_researcher",
+}
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers see the eager imports
+    from .analysts.design_basis_analyst import create_design_basis_analyst
+    from .analysts.process_requirements_analyst import create_process_requiruments_analyst
+    from .analysts.safety_risk_analyst import create_safety_risk_analyst
+    from .designers.equipment_sizing_agent import create_equipment_sizing_agent
+    from .designers.equipment_stream_catalog_agent import create_equipment_stream_catalog_agent
+    from .designers.flowsheet_design_agent import create_flowsheet_design_agent
+    from .designers.stream_property_estimation_agent import create_stream_property_estimation_agent
+    from .project_manager.project_manager import create_project_manager
+    from .researchers.component_list_researcher import create_component_list_researcher
+    from .researchers.conservative_researcher import create_conservative_researcher
+    from .researchers.detail_concept_researcher import create_concept_detailer
+    from .researchers.innovative_researcher import create_innovative_researcher
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "DesignState",
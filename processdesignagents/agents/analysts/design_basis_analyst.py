@@ -1,15 +1,11 @@
 from __future__ import annotations
 
 from dotenv import load_dotenv
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    HumanMessagePromptTemplate,
-    SystemMessagePromptTemplate,
-)
+from langchain_core.prompts import ChatPromptTemplate
 
 from processdesignagents.agents.utils.agent_states import DesignState
 from processdesignagents.agents.utils.prompt_utils import (
-    jinja_raw,
+    build_chat_prompt,
     strip_markdown_code_fences,
     load_prompt,
 )
@@ -104,15 +100,4 @@ def google_prompt_templates(
     """
     
     # Construct the template
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-from operator import le
 import re
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
-from sympy import continued_fraction_periodic
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, load_prompt
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, load_prompt
 
 load_dotenv()
 
@@ -117,15 +113,4 @@ def safety_risk_prompt(
 ---
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
\ No newline at end of file
+    return build_chat_prompt(system_content, human_content)
\ No newline at end of file
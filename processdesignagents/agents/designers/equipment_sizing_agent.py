@@ -1,23 +1,22 @@
 from __future__ import annotations
 
 import json
-from json_repair import repair_json
 from typing import Dict, Any
 
 from langchain_core.messages import AIMessage
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 
 from dotenv import load_dotenv
-from regex import FULLCASE
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt
+from processdesignagents.agents.utils.json_tools import parse_llm_json
+from processdesignagents.agents.utils.flowsheet import load_flowsheet
+from processdesignagents.agents.utils.presizing import presize_equipment
 from processdesignagents.agents.utils.equipment_stream_markdown import equipments_and_streams_dict_to_markdown
 from processdesignagents.agents.designers.tools import equipment_sizing_prompt_with_tools, run_agent_with_tools
 # Import equipment sizing tools
@@ -44,11 +43,14 @@ load_dotenv()
 
 
 # Helper functions
-def create_equipment_category_list(equipment_stream_list_str: str) -> Dict[str, Any]:
+def create_equipment_category_list(equipment_stream_list: str | Dict[str, Any]) -> Dict[str, Any]:
     try:
         equipment_category_list = {}
         equipment_category_set = set()  # define as set
-        equipment_stream_list_dict = json.loads(equipment_stream_list_str)
+        if isinstance(equipment_stream_list, str):
+            equipment_stream_list_dict = json.loads(equipment_stream_list)
+        else:
+            equipment_stream_list_dict = equipment_stream_list
         
         if "equipments" in equipment_stream_list_dict:
             # Get the equipment list from master dict
@@ -84,12 +86,36 @@ def create_equipment_sizing_agent(llm, llm_provider: str = "openrouter", max_cou
         design_basis_markdown = state.get("design_basis", "")
         flowsheet_description_markdown = state.get("flowsheet_description", "")
         equipment_and_stream_results_json = state.get("equipment_and_stream_results", "{}")
-        equipment_and_stream_results_dict = json.loads(repair_json(equipment_and_stream_results_json))
-        
-        if "equipments" not in equipment_and_stream_results_dict or "streams" not in equipment_and_stream_results_dict:
-            print("FAILED: Incorrect format of Equipment and Stream Template", flush=True)
+        try:
+            results_flowsheet = load_flowsheet(state, "equipment_and_stream_results")
+        except ValueError as e:
+            print(f"FAILED: Incorrect format of Equipment and Stream Template: {e}", flush=True)
             exit(-1)
             
+        # Size equipment whose inputs are fully determined by the stream data
+        # without the LLM; only the remaining items go into the prompt.
+        presizing = presize_equipment(results_flowsheet)
+        print(
+            f"INFO: Pre-sized {len(presizing.sized_ids)} of "
+            f"{len(presizing.sized_ids) + len(presizing.pending_ids)} equipment items without the LLM: "
+            f"{', '.join(presizing.sized_ids) or 'none'}",
+            flush=True,
+        )
+        if presizing.complete:
+            flowsheet = presizing.flowsheet
+            _, equipments_md, _ = equipments_and_streams_dict_to_markdown(flowsheet.to_dict())
+            print("DEBUG: ** Equipent List **")
+            print(equipments_md)
+            return {
+                "equipment_list_results": json.dumps({"equipments": flowsheet.equipment_list()}),
+                "equipment_and_stream_results": flowsheet.to_json(),
+                "flowsheet": flowsheet,
+                "flowsheet_source": "equipment_and_stream_results",
+                "messages": [],
+            }
+        if presizing.sized_ids:
+            equipment_and_stream_results_json = presizing.pending_flowsheet().to_json()
+
         # Create tools list to be called by agent
         tools_list = [
             size_air_cooler_basic,
@@ -111,7 +137,7 @@ def create_equipment_sizing_agent(llm, llm_provider: str = "openrouter", max_cou
         ]
         
         # Create equipment category list from equipment_and_stream_list_template
-        equipment_category_list = create_equipment_category_list(equipment_and_stream_results_json)
+        equipment_category_list = create_equipment_category_list(results_flowsheet.to_dict())
         
         # Print the equipment category list in the temeplate
         if "category_names" in equipment_category_list:
@@ -145,6 +171,7 @@ def create_equipment_sizing_agent(llm, llm_provider: str = "openrouter", max_cou
                     system_prompt=system_message,
                     human_prompt=human_message,
                     tools_list=tools_list,
+                    usage_label="equipment_sizing",
                     )
                 print(f"DEBUG: Return from run_agent_with_tools.")
                 try:
@@ -163,24 +190,24 @@ def create_equipment_sizing_agent(llm, llm_provider: str = "openrouter", max_cou
                         continue
                     
                     print("DEBUG: Convert ai_message to dict.")
-                    equipment_list_dict = json.loads(repair_json(output_str))
+                    equipment_list_dict = parse_llm_json(output_str)
                     if "equipments" not in equipment_list_dict:
                         print("FAILED: Incorrect format of Equipment List", flush=True)
                         print(output_str)
                         continue
                     
                     print("DEBUG: Convert dict is successful.")
-                    equipment_stream_final_dict = {
-                        "equipments": equipment_list_dict["equipments"],
-                        "streams": equipment_and_stream_results_dict["streams"],
-                        }
-                    _, equipments_md, _ = equipments_and_streams_dict_to_markdown(equipment_stream_final_dict)
+                    flowsheet = presizing.merge(equipment_list_dict["equipments"])
+                    equipment_list_dict["equipments"] = flowsheet.equipment_list()
+                    _, equipments_md, _ = equipments_and_streams_dict_to_markdown(flowsheet.to_dict())
                     print("DEBUG: ** Equipent List **")
                     print(equipments_md)
                     
                     return {
                         "equipment_list_results": json.dumps(equipment_list_dict),
-                        "equipment_and_stream_results": json.dumps(equipment_stream_final_dict),
+                        "equipment_and_stream_results": flowsheet.to_json(),
+                        "flowsheet": flowsheet,
+                        "flowsheet_source": "equipment_and_stream_results",
                         "messages": ai_messages,
                     }
                 except Exception as e:
@@ -1271,15 +1298,4 @@ def equipment_sizing_prompt(
 
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
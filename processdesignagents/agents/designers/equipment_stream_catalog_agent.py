@@ -1,26 +1,24 @@
 from __future__ import annotations
 
 import json
-from json_repair import repair_json
 
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt
 from processdesignagents.agents.utils.equipment_stream_markdown import equipments_and_streams_dict_to_markdown
-from processdesignagents.agents.utils.json_tools import get_json_str_from_llm, extract_first_json_document
+from processdesignagents.agents.utils.json_tools import get_json_str_from_llm, parse_llm_json
+from processdesignagents.agents.utils.flowsheet import Flowsheet
 
 load_dotenv()
 
 
-def create_equipment_stream_catalog_agent(llm, llm_provider: str = "openrouter"):
+def create_equipment_stream_catalog_agent(llm, llm_provider: str = "openrouter", max_count: int = 10):
     def equipment_stream_catalog_agent(state: DesignState) -> DesignState:
         """Equipment & Stream Catalog Agent: Produces a JSON stream inventory template for process streams."""
         print("\n# Create Equipment & Stream Catalog Template", flush=True)
@@ -44,14 +42,24 @@ def create_equipment_stream_catalog_agent(llm, llm_provider: str = "openrouter")
         response_dict = {}
         equipment_list_template = {}
         stream_list_template = {}
+        flowsheet = None
+        try_count = 0
         while not is_done:
+            try_count += 1
+            if try_count > max_count:
+                print("DEBUG: Maximum try count reached. Exiting")
+                exit(-1)
             try:
                 if llm_provider == "openrouter":
                     pass
                 response, response_content = get_json_str_from_llm(llm, prompt, state)
-                _, response_dict = extract_first_json_document(repair_json(response_content))
+                response_dict = parse_llm_json(response_content)
                 if isinstance(response_dict, dict):
+                    # Duplicate or malformed IDs fail this attempt and reprompt
+                    flowsheet = Flowsheet.from_dict(response_dict)
                     is_done = True
+            except ValueError as e:
+                print(f"FAILED: Attempt {try_count}: incorrect Equipment and Stream Catalog: {e}", flush=True)
             except Exception as e:
                 raise ValueError(f"DEBUG: Value : {e}")
         combined_md, _, _ = equipments_and_streams_dict_to_markdown(response_dict)
@@ -63,6 +71,8 @@ def create_equipment_stream_catalog_agent(llm, llm_provider: str = "openrouter")
             "equipment_list_template": json.dumps(equipment_list_template),
             "stream_list_template": json.dumps(stream_list_template),
             "equipment_and_stream_template": json.dumps(response_dict),
+            "flowsheet": flowsheet,
+            "flowsheet_source": "equipment_and_stream_template",
             "messages": [response],
         }
 
@@ -733,15 +743,4 @@ def equipment_stream_catalog_prompt(
 **You MUST to response only a valid JSON without any commentary or wrapping in code block.**
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -2,14 +2,12 @@ from __future__ import annotations
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, strip_markdown_code_fences
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, strip_markdown_code_fences
 
 load_dotenv()
 
@@ -377,15 +375,4 @@ Hot ethanol from the upstream blending unit (Stream 1001) is fed to the shell si
 
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -1,21 +1,19 @@
 from __future__ import annotations
 
 import json
-from typing import final
-from json_repair import repair_json
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
-from langsmith import unit
 
 from processdesignagents.agents.designers.tools.stream_calculation_tools import unit_converts
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt
+from processdesignagents.agents.utils.json_tools import parse_llm_json
+from processdesignagents.agents.utils.flowsheet import load_flowsheet
+from processdesignagents.agents.utils.balance_check import check_flowsheet_balance
 from processdesignagents.agents.utils.equipment_stream_markdown import equipments_and_streams_dict_to_markdown
 from processdesignagents.utils.pydantic_utils import EquipmentAndStreamList
 from processdesignagents.agents.designers.tools import (
@@ -55,9 +53,10 @@ def create_stream_property_estimation_agent(llm, llm_provider: str = "openrouter
             print("FAILED: Previous data is missing...", flush=True)
             exit(-1)
             
-        equipment_and_stream_template_dict = json.loads(repair_json(equipment_and_stream_template_json))
-        if "equipments" not in equipment_and_stream_template_dict or "streams" not in equipment_and_stream_template_dict:
-            print("FAILED: Incorrect format of Equipment and Stream Template", flush=True)
+        try:
+            template_flowsheet = load_flowsheet(state, "equipment_and_stream_template")
+        except ValueError as e:
+            print(f"FAILED: Incorrect format of Equipment and Stream Template: {e}", flush=True)
             exit(-1)
         # Create tools list to be called by agent
         tools_list = [
@@ -97,7 +96,8 @@ def create_stream_property_estimation_agent(llm, llm_provider: str = "openrouter
                     llm_model=llm,
                     system_prompt=system_message,
                     human_prompt=human_message,
-                    tools_list=tools_list
+                    tools_list=tools_list,
+                    usage_label="stream_property_estimation",
                     )
                 print(f"DEBUG: Return from run_agent_with_tools.")
                 try:
@@ -116,24 +116,25 @@ def create_stream_property_estimation_agent(llm, llm_provider: str = "openrouter
                         continue
                     
                     print("DEBUG: Convert ai_message to dict.")
-                    streams_list_dict = json.loads(repair_json(output_str))
+                    streams_list_dict = parse_llm_json(output_str)
                     if "streams" not in streams_list_dict:
                         print("FAILED: Incorrect format of Stream List", flush=True)
                         print(output_str)
                         continue
                     
                     print("DEBUG: Convert dict is successful.")
-                    equipment_stream_list_dict = {
-                        "equipments": equipment_and_stream_template_dict["equipments"],
-                        "streams": streams_list_dict["streams"],
-                        }
-                    _, _, streams_md = equipments_and_streams_dict_to_markdown(equipment_stream_list_dict)
+                    flowsheet = template_flowsheet.with_streams(streams_list_dict["streams"])
+                    _, _, streams_md = equipments_and_streams_dict_to_markdown(flowsheet.to_dict())
                     print("DEBUG: ** Steam List **")
                     print(streams_md)
+                    balance = check_flowsheet_balance(flowsheet)
+                    print(f"DEBUG: Mass balance check: {balance.summary()}", flush=True)
                     
                     return {
                         "stream_list_results": json.dumps(streams_list_dict),
-                        "equipment_and_stream_results": json.dumps(equipment_stream_list_dict),
+                        "equipment_and_stream_results": flowsheet.to_json(),
+                        "flowsheet": flowsheet,
+                        "flowsheet_source": "equipment_and_stream_results",
                         "messages": ai_messages,
                     }
                 except Exception as e:
@@ -1263,15 +1264,4 @@ def stream_property_estimation_prompt(
 You MUST respond only with a valid JSON object without commentary or code fences.
 """
     
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -20,7 +20,7 @@ from .equipment_sizing_prompt import equipment_sizing_prompt_with_tools
 from .component_research_prompt import component_list_researcher_prompt_with_tools
 from .agent_with_tools import run_agent_with_tools
 
-from .unit_converter.unit_converter.converter import convert, converts
+from .unit_converter.unit_converter.converter import convert, converts, convert_array
 
 __all__ = [
     "calculate_molar_flow_from_mass",
@@ -41,4 +41,5 @@ __all__ = [
     "unit_converts",
     "convert",
     "converts",
+    "convert_array",
 ]
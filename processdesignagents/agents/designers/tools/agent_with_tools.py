@@ -1,20 +1,29 @@
+from __future__ import annotations
+
 import json
 import re
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import AIMessage, BaseMessage, ToolMessage, HumanMessage
 from langchain.agents.structured_output import ToolStrategy, ProviderStrategy
 from pydantic import BaseModel
 # Using create_agent in langchain 1.0
 from langchain.agents import create_agent
 
+from processdesignagents.agents.utils.json_tools import JsonStreamScanner
+from processdesignagents.agents.utils.prompt_cache import PROMPT_CACHE_STATS, cacheable_system_message
+
+if TYPE_CHECKING:  # provider SDKs load only when a provider is selected
+    from langchain_openai import ChatOpenAI
+
+
 def run_agent_with_tools(
     llm_model: ChatOpenAI,
     system_prompt: str,
     human_prompt: str,
     tools_list: List[Any],
     output_schema: BaseModel = None,
+    usage_label: str = "agent_with_tools",
 ) -> str:
     """
     Runs the stream calculation agent, handling tool calls and returning the final JSON output.
@@ -24,6 +33,8 @@ def run_agent_with_tools(
         system_content: The system prompt for the agent.
         human_content: The human prompt for the agent.
         tools_list: A list of tools available to the agent.
+        usage_label: Name under which prompt token usage is recorded in
+            `PROMPT_CACHE_STATS`.
 
     Returns:
         A JSON string representing the final stream data list.
@@ -35,12 +46,16 @@ def run_agent_with_tools(
     # Create tools list to be called by agent
     # The tool map will be used to look up and invoke the correct tool by name.
     tool_map = {tool.name: tool for tool in tools_list}
+
+    # The system prompt and tool definitions form the static prefix of every
+    # iteration; mark it cacheable so only the growing history is reprocessed.
+    system_message = cacheable_system_message(system_prompt, llm_model)
     
     agent = None
     if output_schema:
         agent = create_agent(
             model=llm_model,
-            system_prompt=system_prompt,
+            system_prompt=system_message,
             tools=tools_list,
             # explicitly using tool strategy
             response_format=ToolStrategy(output_schema)
@@ -48,7 +63,7 @@ def run_agent_with_tools(
     else:
         agent = create_agent(
             model=llm_model,
-            system_prompt=system_prompt,
+            system_prompt=system_message,
             tools=tools_list,
         )
 
@@ -59,6 +74,9 @@ def run_agent_with_tools(
         print(f"--- Agent Iteration {i+1} ---", flush=True)
 
         response = agent.invoke({"messages": messages})
+        usage = PROMPT_CACHE_STATS.record_all(usage_label, response["messages"][len(messages):])
+        if usage.calls:
+            print(f"DEBUG: {usage_label} tokens: {usage.describe()}", flush=True)
 
         # The last message in the result is the agent's latest response
         agent_response = response["messages"][-1]
@@ -112,6 +130,11 @@ def run_agent_with_tools(
                         tool_args[param_name] = float(param_value)
                     except ValueError:
                         tool_args[param_name] = param_value
+                        # Dict/list arguments (e.g. compositions) arrive as JSON text
+                        if param_value.lstrip().startswith(("{", "[")):
+                            documents = JsonStreamScanner().feed(param_value)
+                            if documents:
+                                tool_args[param_name] = documents[0][1]
 
                 if tool_name in tool_map:
                     print(f"Agent requested text-based tool call: {tool_name} with args: {tool_args}", flush=True)
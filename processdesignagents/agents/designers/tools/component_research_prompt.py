@@ -1,12 +1,8 @@
 from __future__ import annotations
 
 from typing import Tuple
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    HumanMessagePromptTemplate,
-    SystemMessagePromptTemplate,
-)
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, load_prompt
+from langchain_core.prompts import ChatPromptTemplate
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, load_prompt
 
 
 def component_list_researcher_prompt_with_tools(
@@ -44,15 +40,4 @@ When compiling the table, include four columns in this order: Name, Formula, MW,
 Return only the Markdown header and table as defined in your instructions.
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages), system_content, human_content
+    return build_chat_prompt(system_content, human_content), system_content, human_content
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from processdesignagents.utils.lazy_import import lazy_import
+from processdesignagents.utils.process_pool import (
+    DEFAULT_MIN_PARALLEL_BATCH,
+    attach_shared_array,
+    run_sharded,
+)
+
+from .stream_calculation_tools import _get_coolprop_name
+
+CP = lazy_import("CoolProp.CoolProp")
+
+# CoolProp output keys returned by default (SI units: kg/m3, J/kg/K, Pa.s, W/m/K, -)
+DEFAULT_FLASH_OUTPUTS = ("Dmass", "Cpmass", "viscosity", "conductivity", "Q")
+
+
+@lru_cache(maxsize=32)
+def _abstract_state(backend: str, fluids: Tuple[str, ...], mole_fractions: Tuple[float, ...]):
+    """Build (once per process) the AbstractState of a fluid or fixed-composition mixture."""
+    state = CP.AbstractState(backend, "&".join(fluids))
+    if len(fluids) > 1:
+        state.set_mole_fractions(list(mole_fractions))
+    return state
+
+
+@lru_cache(maxsize=64)
+def _parameter_indices(outputs: Tuple[str, ...]) -> Tuple[int, ...]:
+    return tuple(CP.get_parameter_index(name) for name in outputs)
+
+
+def _flash_rows(
+    conditions: np.ndarray,
+    fluids: Tuple[str, ...],
+    mole_fractions: Tuple[float, ...],
+    outputs: Tuple[str, ...],
+    backend: str,
+) -> np.ndarray:
+    """PT-flash each (T [K], P [Pa]) row; rows that fail to converge stay NaN."""
+    state = _abstract_state(backend, fluids, mole_fractions)
+    indices = _parameter_indices(outputs)
+    values = np.full((len(conditions), len(outputs)), np.nan)
+    for row, (temperature_k, pressure_pa) in enumerate(conditions):
+        try:
+            state.update(CP.PT_INPUTS, pressure_pa, temperature_k)
+        except ValueError:
+            continue
+        for column, index in enumerate(indices):
+            try:
+                values[row, column] = state.keyed_output(index)
+            except ValueError:
+                pass
+    return values
+
+
+def _flash_worker(block_name, shape, start, conditions, fluids, mole_fractions, outputs, backend) -> None:
+    values = _flash_rows(conditions, fluids, mole_fractions, outputs, backend)
+    with attach_shared_array(block_name, shape) as out:
+        out[start:start + len(values)] = values
+
+
+def flash_properties_batch(
+    components: Sequence[str],
+    temperatures_k: Sequence[float],
+    pressures_pa: Sequence[float],
+    mole_fractions: Optional[Sequence[float]] = None,
+    outputs: Sequence[str] = DEFAULT_FLASH_OUTPUTS,
+    backend: str = "HEOS",
+    max_workers: Optional[int] = None,
+    min_parallel: int = DEFAULT_MIN_PARALLEL_BATCH,
+) -> np.ndarray:
+    """Evaluate CoolProp properties for many (T, P) points of one fluid or mixture.
+
+    Returns a (points, len(outputs)) array in SI units, NaN where the flash
+    or an output failed. Each process builds the `AbstractState` once and
+    reuses it for every point. Batches of at least `min_parallel` points
+    are sharded across the process pool, and the workers write into a
+    shared-memory array.
+
+    Args:
+        components: Component names (aliases such as "h2o" are mapped to CoolProp names).
+        temperatures_k: Temperatures in K.
+        pressures_pa: Absolute pressures in Pa, same length as `temperatures_k`.
+        mole_fractions: Mixture composition (required for more than one component).
+        outputs: CoolProp output keys, e.g. "Dmass", "Hmass", "Cpmass", "viscosity".
+        backend: CoolProp backend.
+    """
+    fluids = tuple(_get_coolprop_name(name) for name in components)
+    if len(fluids) > 1:
+        if mole_fractions is None or len(mole_fractions) != len(fluids):
+            raise ValueError("mole_fractions must give one fraction per component for a mixture.")
+        total = float(sum(mole_fractions))
+        fractions = tuple(float(value) / total for value in mole_fractions)
+    else:
+        fractions = (1.0,)
+    conditions = np.column_stack([np.asarray(temperatures_k, dtype=float), np.asarray(pressures_pa, dtype=float)])
+    outputs = tuple(outputs)
+
+    if len(conditions) < min_parallel:
+        return _flash_rows(conditions, fluids, fractions, outputs, backend)
+    return run_sharded(
+        _flash_worker, conditions, len(outputs), fluids, fractions, outputs, backend, max_workers=max_workers
+    )
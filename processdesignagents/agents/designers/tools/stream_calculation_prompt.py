@@ -1,12 +1,8 @@
 from __future__ import annotations
 
 from typing import Tuple
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    HumanMessagePromptTemplate,
-    SystemMessagePromptTemplate,
-)
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, load_prompt
+from langchain_core.prompts import ChatPromptTemplate
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, load_prompt
 
 def stream_calculation_prompt_with_tools(
     design_basis: str,
@@ -53,18 +49,6 @@ Generate the **complete stream table** in JSON format based on the following inf
 **Output ONLY the final stream list JSON object (no code fences, no additional text, no tool calls, no XML tags). The output must start directly with `{{` and end with `}}`.**
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    # Create the ChatPromptTemplate
-    prompt_template = ChatPromptTemplate.from_messages(messages)
+    prompt_template = build_chat_prompt(system_content, human_content)
 
     return prompt_template, system_content, human_content
\ No newline at end of file
@@ -3,11 +3,15 @@ from __future__ import annotations
 import json
 import math
 from typing import Dict, List, Any, Optional
-import CoolProp.CoolProp as CP # Import CoolProp
 from langchain_core.tools import tool # Import LangChain tool decorator
 
+from processdesignagents.utils.lazy_import import lazy_import
+
 from .unit_converter.unit_converter.converter import convert, converts
 
+# CoolProp takes seconds to import; load it on the first property call.
+CP = lazy_import("CoolProp.CoolProp")
+
 # ============================================================================
 # Helper Functions with CoolProp Integration
 # ============================================================================
@@ -5,7 +5,12 @@ from decimal import Decimal as D
 
 import pytest
 
-from unit_converter.converter import convert
+import numpy as np
+
+from unit_converter.converter import (
+    convert, convert_array, conversion_factors, clear_cache,
+)
+from unit_converter.exceptions import UnConsistentUnitsError
 
 TESTS_CASES = [
     # (quantity, expected_value, desired_unit)
@@ -53,3 +58,40 @@ def test_cases_tol_true(quantity, expected_value, desired_unit):
 def test_cases_tol_false(quantity, expected_value, desired_unit):
     result_value = convert(quantity, desired_unit)
     assert not result_value == expected_value
+
+
+def test_factors_are_cached():
+    clear_cache()
+    convert('1 kg*h^-1', 'kg*s^-1')
+    convert('2 kg*h^-1', 'kg*s^-1')
+    info = conversion_factors.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_offset_units_round_trip():
+    assert convert('5 barg', 'Pa') == D('601325')
+    assert convert('601325 Pa', 'barg') == D('5')
+
+
+def test_inconsistent_units():
+    with pytest.raises(UnConsistentUnitsError):
+        convert('1 m', 'kg')
+
+
+def test_convert_array_float():
+    result = convert_array(np.array([0.0, 1.0, 2.5]), 'barg', 'Pa')
+    np.testing.assert_allclose(result, [101325.0, 201325.0, 351325.0])
+    result = convert_array([3600.0, 7200.0], 'kg*h^-1', 'kg*s^-1')
+    np.testing.assert_allclose(result, [1.0, 2.0])
+
+
+def test_convert_array_temperature():
+    result = convert_array([32.0, 212.0], '°F', '°C')
+    np.testing.assert_allclose(result, [0.0, 100.0], atol=1e-12)
+
+
+def test_convert_array_precise():
+    result = convert_array(['52', '0'], '°C', 'K', precise=True)
+    assert result.dtype == object
+    assert list(result) == [D('325.15'), D('273.15')]
@@ -4,14 +4,12 @@ import re
 
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, strip_markdown_code_fences, load_prompt
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, strip_markdown_code_fences, load_prompt
 
 load_dotenv()
 
@@ -106,15 +104,4 @@ Create a project summary based on the following data:
 {safety_and_risk_json}
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
\ No newline at end of file
+    return build_chat_prompt(system_content, human_content)
\ No newline at end of file
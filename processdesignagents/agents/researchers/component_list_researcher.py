@@ -1,18 +1,15 @@
 from __future__ import annotations
 
-from operator import is_
 from typing import Tuple
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from langchain_core.messages import AIMessage
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt
 from processdesignagents.agents.designers.tools import get_physical_properties, run_agent_with_tools, component_list_researcher_prompt_with_tools
 
 load_dotenv()
@@ -55,7 +52,8 @@ def create_component_list_researcher(llm):
                     llm_model=llm,
                     system_prompt=system_content,
                     human_prompt=human_content,
-                    tools_list=tools_list
+                    tools_list=tools_list,
+                    usage_label="component_list_researcher",
                     )
                 
                 if isinstance(ai_messages, list):
@@ -400,15 +398,4 @@ When compiling the table, include four columns in this order: Name, Formula, MW,
 Return only the Markdown header and table as defined in your instructions.
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages), system_content, human_content
+    return build_chat_prompt(system_content, human_content), system_content, human_content
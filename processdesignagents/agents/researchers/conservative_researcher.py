@@ -1,19 +1,16 @@
 from __future__ import annotations
 
 import json
-from json_repair import repair_json
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, load_prompt
-from processdesignagents.agents.utils.json_tools import get_json_str_from_llm, extract_first_json_document
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, load_prompt
+from processdesignagents.agents.utils.json_tools import get_json_str_from_llm, extract_first_json_document, parse_llm_json
 
 
 load_dotenv()
@@ -37,7 +34,7 @@ def create_conservative_researcher(llm):
             # Call function to execute LLM with expecting JSON in response.content
             response, response_content = get_json_str_from_llm(llm, prompt, state)
             
-            response_dict = json.loads(repair_json(response_content))
+            response_dict = parse_llm_json(response_content)
             
             # Get correct item if return list
             if isinstance(response_dict, list):
@@ -117,15 +114,4 @@ def conservative_researcher_prompt(
 
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -1,17 +1,15 @@
 from __future__ import annotations
 
 import json
-from json_repair import repair_json
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, strip_markdown_code_fences, load_prompt
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, strip_markdown_code_fences, load_prompt
+from processdesignagents.agents.utils.json_tools import parse_llm_json
 
 load_dotenv()
 
@@ -26,7 +24,7 @@ def create_concept_detailer(llm, selection_provider_getter=None):
         requirements_markdown = state.get("process_requirements", "")
 
         try:
-            evaluation_payload = json.loads(repair_json(evaluations_json_raw))
+            evaluation_payload = parse_llm_json(evaluations_json_raw)
         except Exception as e:
             print(f"Error: {e}")
             print(evaluations_json_raw)
@@ -166,15 +164,4 @@ def concept_detailer_prompt(
 # FINAL MARKDOWN OUTPUT:
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
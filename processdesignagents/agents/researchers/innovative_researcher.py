@@ -1,20 +1,17 @@
 from __future__ import annotations
 
 import json
-from json_repair import repair_json
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import (
     ChatPromptTemplate,
-    HumanMessagePromptTemplate,
     MessagesPlaceholder,
-    SystemMessagePromptTemplate,
 )
 
 from dotenv import load_dotenv
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents.utils.prompt_utils import jinja_raw, load_prompt
-from processdesignagents.agents.utils.json_tools import get_json_str_from_llm
+from processdesignagents.agents.utils.prompt_utils import build_chat_prompt, load_prompt
+from processdesignagents.agents.utils.json_tools import get_json_str_from_llm, parse_llm_json
 
 load_dotenv()
 
@@ -40,7 +37,7 @@ def create_innovative_researcher(llm):
             # print(f"DEBUG: {response_content}", flush=True)
             
             # Convert str to dict
-            response_dict = json.loads(repair_json(response_content))
+            response_dict = parse_llm_json(response_content)
             
             # Get correct item if return list
             if isinstance(response_dict, list):
@@ -122,15 +119,4 @@ def innovative_researcher_prompt(requirements_markdown: str) -> ChatPromptTempla
 
 """
 
-    messages = [
-        SystemMessagePromptTemplate.from_template(
-            jinja_raw(system_content),
-            template_format="jinja2",
-        ),
-        HumanMessagePromptTemplate.from_template(
-            jinja_raw(human_content),
-            template_format="jinja2",
-        ),
-    ]
-
-    return ChatPromptTemplate.from_messages(messages)
+    return build_chat_prompt(system_content, human_content)
@@ -9,6 +9,8 @@ except ImportError:  # pragma: no cover
 from langgraph.graph import add_messages
 from langchain_core.messages import BaseMessage
 
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+
 class DesignState(TypedDict):
     llm_provider: Annotated[str, ""]
     messages: Annotated[List[BaseMessage], add_messages]
@@ -27,6 +29,8 @@ class DesignState(TypedDict):
     stream_list_template: Annotated[str, ""]
     stream_list_results: Annotated[str, ""]
     project_approval: Annotated[str, ""]
+    flowsheet: NotRequired[Flowsheet]
+    flowsheet_source: NotRequired[str]
     design_basis: NotRequired[str]
     safety_risk_analyst_report: NotRequired[str]
     project_manager_report: NotRequired[str]
@@ -51,6 +55,8 @@ def create_design_state(
     stream_list_template: str = "",
     stream_list_results: str = "",
     project_approval: str = "",
+    flowsheet: Optional[Flowsheet] = None,
+    flowsheet_source: str = "equipment_and_stream_results",
     design_basis: Optional[str] = None,
     safety_risk_analyst_report: Optional[str] = None,
     project_manager_report: Optional[str] = None,
@@ -79,5 +85,8 @@ def create_design_state(
         "safety_risk_analyst_report": safety_risk_analyst_report,
         "project_manager_report": project_manager_report,
     }
+    if flowsheet is not None:
+        state["flowsheet"] = flowsheet
+        state["flowsheet_source"] = flowsheet_source
 
     return state
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+from processdesignagents.agents.utils.stream_table import StreamTable
+
+TOTAL = "total"
+_SECONDS_PER_HOUR = 3600.0
+
+
+@dataclass(frozen=True)
+class Imbalance:
+    """Inlet minus outlet mass flow of one unit, for the total or one component."""
+
+    unit_id: str
+    component: str
+    residual_kg_h: float
+    inlet_kg_h: float
+
+    @property
+    def relative(self) -> float:
+        return abs(self.residual_kg_h) / self.inlet_kg_h if self.inlet_kg_h else float("inf")
+
+
+@dataclass
+class BalanceReport:
+    """Result of `check_flowsheet_balance`; imbalances are ranked by magnitude."""
+
+    imbalances: List[Imbalance] = field(default_factory=list)
+    incomplete_units: List[str] = field(default_factory=list)
+    unknown_streams: List[str] = field(default_factory=list)
+    unconverted_streams: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.imbalances
+
+    def summary(self, limit: int = 10) -> str:
+        if self.ok and not self.incomplete_units:
+            return "Mass balance closes for every unit."
+        lines = [f"{len(self.imbalances)} imbalance(s) found."]
+        for item in self.imbalances[:limit]:
+            lines.append(
+                f"- {item.unit_id} [{item.component}]: residual {item.residual_kg_h:+.4g} kg/h "
+                f"({item.relative:.1%} of inlet)"
+            )
+        if len(self.imbalances) > limit:
+            lines.append(f"- ... {len(self.imbalances) - limit} more")
+        if self.incomplete_units:
+            lines.append(f"Units with missing flows: {', '.join(self.incomplete_units)}")
+        if self.unknown_streams:
+            lines.append(f"Unknown stream IDs: {', '.join(self.unknown_streams)}")
+        if self.unconverted_streams:
+            lines.append(f"Streams with unconvertible mass flows: {', '.join(self.unconverted_streams)}")
+        return "\n".join(lines)
+
+
+def check_flowsheet_balance(
+    flowsheet: Flowsheet,
+    rel_tol: float = 0.01,
+    abs_tol_kg_h: float = 1e-3,
+    reaction_categories: Sequence[str] = ("reactor",),
+    table: Optional[StreamTable] = None,
+) -> BalanceReport:
+    """Check the total and per-component mass balance of every unit.
+
+    The unit/stream incidence matrix (+1 for `streams_in`, -1 for
+    `streams_out`) is multiplied once with the stream x (total, component)
+    mass flow matrix, so every residual is computed in a single sparse
+    product. Component flows use the mass fractions (`m_` keys); units whose
+    category matches `reaction_categories` are only checked on the total.
+    A residual is reported when it exceeds both `abs_tol_kg_h` and
+    `rel_tol` times the unit's inlet flow. Units that reference a stream ID
+    missing from the table, or touch a stream without a usable flow (absent,
+    or in a unit the table cannot convert), are listed in `incomplete_units`
+    and not checked at all.
+    """
+    table = table if table is not None else flowsheet.stream_table()
+    report = BalanceReport()
+    units = flowsheet.equipment_list()
+    if not units:
+        return report
+
+    rows: List[int] = []
+    columns: List[int] = []
+    signs: List[float] = []
+    unknown = set()
+    unresolved = np.zeros(len(units), dtype=bool)  # units referencing an unknown stream ID
+    for row, unit in enumerate(units):
+        for key, sign in (("streams_in", 1.0), ("streams_out", -1.0)):
+            stream_ids = unit.get(key) or []
+            if isinstance(stream_ids, str):
+                stream_ids = [stream_ids]
+            for stream_id in stream_ids:
+                column = table.index.get(str(stream_id))
+                if column is None:
+                    unknown.add(str(stream_id))
+                    unresolved[row] = True
+                    continue
+                rows.append(row)
+                columns.append(column)
+                signs.append(sign)
+    report.unknown_streams = sorted(unknown)
+    report.unconverted_streams = [
+        table.records[column].id for column in np.flatnonzero(table.irregular_mask("mass_flow"))
+    ]
+
+    incidence = sparse.csr_matrix((signs, (rows, columns)), shape=(len(units), len(table)))
+    inlets = sparse.csr_matrix(
+        (np.clip(signs, 0.0, None), (rows, columns)), shape=(len(units), len(table))
+    )
+
+    mass_flow = table.column("mass_flow") * _SECONDS_PER_HOUR
+    component_names, mass_fractions = table.fraction_matrix("mass")
+    flows = np.column_stack([mass_flow, mass_flow[:, None] * mass_fractions])
+    missing = np.isnan(flows)
+    flows = np.where(missing, 0.0, flows)
+
+    residuals = incidence @ flows
+    inlet_flows = inlets @ flows
+    missing_count = abs(incidence) @ missing.astype(float)
+
+    names = [TOTAL] + component_names
+    unit_ids = [str(unit.get("id") or f"equipment-{row + 1}") for row, unit in enumerate(units)]
+    checked = (missing_count == 0) & ~unresolved[:, None]
+    for row, unit in enumerate(units):
+        category = f"{unit.get('category', '')} {unit.get('type', '')}".lower()
+        if any(word in category for word in reaction_categories):
+            checked[row, 1:] = False
+    report.incomplete_units = [unit_ids[row] for row in np.flatnonzero((missing_count[:, 0] > 0) | unresolved)]
+
+    limit = np.maximum(abs_tol_kg_h, rel_tol * inlet_flows)
+    flagged_rows, flagged_columns = np.nonzero(checked & (np.abs(residuals) > limit))
+    order = np.argsort(-np.abs(residuals[flagged_rows, flagged_columns]), kind="stable")
+    report.imbalances = [
+        Imbalance(
+            unit_id=unit_ids[flagged_rows[i]],
+            component=names[flagged_columns[i]],
+            residual_kg_h=float(residuals[flagged_rows[i], flagged_columns[i]]),
+            inlet_kg_h=float(inlet_flows[flagged_rows[i], flagged_columns[i]]),
+        )
+        for i in order
+    ]
+    return report
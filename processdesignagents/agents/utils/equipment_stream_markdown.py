@@ -1,6 +1,29 @@
 from __future__ import annotations
 
-from typing import Iterable
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Hashable, Iterable
+
+# Rendered payloads and 8-stream chunk tables, keyed by content hashes.
+_PAYLOAD_CACHE_SIZE = 64
+_CHUNK_CACHE_SIZE = 1024
+_PAYLOAD_CACHE: OrderedDict[Hashable, tuple[str, str, str]] = OrderedDict()
+_CHUNK_CACHE: OrderedDict[Hashable, tuple[str, ...]] = OrderedDict()
+_CACHE_STATS = {"payload_hits": 0, "payload_misses": 0, "chunk_hits": 0, "chunk_misses": 0}
+
+
+def clear_markdown_cache() -> None:
+    """Drop every cached markdown rendering."""
+    _PAYLOAD_CACHE.clear()
+    _CHUNK_CACHE.clear()
+    for key in _CACHE_STATS:
+        _CACHE_STATS[key] = 0
+
+
+def get_markdown_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters of the payload and stream-chunk caches."""
+    return dict(_CACHE_STATS)
 
 
 def equipments_and_streams_dict_to_markdown(payload: dict) -> tuple[str, str, str]:
@@ -8,6 +31,10 @@ def equipments_and_streams_dict_to_markdown(payload: dict) -> tuple[str, str, st
     Convert an LLM response dictionary describing equipment and streams into
     Markdown tables.
 
+    Renderings are memoized by a content hash of the payload, and each
+    8-stream table by the hashes of its streams, so re-rendering a payload in
+    which a few streams changed only rebuilds the tables holding them.
+
     Returns a tuple of (combined_markdown, equipment_table_markdown, stream_table_markdown).
     """
     # Check if payload has equipments and streams keys.
@@ -20,9 +47,16 @@ def equipments_and_streams_dict_to_markdown(payload: dict) -> tuple[str, str, st
     equipments = _ensure_list(payload.get("equipments"))
     streams = _ensure_list(payload.get("streams"))
 
+    equipment_key = _content_hash(equipments)
+    stream_keys = tuple(_content_hash(stream) for stream in streams)
+    payload_key = (equipment_key, stream_keys)
+    cached = _cache_get(_PAYLOAD_CACHE, payload_key, "payload")
+    if cached is not None:
+        return cached
+
     # Convert to Markdown
     equipment_md = _format_equipments_table(equipments)
-    streams_md = _format_streams_table(streams)
+    streams_md = _format_streams_table(streams, stream_keys=stream_keys)
 
     # Combine sections to complete markdown
     combined_sections: list[str] = []
@@ -36,7 +70,34 @@ def equipments_and_streams_dict_to_markdown(payload: dict) -> tuple[str, str, st
         combined_sections.append(streams_md)
 
     combined_md = "\n".join(combined_sections).strip()
-    return combined_md, equipment_md, streams_md
+    result = (combined_md, equipment_md, streams_md)
+    _cache_put(_PAYLOAD_CACHE, payload_key, result, _PAYLOAD_CACHE_SIZE)
+    return result
+
+
+def _content_hash(value) -> str:
+    try:
+        text = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        text = repr(value)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_get(cache: OrderedDict, key: Hashable, name: str):
+    value = cache.get(key)
+    if value is None:
+        _CACHE_STATS[f"{name}_misses"] += 1
+        return None
+    cache.move_to_end(key)
+    _CACHE_STATS[f"{name}_hits"] += 1
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Hashable, value, max_size: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
 
 
 def _format_equipments_table(equipments: Iterable[dict]) -> str:
@@ -73,15 +134,26 @@ def _format_equipments_table(equipments: Iterable[dict]) -> str:
     return "\n".join(rows)
 
 
-def _format_streams_table(streams: Iterable[dict], streams_per_table: int = 8) -> str:
+def _format_streams_table(
+    streams: Iterable[dict],
+    streams_per_table: int = 8,
+    stream_keys: tuple[str, ...] | None = None,
+) -> str:
     all_streams = _ensure_list(streams)
     if not all_streams:
         return ""
+    if stream_keys is None:
+        stream_keys = tuple(_content_hash(stream) for stream in all_streams)
 
     lines: list[str] = []
     for index in range(0, len(all_streams), streams_per_table):
-        chunk = all_streams[index : index + streams_per_table]
-        lines.extend(_build_stream_chunk_table(chunk))
+        chunk_key = stream_keys[index : index + streams_per_table]
+        chunk_lines = _cache_get(_CHUNK_CACHE, chunk_key, "chunk")
+        if chunk_lines is None:
+            chunk = all_streams[index : index + streams_per_table]
+            chunk_lines = tuple(_build_stream_chunk_table(chunk))
+            _cache_put(_CHUNK_CACHE, chunk_key, chunk_lines, _CHUNK_CACHE_SIZE)
+        lines.extend(chunk_lines)
         lines.append("")  # spacer between tables
 
     # Remove trailing blank line if present
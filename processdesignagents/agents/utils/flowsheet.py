@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping
+
+from processdesignagents.agents.utils.json_tools import parse_llm_json
+from processdesignagents.agents.utils.stream_table import StreamTable
+
+
+@dataclass
+class Flowsheet:
+    """Parsed equipment and stream list shared between agents through the state.
+
+    Equipment and stream records keep the JSON contract of
+    `equipment_and_stream_results` (plain dicts, extra keys preserved) and are
+    indexed by their ID, so agents can look them up without re-parsing the
+    JSON strings. IDs must be unique; a duplicate raises ValueError. Serialize with `to_json` only at prompt, checkpoint and
+    report boundaries.
+    """
+
+    equipments: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    streams: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    extras: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "Flowsheet":
+        """Validate an equipment/stream payload and index it by ID."""
+        if not isinstance(payload, Mapping):
+            raise ValueError(f"Flowsheet payload must be a JSON object, got {type(payload).__name__}.")
+        if "equipments" not in payload and "streams" not in payload:
+            raise ValueError("Flowsheet payload has neither 'equipments' nor 'streams'.")
+
+        extras = {
+            key: value for key, value in payload.items() if key not in ("equipments", "streams")
+        }
+        return cls(
+            equipments=_index_by_id(payload.get("equipments"), "equipment"),
+            streams=_index_by_id(payload.get("streams"), "stream"),
+            extras=extras,
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "Flowsheet":
+        """Parse an LLM or state JSON string into a flowsheet."""
+        return cls.from_dict(parse_llm_json(text))
+
+    def equipment_list(self) -> List[Dict[str, Any]]:
+        return list(self.equipments.values())
+
+    def stream_list(self) -> List[Dict[str, Any]]:
+        return list(self.streams.values())
+
+    def stream_table(self) -> StreamTable:
+        """Return the streams as a columnar `StreamTable` (SI columns, composition matrix)."""
+        return StreamTable.from_streams(self.stream_list())
+
+    def with_equipments(self, equipments: List[Dict[str, Any]]) -> "Flowsheet":
+        """Return a copy with the equipment list replaced (e.g. after sizing)."""
+        return Flowsheet(
+            equipments=_index_by_id(equipments, "equipment"),
+            streams=dict(self.streams),
+            extras=dict(self.extras),
+        )
+
+    def with_streams(self, streams: List[Dict[str, Any]]) -> "Flowsheet":
+        """Return a copy with the stream list replaced (e.g. after the heat & material balance)."""
+        return Flowsheet(
+            equipments=dict(self.equipments),
+            streams=_index_by_id(streams, "stream"),
+            extras=dict(self.extras),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the `{"equipments": [...], "streams": [...]}` JSON contract."""
+        payload: Dict[str, Any] = {
+            "equipments": self.equipment_list(),
+            "streams": self.stream_list(),
+        }
+        payload.update(self.extras)
+        return payload
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+
+def load_flowsheet(state: Mapping[str, Any], key: str = "equipment_and_stream_results") -> Flowsheet:
+    """Return the flowsheet held in `state[key]`, reusing the parsed state object when it mirrors that key.
+
+    Agents that store a parsed `flowsheet` also store `flowsheet_source`, the
+    JSON key it was built from. Any other key, and states restored from older
+    checkpoints that only hold the JSON strings, are parsed from `state[key]`.
+    """
+    flowsheet = state.get("flowsheet")
+    if flowsheet is not None and state.get("flowsheet_source") == key:
+        if isinstance(flowsheet, Flowsheet):
+            return flowsheet
+        if isinstance(flowsheet, Mapping):
+            return Flowsheet.from_dict(flowsheet)
+    return Flowsheet.from_json(state.get(key) or "{}")
+
+
+def _index_by_id(items: Any, kind: str) -> Dict[str, Dict[str, Any]]:
+    if items is None:
+        return {}
+    if not isinstance(items, list):
+        raise ValueError(f"Flowsheet {kind}s must be a list, got {type(items).__name__}.")
+
+    indexed: Dict[str, Dict[str, Any]] = {}
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"Flowsheet {kind} #{position + 1} is not a JSON object.")
+        item_id = str(item.get("id") or f"{kind}-{position + 1}")
+        if item_id in indexed:
+            raise ValueError(f"Flowsheet {kind} id '{item_id}' is used more than once (#{position + 1}).")
+        indexed[item_id] = item
+    return indexed
@@ -2,6 +2,12 @@ from __future__ import annotations
 
 import json
 import re
+from collections import Counter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 _INVALID_ESCAPE_PATTERN = re.compile(r"(?<!\\)\\([^\"\\/bfnrtu])")
 _CONTROL_ESCAPE_PATTERN = re.compile(r"(?<!\\)\\([btnfrBTNFR])(?=[A-Za-z])")
@@ -9,6 +15,62 @@ _CONTROL_ESCAPE_PATTERN = re.compile(r"(?<!\\)\\([btnfrBTNFR])(?=[A-Za-z])")
 from typing import Tuple, Any
 from json_repair import repair_json
 
+# How often each tier of parse_llm_json succeeded: "fast", "extract", "repair".
+_JSON_PARSE_TIER_COUNTS: Counter = Counter()
+
+
+def parse_llm_json(raw_text: str | bytes, return_tier: bool = False) -> Any:
+    """Parse JSON produced by an LLM, trying the cheapest strategy first.
+
+    Tiers, in order:
+      1. "fast": strict parse of the whole payload (orjson when installed).
+      2. "extract": strip code fences and decode the first top-level JSON
+         document as written. Invalid escapes are only rewritten in a retry
+         after a decode failure, and decoded strings are never altered. Documents nested in an unclosed or invalid outer bracket
+         are not accepted here, so a truncated reply is not cut down to its
+         first complete inner object.
+      3. "repair": run json_repair over the payload as a last resort.
+
+    The winning tier is counted (see `get_json_parse_stats`) and returned
+    alongside the payload when `return_tier` is True. Raises ValueError when
+    no tier yields JSON.
+    """
+    if isinstance(raw_text, (bytes, bytearray)):
+        raw_text = raw_text.decode("utf-8")
+
+    payload, tier = _parse_json_tiers(raw_text)
+    _JSON_PARSE_TIER_COUNTS[tier] += 1
+    if return_tier:
+        return payload, tier
+    return payload
+
+
+def get_json_parse_stats() -> dict[str, int]:
+    """Return how many times each parse_llm_json tier has succeeded."""
+    return dict(_JSON_PARSE_TIER_COUNTS)
+
+
+def _parse_json_tiers(raw_text: str) -> Tuple[Any, str]:
+    try:
+        if orjson is not None:
+            return orjson.loads(raw_text), "fast"
+        return json.loads(raw_text), "fast"
+    except ValueError:
+        pass
+
+    payload = _extract_json_document(raw_text)
+    if payload is not None:
+        return payload, "extract"
+
+    try:
+        repaired = repair_json(raw_text)
+        if not repaired:
+            raise ValueError("LLM output does not contain a JSON document.")
+        return json.loads(repaired), "repair"
+    except RecursionError as exc:
+        raise ValueError("LLM output is nested too deeply to repair.") from exc
+
+
 def get_json_str_from_llm(llm, prompt, state, max_try_count: int = 10) -> Tuple[Any, str]:
     json_llm = llm.bind(response_format={"type": "json_object"})
     chain = prompt | json_llm
@@ -30,7 +92,7 @@ def get_json_str_from_llm(llm, prompt, state, max_try_count: int = 10) -> Tuple[
                 print("response_content is empty.", flush=True)
                 continue
 
-            json_dict = json.loads(repair_json(response_content))
+            json_dict = parse_llm_json(response_content)
             # print(json_dict, flush=True)
             return response, response_content
         except Exception as e:
@@ -39,38 +101,189 @@ def get_json_str_from_llm(llm, prompt, state, max_try_count: int = 10) -> Tuple[
                 print(response_content, flush=True)
 
 
-def extract_first_json_document(raw_text: str) -> tuple[str, object | None]:
-    """Strip fences and isolate the first JSON document from a mixed payload."""
-    cleaned = raw_text.strip()
+def _extract_json_document(raw_text: str) -> Any:
+    """Return the first top-level JSON document of a fenced or prose-wrapped payload, or None."""
+    cleaned = _strip_code_fences(raw_text)
+    for text in (cleaned, _escape_problematic_json_sequences(cleaned)):
+        scanner = JsonStreamScanner(nested=False)
+        documents = scanner.feed(text) or scanner.finish()
+        if documents:
+            return documents[0][1]
+    return None
+
 
+def _strip_code_fences(raw_text: str) -> str:
+    cleaned = raw_text.strip()
     if cleaned.startswith("```"):
         lines = cleaned.splitlines()
         if len(lines) >= 2 and lines[-1].strip() == "```":
             cleaned = "\n".join(lines[1:-1]).strip()
+    return cleaned
 
-    normalized = _escape_problematic_json_sequences(cleaned)
-    decoder = json.JSONDecoder()
-    start_index = 0
 
-    while start_index < len(normalized):
-        ch = normalized[start_index]
-        if ch.isspace():
-            start_index += 1
-            continue
-        if ch not in "{[":
-            start_index += 1
-            continue
-        try:
-            payload, end_index = decoder.raw_decode(normalized, start_index)
-            sanitized_payload = _sanitize_json_payload(payload)
-            sanitized = json.dumps(sanitized_payload, ensure_ascii=False)
-            return sanitized, sanitized_payload
-        except json.JSONDecodeError:
-            start_index += 1
+def extract_first_json_document(raw_text: str) -> tuple[str, object | None]:
+    """Strip fences and isolate the first JSON document from a mixed payload.
+
+    The returned
+    document is sanitized for Markdown rendering; use `parse_llm_json` to
+    get the data exactly as written.
+    """
+    cleaned = _strip_code_fences(raw_text)
+    normalized = _escape_problematic_json_sequences(cleaned)
+    scanner = JsonStreamScanner()
+    documents = scanner.feed(normalized) or scanner.finish()
+    if documents:
+        _, payload = documents[0]
+        sanitized_payload = _sanitize_json_payload(payload)
+        sanitized = json.dumps(sanitized_payload, ensure_ascii=False)
+        return sanitized, sanitized_payload
 
     return normalized, None
 
 
+class JsonStreamScanner:
+    """Single-pass, string-aware scanner that finds JSON documents in text.
+
+    Text can be fed all at once or chunk by chunk (e.g. from `llm.stream`);
+    `feed` returns every `(text, payload)` document that closed within the
+    chunk, so the first one is available as soon as its last bracket arrives.
+    Brackets are matched outside of JSON strings only and each character is
+    visited once; decoding is attempted only on balanced candidate spans.
+    When an outer span is not valid JSON (prose in braces), the balanced spans
+    nested inside it are tried instead, earliest first (unless `nested` is
+    False). Malformed text never raises; it just yields no documents.
+    """
+
+    _STRUCTURAL_PATTERN = re.compile(r'[\[\]{}"\\]')
+    _OPENING = {"}": "{", "]": "["}
+
+    # Rescans of an unclosed candidate (see `finish`); a constant keeps the scan linear
+    _MAX_RESCANS = 2
+
+    def __init__(self, nested: bool = True) -> None:
+        self._nested = nested
+        self._position = 0  # absolute offset of the next chunk
+        self._reset_candidate()
+
+    def _reset_candidate(self) -> None:
+        self._segments: list[str] = []  # candidate text from earlier chunks
+        self._stack: list[int] = []  # absolute offsets of open brackets
+        self._brackets: list[str] = []
+        self._inner_spans: list[tuple[int, int]] = []
+        self._start = -1
+        self._in_string = False
+        self._escaped_at = -1
+        self._string_bracket = -1  # first bracket read as string content
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Scan the next chunk and return the documents completed in it."""
+        documents: list[tuple[str, Any]] = []
+        base = self._position
+        segment_from = 0
+
+        for match in self._STRUCTURAL_PATTERN.finditer(chunk):
+            index = match.start()
+            position = base + index
+            char = match.group()
+
+            if not self._stack:
+                if char in "{[":
+                    self._start = position
+                    self._stack.append(position)
+                    self._brackets.append(char)
+                    segment_from = index
+                continue
+
+            if position == self._escaped_at:
+                continue
+            if self._in_string:
+                if char == "\\":
+                    self._escaped_at = position + 1
+                elif char == '"':
+                    self._in_string = False
+                elif char in "{[" and self._string_bracket < 0:
+                    self._string_bracket = position
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._stack.append(position)
+                self._brackets.append(char)
+            elif char in "}]":
+                if self._brackets[-1] != self._OPENING[char]:
+                    text = "".join(self._segments) + chunk[segment_from:index + 1]
+                    documents.extend(self._decode_inner_spans(text))
+                    self._reset_candidate()
+                    continue
+                span_start = self._stack.pop()
+                self._brackets.pop()
+                if self._stack:
+                    self._inner_spans.append((span_start, position + 1))
+                    continue
+
+                text = "".join(self._segments) + chunk[segment_from:index + 1]
+                document = self._decode(text)
+                if document is not None:
+                    documents.append(document)
+                else:
+                    documents.extend(self._decode_inner_spans(text))
+                self._reset_candidate()
+
+        if self._stack:
+            self._segments.append(chunk[segment_from:])
+        self._position = base + len(chunk)
+        return documents
+
+    def finish(self) -> list[tuple[str, Any]]:
+        """Flush an unclosed candidate, returning any complete nested documents.
+
+        If none of its nested spans decode (e.g. a stray quote swallowed the
+        rest of the text), the candidate is rescanned from the first bracket
+        that was read as string content. Rescanning from any other bracket
+        would repeat the same string state, and so the same failed spans. The
+        rescans move forward and are capped at `_MAX_RESCANS`, so the work
+        stays linear in the text length.
+        """
+        documents: list[tuple[str, Any]] = []
+        scanner, text = self, "".join(self._segments)
+        for _ in range(self._MAX_RESCANS + 1):
+            if not scanner._stack:
+                break
+            documents = scanner._decode_inner_spans(text)
+            if documents or scanner._string_bracket < 0:
+                break
+            text = text[scanner._string_bracket - scanner._start:]
+            scanner = JsonStreamScanner(nested=self._nested)
+            documents = scanner.feed(text)
+            if documents:
+                break
+            text = "".join(scanner._segments)
+        self._reset_candidate()
+        return documents
+
+    def _decode_inner_spans(self, text: str) -> list[tuple[str, Any]]:
+        documents: list[tuple[str, Any]] = []
+        if not self._nested:
+            return documents
+        covered_until = -1
+        for span_start, span_end in sorted(self._inner_spans, key=lambda span: (span[0], -span[1])):
+            if span_start < covered_until:
+                continue
+            document = self._decode(text[span_start - self._start:span_end - self._start])
+            if document is not None:
+                documents.append(document)
+                covered_until = span_end
+        return documents
+
+    @staticmethod
+    def _decode(text: str) -> tuple[str, Any] | None:
+        try:
+            return text, json.loads(text)
+        except (json.JSONDecodeError, RecursionError):
+            return None
+
+
 def _sanitize_json_payload(node):
     if isinstance(node, dict):
         return {key: _sanitize_json_payload(value) for key, value in node.items()}
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+from processdesignagents.sizing_tools.batch import size_batch
+
+ATMOSPHERIC_PA = 101325.0
+
+# Units accepted for each stream property as (coef, offset) to the target
+# unit. Quantities in any other unit leave the equipment to the LLM rather
+# than risk a wrong conversion.
+_PRESSURE_TO_PA_ABS = {
+    "pa": (1.0, 0.0),
+    "kpa": (1e3, 0.0),
+    "kpa(a)": (1e3, 0.0),
+    "kpaa": (1e3, 0.0),
+    "kpa(g)": (1e3, ATMOSPHERIC_PA),
+    "kpag": (1e3, ATMOSPHERIC_PA),
+    "mpa": (1e6, 0.0),
+    "bar": (1e5, 0.0),
+    "bara": (1e5, 0.0),
+    "bar(a)": (1e5, 0.0),
+    "barg": (1e5, ATMOSPHERIC_PA),
+    "bar(g)": (1e5, ATMOSPHERIC_PA),
+    "psia": (6894.757293168, 0.0),
+    "psig": (6894.757293168, ATMOSPHERIC_PA),
+    "atm": (ATMOSPHERIC_PA, 0.0),
+}
+_MASS_FLOW_TO_KG_H = {
+    "kg/h": (1.0, 0.0),
+    "kg/hr": (1.0, 0.0),
+    "kg/s": (3600.0, 0.0),
+    "t/h": (1000.0, 0.0),
+    "tonne/h": (1000.0, 0.0),
+    "lb/h": (0.45359237, 0.0),
+    "lb/hr": (0.45359237, 0.0),
+}
+_DENSITY_TO_KG_M3 = {
+    "kg/m3": (1.0, 0.0),
+    "kg/m³": (1.0, 0.0),
+    "kg/m^3": (1.0, 0.0),
+    "g/cm3": (1000.0, 0.0),
+    "g/cm³": (1000.0, 0.0),
+    "g/ml": (1000.0, 0.0),
+    "lb/ft3": (16.01846337, 0.0),
+}
+
+
+def _quantity(stream: Optional[Dict[str, Any]], key: str, units: Dict[str, Tuple[float, float]]) -> Optional[float]:
+    """Return stream property `key` converted with `units`, or None if missing/unrecognised."""
+    if not stream:
+        return None
+    entry = (stream.get("properties") or {}).get(key)
+    if not isinstance(entry, dict):
+        return None
+    value = entry.get("value")
+    unit = str(entry.get("unit") or "").replace(" ", "").lower()
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or unit not in units:
+        return None
+    coef, offset = units[unit]
+    return float(value) * coef + offset
+
+
+def _barg(stream: Optional[Dict[str, Any]]) -> Optional[float]:
+    pressure_pa = _quantity(stream, "pressure", _PRESSURE_TO_PA_ABS)
+    return None if pressure_pa is None else (pressure_pa - ATMOSPHERIC_PA) / 1e5
+
+
+def _is_liquid(stream: Optional[Dict[str, Any]]) -> bool:
+    """False for streams flagged as vapour, gas or two-phase (an unset phase counts as liquid)."""
+    phase = str((stream or {}).get("phase") or "").lower()
+    return not any(marker in phase for marker in ("vap", "gas", "two", "mixed"))
+
+
+def _single(stream_ids: Any, streams: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if isinstance(stream_ids, str):
+        stream_ids = [stream_ids]
+    if not isinstance(stream_ids, list) or len(stream_ids) != 1:
+        return None
+    return streams.get(str(stream_ids[0]))
+
+
+def _pump_arguments(equipment, streams) -> Optional[Dict[str, Any]]:
+    inlet = _single(equipment.get("streams_in"), streams)
+    outlet = _single(equipment.get("streams_out"), streams)
+    if not _is_liquid(inlet):
+        return None
+    mass_flow = _quantity(inlet, "mass_flow", _MASS_FLOW_TO_KG_H)
+    density = _quantity(inlet, "density", _DENSITY_TO_KG_M3) or _quantity(outlet, "density", _DENSITY_TO_KG_M3)
+    inlet_barg, outlet_barg = _barg(inlet), _barg(outlet)
+    if None in (mass_flow, density, inlet_barg, outlet_barg) or outlet_barg <= inlet_barg:
+        return None
+    return {
+        "mass_flow_kg_h": mass_flow,
+        "inlet_pressure_barg": round(inlet_barg, 4),
+        "outlet_pressure_barg": round(outlet_barg, 4),
+        "fluid_density_kg_m3": density,
+    }
+
+
+def _surge_drum_arguments(equipment, streams) -> Optional[Dict[str, Any]]:
+    inlet = _single(equipment.get("streams_in"), streams)
+    outlet = _single(equipment.get("streams_out"), streams)
+    if not _is_liquid(inlet):
+        return None
+    inlet_flow = _quantity(inlet, "mass_flow", _MASS_FLOW_TO_KG_H)
+    outlet_flow = _quantity(outlet, "mass_flow", _MASS_FLOW_TO_KG_H)
+    density = _quantity(inlet, "density", _DENSITY_TO_KG_M3)
+    pressure_barg = _barg(inlet)
+    if None in (inlet_flow, outlet_flow, density, pressure_barg) or density <= 0:
+        return None
+    return {
+        "inlet_flow_kg_h": inlet_flow,
+        "outlet_flow_kg_h": outlet_flow,
+        "fluid_density_kg_m3": density,
+        "operating_pressure_barg": round(pressure_barg, 4),
+    }
+
+
+@dataclass(frozen=True)
+class PresizingRule:
+    """Maps one kind of equipment to a sizing method.
+
+    `keywords` are matched against the equipment category and type. The
+    `arguments` function returns the method's keyword arguments, or None when
+    the connected streams do not determine all of them. `outputs` lists
+    (sizing parameter name, result key, unit) for the equipment entry.
+    """
+
+    method: str
+    keywords: Tuple[str, ...]
+    arguments: Callable[[Dict[str, Any], Dict[str, Dict[str, Any]]], Optional[Dict[str, Any]]]
+    outputs: Tuple[Tuple[str, str, str], ...]
+    constants: Tuple[Tuple[str, Any, str], ...] = ()
+
+    def matches(self, equipment: Dict[str, Any]) -> bool:
+        text = f"{equipment.get('category', '')} {equipment.get('type', '')}".lower()
+        return any(keyword in text for keyword in self.keywords)
+
+
+PRESIZING_RULES: Tuple[PresizingRule, ...] = (
+    PresizingRule(
+        method="pump_sizing",
+        keywords=("pump",),
+        arguments=_pump_arguments,
+        outputs=(
+            ("flow_rate", "volumetric_flow_m3_h", "m³/h"),
+            ("head", "total_head_m", "m"),
+            ("discharge_pressure", "discharge_pressure_barg", "barg"),
+            ("hydraulic_power", "hydraulic_power_kw", "kW"),
+            ("motor_power", "motor_power_kw", "kW"),
+            ("npsh_required", "npsh_required_m", "m"),
+            ("pump_type", "pump_type", "string"),
+        ),
+        constants=(("pump_efficiency", 75.0, "%"),),
+    ),
+    PresizingRule(
+        method="surge_drum_sizing",
+        keywords=("surge", "buffer"),
+        arguments=_surge_drum_arguments,
+        outputs=(
+            ("volume", "drum_volume_m3", "m³"),
+            ("diameter", "drum_diameter_mm", "mm"),
+            ("length", "drum_length_mm", "mm"),
+        ),
+        constants=(("l_d_ratio", 3.0, "dimensionless"),),
+    ),
+)
+
+
+@dataclass
+class PresizingReport:
+    """Outcome of `presize_equipment`."""
+
+    flowsheet: Flowsheet
+    sized_ids: List[str] = field(default_factory=list)
+    pending_ids: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.pending_ids
+
+    def pending_flowsheet(self) -> Flowsheet:
+        """The flowsheet restricted to the equipment that still needs the LLM."""
+        pending = set(self.pending_ids)
+        return self.flowsheet.with_equipments(
+            [item for item in self.flowsheet.equipment_list() if str(item.get("id")) in pending]
+        )
+
+    def merge(self, llm_equipments: Sequence[Dict[str, Any]]) -> Flowsheet:
+        """Combine LLM-sized equipment with the pre-sized entries (original order kept).
+
+        Pre-sized entries win; equipment the LLM returned for other IDs is
+        used as-is.
+        """
+        by_id = {str(item.get("id")): item for item in llm_equipments if isinstance(item, dict)}
+        sized = set(self.sized_ids)
+        merged = []
+        for item in self.flowsheet.equipment_list():
+            equipment_id = str(item.get("id"))
+            merged.append(item if equipment_id in sized else by_id.pop(equipment_id, item))
+        merged.extend(item for equipment_id, item in by_id.items() if equipment_id not in sized)
+        return self.flowsheet.with_equipments(merged)
+
+
+def _set_parameter(parameters: List[Dict[str, Any]], name: str, value: Any, unit: str) -> None:
+    for parameter in parameters:
+        if isinstance(parameter, dict) and str(parameter.get("name", "")).lower() == name:
+            parameter["quantity"] = {"value": value, "unit": unit}
+            return
+    parameters.append({"name": name, "quantity": {"value": value, "unit": unit}})
+
+
+def presize_equipment(flowsheet: Flowsheet, rules: Sequence[PresizingRule] = PRESIZING_RULES) -> PresizingReport:
+    """Size equipment whose inputs are fully determined by its category and streams.
+
+    Candidates are collected per rule and each rule's method runs once over
+    all of them (`size_batch`). Successful results fill `sizing_parameters`
+    and add a note. Everything else, including calls the sizing function
+    rejects, is listed in `pending_ids` for the LLM.
+    """
+    streams = {str(stream.get("id")): stream for stream in flowsheet.stream_list()}
+    equipments = copy.deepcopy(flowsheet.equipment_list())
+    report = PresizingReport(flowsheet=flowsheet)
+
+    candidates: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
+    for position, equipment in enumerate(equipments):
+        for rule_index, rule in enumerate(rules):
+            if rule.matches(equipment):
+                arguments = rule.arguments(equipment, streams)
+                if arguments is not None:
+                    candidates.setdefault(rule_index, []).append((position, arguments))
+                break
+
+    sized_positions = set()
+    for rule_index, items in candidates.items():
+        rule = rules[rule_index]
+        results = size_batch(rule.method, [arguments for _, arguments in items])
+        for (position, _), result in zip(items, results):
+            if not result.ok:
+                continue
+            equipment = equipments[position]
+            parameters = equipment.get("sizing_parameters")
+            if not isinstance(parameters, list):
+                parameters = []
+                equipment["sizing_parameters"] = parameters
+            for name, key, unit in rule.outputs:
+                if key in result.values:
+                    _set_parameter(parameters, name, result.values[key], unit)
+            for name, value, unit in rule.constants:
+                _set_parameter(parameters, name, value, unit)
+            note = f"Sized with {rule.method} from connected stream data (rule-based pre-sizing)."
+            equipment["notes"] = f"{equipment['notes']} {note}" if equipment.get("notes") else note
+            sized_positions.add(position)
+
+    for position, equipment in enumerate(equipments):
+        target = report.sized_ids if position in sized_positions else report.pending_ids
+        target.append(str(equipment.get("id")))
+    report.flowsheet = flowsheet.with_equipments(equipments)
+    return report
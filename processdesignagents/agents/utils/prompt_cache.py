@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, SystemMessage
+
+# Models that honour explicit `cache_control` breakpoints when routed through
+# OpenRouter. OpenAI and direct Gemini models cache a stable prefix on their
+# own, so they only need the system prompt to stay byte-identical.
+CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _model_name(llm: Any) -> str:
+    return str(getattr(llm, "model_name", None) or getattr(llm, "model", None) or "")
+
+
+def supports_cache_control(llm: Any) -> bool:
+    """Return True if `llm` accepts `cache_control` markers on message content."""
+    if type(llm).__name__ == "ChatAnthropic":
+        return True
+    base_url = str(getattr(llm, "openai_api_base", None) or "")
+    return "openrouter" in base_url and _model_name(llm).lower().startswith(CACHE_CONTROL_MODEL_PREFIXES)
+
+
+def cacheable_system_message(content: str, llm: Any) -> SystemMessage:
+    """Wrap a static system prompt so the provider can cache it.
+
+    For providers with explicit prompt caching the text becomes a single
+    content block carrying a `cache_control` breakpoint; everything before
+    the breakpoint (tool definitions and the system prompt) is then served
+    from the provider cache on the following tool-loop turns. Other
+    providers get a plain `SystemMessage` with the same text.
+    """
+    if supports_cache_control(llm):
+        return SystemMessage(content=[{"type": "text", "text": content, "cache_control": dict(CACHE_CONTROL)}])
+    return SystemMessage(content=content)
+
+
+@dataclass
+class PromptTokenUsage:
+    """Prompt token counters of one agent (or of the whole run)."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def uncached_tokens(self) -> int:
+        return self.input_tokens - self.cached_tokens
+
+    @property
+    def cached_ratio(self) -> float:
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def add(self, other: "PromptTokenUsage") -> None:
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.cached_tokens += other.cached_tokens
+        self.cache_write_tokens += other.cache_write_tokens
+        self.output_tokens += other.output_tokens
+
+    @classmethod
+    def from_message(cls, message: BaseMessage) -> Optional["PromptTokenUsage"]:
+        """Read `usage_metadata` of an LLM response; None if the provider sent none."""
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return None
+        details = usage.get("input_token_details") or {}
+        return cls(
+            calls=1,
+            input_tokens=int(usage.get("input_tokens") or 0),
+            cached_tokens=int(details.get("cache_read") or 0),
+            cache_write_tokens=int(details.get("cache_creation") or 0),
+            output_tokens=int(usage.get("output_tokens") or 0),
+        )
+
+    def describe(self) -> str:
+        return (
+            f"{self.calls} call(s), prompt tokens {self.input_tokens} "
+            f"(cached {self.cached_tokens}, uncached {self.uncached_tokens}, "
+            f"{self.cached_ratio:.0%} cache hits), output tokens {self.output_tokens}"
+        )
+
+
+class PromptCacheStats:
+    """Per-agent cached vs. uncached prompt token totals for a run."""
+
+    def __init__(self) -> None:
+        self.by_label: Dict[str, PromptTokenUsage] = {}
+
+    def record(self, label: str, message: BaseMessage) -> Optional[PromptTokenUsage]:
+        """Add the usage of one LLM response under `label` and return it."""
+        usage = PromptTokenUsage.from_message(message)
+        if usage is not None:
+            self.by_label.setdefault(label, PromptTokenUsage()).add(usage)
+        return usage
+
+    def record_all(self, label: str, messages: Iterable[BaseMessage]) -> PromptTokenUsage:
+        """Record every AI message in `messages`; return their combined usage."""
+        combined = PromptTokenUsage()
+        for message in messages:
+            if isinstance(message, AIMessage):
+                usage = self.record(label, message)
+                if usage is not None:
+                    combined.add(usage)
+        return combined
+
+    def total(self) -> PromptTokenUsage:
+        total = PromptTokenUsage()
+        for usage in self.by_label.values():
+            total.add(usage)
+        return total
+
+    def summary(self) -> str:
+        if not self.by_label:
+            return "No token usage reported by the provider."
+        lines = [f"- {label}: {usage.describe()}" for label, usage in self.by_label.items()]
+        lines.append(f"- total: {self.total().describe()}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        self.by_label.clear()
+
+
+PROMPT_CACHE_STATS = PromptCacheStats()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+
 
 _FENCE_PATTERN = re.compile(r"^\s*```(?:\w+)?\s*(.*?)\s*```\s*$", re.DOTALL)
 
@@ -22,10 +26,79 @@ def strip_markdown_code_fences(text: str | None) -> str | None:
     return text
 
 
+class PromptRegistry:
+    """Load-once cache of the prompt files in `prompts/`.
+
+    Files are read on first use and kept in memory; the compiled
+    `SystemMessage` for each system prompt is cached too, so building a chat
+    prompt per call only wraps the per-call human content. With `watch=True`
+    (development) a file is re-read when its modification time changes.
+    """
+
+    def __init__(self, prompts_dir: Path, watch: bool = False) -> None:
+        self.prompts_dir = Path(prompts_dir)
+        self.watch = watch
+        self._texts: dict[str, tuple[float, str]] = {}
+        self._system_messages: dict[str, SystemMessage] = {}
+
+    def load(self, file_name: str) -> str:
+        """Return the content of `file_name`, reading the file only once."""
+        cached = self._texts.get(file_name)
+        if cached is not None and not self.watch:
+            return cached[1]
+
+        file_path = self.prompts_dir / file_name
+        try:
+            mtime = file_path.stat().st_mtime
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {file_path}") from None
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            text = f.read()
+        self._texts[file_name] = (mtime, text)
+        return text
+
+    def system_message(self, content: str) -> SystemMessage:
+        """Return a cached `SystemMessage` for a (static) system prompt text."""
+        message = self._system_messages.get(content)
+        if message is None:
+            message = SystemMessage(content=content)
+            self._system_messages[content] = message
+        return message
+
+    def chat_prompt(self, system_content: str, human_content: str) -> ChatPromptTemplate:
+        """Build a chat prompt from literal system and human text.
+
+        Both messages are concrete, so invoking the prompt substitutes
+        nothing and never compiles a template; braces in the content are kept
+        as they are.
+        """
+        return ChatPromptTemplate.from_messages(
+            [self.system_message(system_content), HumanMessage(content=human_content)]
+        )
+
+    def clear(self) -> None:
+        self._texts.clear()
+        self._system_messages.clear()
+
+
+# processdesignagents/agents/utils -> processdesignagents/agents -> processdesignagents -> root
+PROMPTS_DIR = Path(__file__).parent.parent.parent.parent / "prompts"
+PROMPTS = PromptRegistry(
+    PROMPTS_DIR,
+    watch=os.getenv("PROCESS_DESIGN_AGENTS_WATCH_PROMPTS", "").lower() in ("1", "true", "yes"),
+)
+
+
 def load_prompt(file_name: str) -> str:
     """
     Loads a prompt from the 'prompts/' directory in the project root.
 
+    The content is cached by `PROMPTS`; set PROCESS_DESIGN_AGENTS_WATCH_PROMPTS=1
+    to pick up edits to the prompt files without restarting.
+
     Args:
         file_name: The name of the file to load (e.g., 'designer_agent_system.md').
 
@@ -35,18 +108,9 @@ def load_prompt(file_name: str) -> str:
     Raises:
         FileNotFoundError: If the file does not exist.
     """
-    # Assuming the project root is 3 directories up from this file's location:
-    # processdesignagents/agents/utils/prompt_utils.py
-    current_dir = Path(__file__).parent
-    # project_root is calculated relative to this file
-    # processdesignagents/agents/utils -> processdesignagents/agents -> processdesignagents -> root
-    project_root = current_dir.parent.parent.parent
-    prompts_dir = project_root / "prompts"
-
-    file_path = prompts_dir / file_name
+    return PROMPTS.load(file_name)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
+def build_chat_prompt(system_content: str, human_content: str) -> ChatPromptTemplate:
+    """Return a chat prompt for literal system/human text (see `PromptRegistry.chat_prompt`)."""
+    return PROMPTS.chat_prompt(system_content, human_content)
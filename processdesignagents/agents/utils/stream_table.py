@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from processdesignagents.utils.unit_converter.unit_converter.converter import resolve_unit
+
+# Stream keys stored as plain attributes on StreamRecord; anything else goes to `extra`.
+_RECORD_KEYS = ("id", "name", "description", "from", "to", "phase", "notes")
+_MISSING_UNIT = -1
+
+# SI dimension (L, M, T, I, THETA, N, J) of the common stream properties. Other
+# keys take the dimension of their first convertible entry.
+_PROPERTY_DIMENSIONS: Dict[str, Tuple[int, ...]] = {
+    "mass_flow": (0, 1, -1, 0, 0, 0, 0),
+    "molar_flow": (0, 0, -1, 0, 0, 1, 0),
+    "volume_flow": (3, 0, -1, 0, 0, 0, 0),
+    "temperature": (0, 0, 0, 0, 1, 0, 0),
+    "pressure": (-1, 1, -2, 0, 0, 0, 0),
+    "density": (-3, 1, 0, 0, 0, 0, 0),
+    "molecular_weight": (0, 1, 0, 0, 0, -1, 0),
+    "viscosity": (-1, 1, -1, 0, 0, 0, 0),
+}
+_DIMENSIONLESS = (0, 0, 0, 0, 0, 0, 0)
+# Dimensionless unit labels the unit parser does not read
+_DIMENSIONLESS_UNITS = {"": 1.0, "-": 1.0, "fraction": 1.0, "%": 0.01}
+
+
+class StreamRecord:
+    """Non-numeric attributes of one stream (ID, routing, phase, notes)."""
+
+    __slots__ = ("id", "name", "description", "source", "destination", "phase", "notes", "extra", "key_order")
+
+    def __init__(
+        self,
+        id: str,
+        name: Any = None,
+        description: Any = None,
+        source: Any = None,
+        destination: Any = None,
+        phase: Any = None,
+        notes: Any = None,
+        extra: Optional[Dict[str, Any]] = None,
+        key_order: Tuple[str, ...] = (),
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.source = source
+        self.destination = destination
+        self.phase = phase
+        self.notes = notes
+        self.extra = extra
+        self.key_order = key_order
+
+    def __repr__(self) -> str:
+        return f"StreamRecord(id={self.id!r}, source={self.source!r}, destination={self.destination!r})"
+
+
+class StreamTable:
+    """Columnar view of a stream list.
+
+    Scalar properties are float64 NumPy columns in canonical SI units (K, Pa,
+    kg/s, ...), compositions are a dense streams x components matrix and the
+    source units are kept as small integer codes, so large flowsheets fit in a
+    fraction of the memory of nested dicts and vector operations apply
+    directly. Missing values are NaN. `from_streams` / `to_streams` convert
+    losslessly to and from the stream JSON contract. Entries that do not fit
+    the `{"value": number, "unit": str}` shape, whose unit cannot be parsed or
+    whose unit has the wrong dimension for the property are irregular: they
+    are NaN in the columns, kept verbatim for `to_streams` and reported by
+    `irregular_mask`.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[StreamRecord] = []
+        self.index: Dict[str, int] = {}
+        self.units: List[str] = []  # unit code -> unit string
+        self.properties: Dict[str, np.ndarray] = {}
+        self.property_units: Dict[str, np.ndarray] = {}
+        self.component_keys: List[str] = []
+        self.compositions = np.empty((0, 0))
+        self.composition_units = np.empty((0, 0), dtype=np.int16)
+        self._property_keys: List[Tuple[str, ...]] = []  # per stream, in source order
+        self._composition_keys: List[Tuple[str, ...]] = []
+        self._irregular: Dict[Tuple[int, str, str], Any] = {}  # (row, field, key) -> raw entry
+        self._integers: Set[Tuple[int, str, str]] = set()  # cells given as JSON integers
+        self._exact: Dict[Tuple[int, str], Tuple[float, float]] = {}  # (row, key) -> (SI, source value)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ------------------------------------------------------------------ #
+    # Conversion to and from the JSON contract
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_streams(cls, streams: Iterable[Dict[str, Any]]) -> "StreamTable":
+        """Build a table from a list of stream dicts."""
+        table = cls()
+        streams = list(streams)
+        size = len(streams)
+        unit_codes: Dict[str, int] = {}
+
+        def unit_code(unit: str) -> int:
+            if unit not in unit_codes:
+                unit_codes[unit] = len(table.units)
+                table.units.append(unit)
+            return unit_codes[unit]
+
+        dimensions = dict(_PROPERTY_DIMENSIONS)
+        component_columns: Dict[str, int] = {}
+        composition_cells: List[Tuple[int, int, float, int]] = []
+
+        for row, stream in enumerate(streams):
+            stream_id = str(stream.get("id", f"stream-{row + 1}"))
+            extra = {key: value for key, value in stream.items() if key not in _RECORD_KEYS
+                     and key not in ("properties", "compositions")}
+            table.records.append(StreamRecord(
+                id=stream_id,
+                name=stream.get("name"),
+                description=stream.get("description"),
+                source=stream.get("from"),
+                destination=stream.get("to"),
+                phase=stream.get("phase"),
+                notes=stream.get("notes"),
+                extra=extra or None,
+                key_order=tuple(stream.keys()),
+            ))
+            table.index.setdefault(stream_id, row)
+
+            properties = stream.get("properties")
+            property_keys: Tuple[str, ...] = ()
+            if isinstance(properties, dict):
+                property_keys = tuple(properties.keys())
+                for key, entry in properties.items():
+                    value, unit = _split_entry(entry)
+                    factors = _si_factors(unit) if value is not None else None
+                    if factors is None or dimensions.setdefault(key, factors[2]) != factors[2]:
+                        table._irregular[(row, "properties", key)] = entry
+                        continue
+                    if key not in table.properties:
+                        table.properties[key] = np.full(size, np.nan)
+                        table.property_units[key] = np.full(size, _MISSING_UNIT, dtype=np.int16)
+                    if isinstance(value, int):
+                        table._integers.add((row, "properties", key))
+                    coef, offset, _ = factors
+                    si_value = value * coef + offset
+                    if (si_value - offset) / coef != value:
+                        table._exact[(row, key)] = (si_value, value)
+                    table.properties[key][row] = si_value
+                    table.property_units[key][row] = unit_code(unit)
+            elif properties is not None:
+                table._irregular[(row, "properties", "")] = properties
+            table._property_keys.append(property_keys)
+
+            compositions = stream.get("compositions")
+            composition_keys: Tuple[str, ...] = ()
+            if isinstance(compositions, dict):
+                composition_keys = tuple(compositions.keys())
+                for key, entry in compositions.items():
+                    value, unit = _split_entry(entry)
+                    if value is None:
+                        table._irregular[(row, "compositions", key)] = entry
+                        continue
+                    if isinstance(value, int):
+                        table._integers.add((row, "compositions", key))
+                    column = component_columns.setdefault(key, len(component_columns))
+                    composition_cells.append((row, column, value, unit_code(unit)))
+            elif compositions is not None:
+                table._irregular[(row, "compositions", "")] = compositions
+            table._composition_keys.append(composition_keys)
+
+        table.component_keys = list(component_columns)
+        table.compositions = np.full((size, len(component_columns)), np.nan)
+        table.composition_units = np.full((size, len(component_columns)), _MISSING_UNIT, dtype=np.int16)
+        if composition_cells:
+            rows, columns, values, codes = zip(*composition_cells)
+            table.compositions[rows, columns] = values
+            table.composition_units[rows, columns] = codes
+        return table
+
+    def to_streams(self) -> List[Dict[str, Any]]:
+        """Rebuild the list of stream dicts, converting values back to their source units."""
+        component_columns = {key: column for column, key in enumerate(self.component_keys)}
+        streams: List[Dict[str, Any]] = []
+        for row, record in enumerate(self.records):
+            fields = {
+                "id": record.id,
+                "name": record.name,
+                "description": record.description,
+                "from": record.source,
+                "to": record.destination,
+                "phase": record.phase,
+                "notes": record.notes,
+                "properties": self._row_properties(row),
+                "compositions": self._row_compositions(row, component_columns),
+            }
+            if record.extra:
+                fields.update(record.extra)
+            streams.append({key: fields[key] for key in record.key_order})
+        return streams
+
+    def _row_properties(self, row: int) -> Any:
+        if (row, "properties", "") in self._irregular:
+            return self._irregular[(row, "properties", "")]
+        properties: Dict[str, Any] = {}
+        for key in self._property_keys[row]:
+            if (row, "properties", key) in self._irregular:
+                properties[key] = self._irregular[(row, "properties", key)]
+                continue
+            unit = self.units[self.property_units[key][row]]
+            si_value = self.properties[key][row]
+            exact = self._exact.get((row, key))
+            if exact is not None and exact[0] == si_value:
+                value = exact[1]
+            else:
+                coef, offset, _ = _si_factors(unit)
+                value = float((si_value - offset) / coef)
+            if (row, "properties", key) in self._integers:
+                value = int(round(value))
+            properties[key] = {"value": value, "unit": unit}
+        return properties
+
+    def _row_compositions(self, row: int, component_columns: Dict[str, int]) -> Any:
+        if (row, "compositions", "") in self._irregular:
+            return self._irregular[(row, "compositions", "")]
+        compositions: Dict[str, Any] = {}
+        for key in self._composition_keys[row]:
+            if (row, "compositions", key) in self._irregular:
+                compositions[key] = self._irregular[(row, "compositions", key)]
+                continue
+            column = component_columns[key]
+            value = float(self.compositions[row, column])
+            if (row, "compositions", key) in self._integers:
+                value = int(round(value))
+            compositions[key] = {
+                "value": value,
+                "unit": self.units[self.composition_units[row, column]],
+            }
+        return compositions
+
+    # ------------------------------------------------------------------ #
+    # Vector access
+    # ------------------------------------------------------------------ #
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a property column in canonical SI units (NaN where missing)."""
+        if name not in self.properties:
+            return np.full(len(self.records), np.nan)
+        return self.properties[name]
+
+    def irregular_mask(self, name: str) -> np.ndarray:
+        """Return a bool mask of streams whose `name` property is present but has no SI value.
+
+        These are the irregular entries: non-numeric values, units the parser
+        cannot read and units of the wrong dimension.
+        """
+        return np.array([(row, "properties", name) in self._irregular for row in range(len(self.records))],
+                        dtype=bool)
+
+    def fraction_matrix(self, basis: str = "mass") -> Tuple[List[str], np.ndarray]:
+        """Return (component names, streams x components fractions) on a mass or molar basis.
+
+        Mass fractions are the `m_`-prefixed keys or entries whose unit mentions
+        mass/wt; every other entry is taken as a molar fraction.
+        """
+        mass_columns = [
+            column for column, key in enumerate(self.component_keys)
+            if key.startswith("m_") or self._column_has_mass_unit(column)
+        ]
+        if basis == "mass":
+            columns = mass_columns
+        else:
+            columns = [column for column in range(len(self.component_keys)) if column not in mass_columns]
+        names = [_strip_mass_prefix(self.component_keys[column]) if basis == "mass"
+                 else self.component_keys[column] for column in columns]
+        return names, self.compositions[:, columns]
+
+    def _column_has_mass_unit(self, column: int) -> bool:
+        codes = {int(code) for code in self.composition_units[:, column] if code != _MISSING_UNIT}
+        return any("mass" in self.units[code].lower() or "wt" in self.units[code].lower() for code in codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size of the numeric storage in bytes."""
+        return (
+            sum(column.nbytes for column in self.properties.values())
+            + sum(column.nbytes for column in self.property_units.values())
+            + self.compositions.nbytes
+            + self.composition_units.nbytes
+        )
+
+
+_SI_FACTOR_CACHE: Dict[str, Optional[Tuple[float, float, Tuple[int, ...]]]] = {}
+
+
+def _si_factors(unit: str) -> Optional[Tuple[float, float, Tuple[int, ...]]]:
+    """Return (coef, offset, dimension) taking `unit` to SI, or None for units that cannot be parsed."""
+    if unit in _SI_FACTOR_CACHE:
+        return _SI_FACTOR_CACHE[unit]
+    factors: Optional[Tuple[float, float, Tuple[int, ...]]] = None
+    label = unit.strip().lower()
+    if label in _DIMENSIONLESS_UNITS:
+        factors = (_DIMENSIONLESS_UNITS[label], 0.0, _DIMENSIONLESS)
+    else:
+        try:
+            coef, offset, dimension = resolve_unit(unit)
+            factors = (float(coef), float(offset), tuple(dimension))
+        except Exception:
+            factors = None
+        if factors is not None and (factors[0] == 0.0 or not math.isfinite(factors[0])):
+            factors = None
+    _SI_FACTOR_CACHE[unit] = factors
+    return factors
+
+
+def _split_entry(entry: Any) -> Tuple[Optional[float], str]:
+    """Return (value, unit) for regular `{"value": number, "unit": str}` entries, (None, "") otherwise."""
+    if not isinstance(entry, dict) or set(entry) - {"value", "unit"}:
+        return None, ""
+    value = entry.get("value")
+    unit = entry.get("unit")
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not isinstance(unit, str):
+        return None, ""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None, ""
+    if isinstance(value, int) and abs(value) > 2 ** 53:
+        return None, ""
+    return value, unit
+
+
+def _strip_mass_prefix(name: str) -> str:
+    return name[2:] if name.startswith("m_") else name
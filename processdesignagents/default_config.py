@@ -40,6 +40,9 @@ DEFAULT_CONFIG = {
     "data_cache_dir": "./sizing_tools/data_cache",
     "results_dir": "./results",
     "save_dir": "./reports",
+    # Report export: "auto" (pandoc if installed), "pandoc" or "docx" (native python-docx)
+    "word_export_engine": "auto",
+    "word_export_background": True,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
@@ -49,6 +52,8 @@ DEFAULT_CONFIG = {
     "online_tools": True,
     "property_data_source": "pubchem",
     "simulator": "dwsim",
+    # Sizing dispatch output: "verbose" (every step), "summary" (one SIZING: line per call) or "quiet" (failures only)
+    "sizing_log_mode": "summary",
     # Category-level configuration (default for all tools in category)
     "category_level_methods": {
         "heat_exchanger": "preliminary",
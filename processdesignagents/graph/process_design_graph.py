@@ -2,26 +2,15 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-import pypandoc
+from typing import Any, Dict, Iterator, List, Tuple
 
-try:
-    from docx import Document
-except ImportError:  # pragma: no cover - optional dependency
-    Document = None
-
-try:
-    from IPython.display import Image, display
-except ImportError:  # pragma: no cover - optional dependency for notebooks
-    Image = None
-    display = None
-
-from typing import Any, Dict, List, Tuple
-
-from langchain_openai import ChatOpenAI
+# Provider SDKs (langchain_openai, langchain_google_genai), the sizing tools,
+# IPython and the Word export libraries are imported where they are used, so
+# importing this module stays cheap. See docs/ARCHITECTURE.md (Startup).
 # from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from langgraph.prebuilt import ToolNode
 from langgraph.graph import add_messages
@@ -31,20 +20,20 @@ from dotenv import load_dotenv
 from langchain_core.messages import messages_from_dict, messages_to_dict
 
 from processdesignagents.default_config import DEFAULT_CONFIG
-from processdesignagents.agents.utils.agent_sizing_tools import (
-    size_heat_exchanger_basic,
-    size_pump_basic,
-)
 from processdesignagents.agents.utils.equipment_stream_markdown import (
     equipments_and_streams_dict_to_markdown,
 )
+from processdesignagents.agents.utils.flowsheet import Flowsheet, load_flowsheet
+from processdesignagents.agents.utils.prompt_cache import PROMPT_CACHE_STATS
 from processdesignagents.utils.pydantic_utils import (
     EquipmentAndStreamList,
+    cached_json_schema,
 )
 
 from .setup import GraphSetup
 from .propagator import Propagator
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
 load_dotenv()
 
@@ -71,6 +60,7 @@ class ProcessDesignGraph:
         self.response_format = {}
         self.save_graph_image = save_graph_image
         self.graph_image_filename = graph_image_filename
+        self.word_export_future = None  # background Word export job, if any
         
         # Initialize LLMs
         self.deep_thinking_llm = None
@@ -81,11 +71,13 @@ class ProcessDesignGraph:
         # Initialize LLMs by LLM provider.
         # if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
         if self.config["llm_provider"].lower() == "openai":
+            from langchain_openai import ChatOpenAI
+
             base_url = self._get_url_by_name(self.config["llm_provider"].lower())
             api_key = os.getenv("OPENAI_API_KEY")
             
             # Get the JSON schema from the Pydanitc model
-            schema = EquipmentAndStreamList.model_json_schema()
+            schema = cached_json_schema(EquipmentAndStreamList)
             
             # Todo: Create llms with non-structured and structured output
             # model_kwargs={
@@ -93,11 +85,13 @@ class ProcessDesignGraph:
             # }
             
         elif self.config["llm_provider"].lower() == "openrouter":
+            from langchain_openai import ChatOpenAI
+
             base_url = self._get_url_by_name(self.config["llm_provider"].lower())
             api_key = os.getenv("OPENROUTER_API_KEY")
             
             # Get the JSON schema from the Pydanitc model
-            schema = EquipmentAndStreamList.model_json_schema()
+            schema = cached_json_schema(EquipmentAndStreamList)
             
             # Build the exact response_format object OpenRouter expects
             self.response_format = {
@@ -137,10 +131,12 @@ class ProcessDesignGraph:
                     }
             )
         elif self.config["llm_provider"].lower() == "ollama":
+            from langchain_openai import ChatOpenAI
+
             base_url = self._get_url_by_name(self.config["llm_provider"].lower())
             
             # Get the JSON schema from the Pydanitc model
-            schema = EquipmentAndStreamList.model_json_schema()
+            schema = cached_json_schema(EquipmentAndStreamList)
             
             self.deep_thinking_llm = ChatOpenAI(
                 base_url=base_url,
@@ -168,6 +164,8 @@ class ProcessDesignGraph:
         #     self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
         #     self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
         elif self.config["llm_provider"].lower() == "google":
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             
             # 
             self.response_format = {
@@ -190,8 +188,12 @@ class ProcessDesignGraph:
         self.deep_structured_llm.temperature = self.config["deep_think_temperature"]
         self.quick_structured_llm.temperature = self.config["quick_think_temperature"]
         
-        # Initialize checkpointer
-        self.checkpointer = MemorySaver()
+        # Initialize checkpointer (the parsed flowsheet travels in the state)
+        self.checkpointer = MemorySaver(
+            serde=JsonPlusSerializer(
+                allowed_msgpack_modules=[("processdesignagents.agents.utils.flowsheet", "Flowsheet")]
+            )
+        )
         
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -287,6 +289,7 @@ class ProcessDesignGraph:
         agent_outputs = dict(agent_outputs)
         pending_agents = [name for name, _ in self.agent_execution_order if name not in completed_agents]
 
+        PROMPT_CACHE_STATS.reset()
         is_complete = False
         try:
             print(f"\n=========================== Start Line ===========================", flush=True)
@@ -340,6 +343,7 @@ class ProcessDesignGraph:
 
             is_complete = True
             print(f"\n=========================== Finish Line ===========================", flush=True)
+            print(f"DEBUG: Prompt token usage:\n{PROMPT_CACHE_STATS.summary()}", flush=True)
         finally:
             self.graph_setup.concept_selection_provider = previous_provider
             self._save_current_state_log(
@@ -356,16 +360,23 @@ class ProcessDesignGraph:
         # Log state to default location
         self._log_state(current_state)
 
+        # The markdown report is written first and reused as the Word export input.
+        markdown_path = None
         if save_markdown:
-            self._write_markdown_report(current_state, save_markdown)
+            markdown_path = self._write_markdown_report(current_state, save_markdown)
             
         if save_word_doc:
-            self._write_word_report(current_state, save_word_doc)
+            self._write_word_report(current_state, save_word_doc, markdown_path=markdown_path)
         
         return current_state
         
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different equipment using abstract methods."""
+        from processdesignagents.agents.utils.agent_sizing_tools import (
+            size_heat_exchanger_basic,
+            size_pump_basic,
+        )
+
         return {
             "equipment_sizing": ToolNode(
                 [
@@ -402,6 +413,11 @@ class ProcessDesignGraph:
             if self.debug:
                 print(f"Failed to write graph PNG: {exc}", flush=True)
 
+        try:
+            from IPython.display import Image, display
+        except ImportError:  # pragma: no cover - optional dependency for notebooks
+            Image = None
+            display = None
         if Image is not None and display is not None:
             try:
                 display(Image(data=png_bytes))
@@ -415,6 +431,8 @@ class ProcessDesignGraph:
 
     def _make_json_safe(self, value: Any) -> Any:
         """Ensure values are JSON serializable."""
+        if isinstance(value, Flowsheet):
+            return value.to_dict()
         if isinstance(value, dict):
             return {k: self._make_json_safe(v) for k, v in value.items()}
         if isinstance(value, list):
@@ -444,6 +462,12 @@ class ProcessDesignGraph:
                 restored["messages"] = []
         else:
             restored["messages"] = restored.get("messages", [])
+        flowsheet_payload = restored.get("flowsheet")
+        if isinstance(flowsheet_payload, dict):
+            try:
+                restored["flowsheet"] = Flowsheet.from_dict(flowsheet_payload)
+            except ValueError:
+                restored.pop("flowsheet")
         return restored
 
     def _merge_state_updates(self, state: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -600,92 +624,86 @@ class ProcessDesignGraph:
         ) as f:
             json.dump(self.log_state_dict, f, indent=4)
         
-    def _compose_report_sections(self, final_state: Dict[str, Any]) -> list[tuple[str, str]]:
-        raw_equipment_and_streams = final_state.get("equipment_and_stream_results", "")
-        if isinstance(raw_equipment_and_streams, str):
-            raw_equipment_and_streams = json.loads(raw_equipment_and_streams)
-            equipment_and_streams_markdown, _, _ = equipments_and_streams_dict_to_markdown(raw_equipment_and_streams)
-        else:
+    def _iter_report_sections(self, final_state: Dict[str, Any]) -> Iterator[tuple[str, str]]:
+        """Yield (title, markdown) report sections, rendering each one only when it is reached."""
+        yield "Problem Statement", final_state.get("problem_statement", "")
+        yield "Process Requirements", final_state.get("process_requirements", "")
+        yield "Concept Detail", final_state.get("selected_concept_details", "")
+        yield "Design Basis", final_state.get("design_basis", "")
+        yield "Flowsheet Description", final_state.get("flowsheet_description", "")
+        try:
+            flowsheet = load_flowsheet(final_state, "equipment_and_stream_results")
+            equipment_and_streams_markdown, _, _ = equipments_and_streams_dict_to_markdown(flowsheet.to_dict())
+        except ValueError:
             equipment_and_streams_markdown = ""
+        yield "Equipment and Streams List", equipment_and_streams_markdown
+        yield "Safety & Risk Assessment", final_state.get("safety_risk_analyst_report", "")
+        yield "Project Manager Report", final_state.get("project_manager_report", "")
 
-        sections = [
-            ("Problem Statement", final_state.get("problem_statement", "")),
-            ("Process Requirements", final_state.get("process_requirements", "")),
-            ("Concept Detail", final_state.get("selected_concept_details", "")),
-            ("Design Basis", final_state.get("design_basis", "")),
-            ("Flowsheet Description", final_state.get("flowsheet_description", "")),
-            ("Equipment and Streams List", equipment_and_streams_markdown),
-            ("Safety & Risk Assessment", final_state.get("safety_risk_analyst_report", "")),
-            ("Project Manager Report", final_state.get("project_manager_report", "")),
-        ]
-        return sections
-
-    def _write_markdown_report(self, final_state: Dict[str, Any], filename: str) -> None:
-        sections = self._compose_report_sections(final_state)
+    def _compose_report_sections(self, final_state: Dict[str, Any]) -> list[tuple[str, str]]:
+        return list(self._iter_report_sections(final_state))
 
-        output_lines: list[str] = []
-        for title, content in sections:
+    def _iter_report_chunks(self, final_state: Dict[str, Any]) -> Iterator[str]:
+        """Yield the markdown report as text chunks, one section at a time."""
+        first = True
+        for title, content in self._iter_report_sections(final_state):
             if not content:
                 continue
-            output_lines.append(f"# {title}")
-            output_lines.append(content.strip())
-            output_lines.append("")  # Blank line separator
-
-        report_text = "\n".join(output_lines).rstrip() + "\n"
-
+            if not first:
+                yield "\n"  # Blank line separator
+            first = False
+            yield f"# {title}\n"
+            yield content.strip()
+            yield "\n"
+
+    def _write_markdown_report(self, final_state: Dict[str, Any], filename: str) -> Path:
+        """Stream the markdown report to `filename` section by section and return its path."""
         output_path = Path(filename)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(report_text, encoding="utf-8")
-
-    def _write_word_report(self, final_state: Dict[str, Any], filename: str) -> None:
-        if Document is None:
-            raise ImportError(
-                "python-docx is required to export Word reports. Install with `pip install python-docx`."
-            )
-
-        sections = self._compose_report_sections(final_state)
-        document = Document()
+        with output_path.open("w", encoding="utf-8") as handle:
+            for chunk in self._iter_report_chunks(final_state):
+                handle.write(chunk)
+        return output_path
 
-        output_text = ""
-        for title, content in sections:
-            if not content:
-                continue
-            # document.add_heading(title, level=1)
-            # document.add_paragraph(content.strip())
-            output_text += f"# {title}\n{content.strip()}\n\n"
+    def _write_word_report(
+        self,
+        final_state: Dict[str, Any],
+        filename: str,
+        markdown_path: str | Path | None = None,
+    ) -> None:
+        """Export the Word report from a markdown file.
+
+        When the markdown report was already written (`markdown_path`) that
+        file is converted; otherwise the report is first streamed to a
+        temporary markdown file. By default the conversion runs in a
+        background worker (`word_export_background`) and the job is kept in
+        `self.word_export_future`; `word_export_engine` selects pandoc, the
+        native python-docx renderer, or "auto" (pandoc when installed).
+        """
+        from processdesignagents.utils.word_export import export_markdown_to_word, submit_word_export
 
         output_path = Path(filename)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        # document.save(output_path)
-        self._export_markdown_to_word(output_text, output_path)
-
-    def _export_markdown_to_word(self, markdown_string: str, output_filename: str = "report.docx"):
-        """
-        Converts a Markdown string into a formatted Word (.docx) document.
+        remove_markdown = markdown_path is None
+        if markdown_path is None:
+            handle, temp_name = tempfile.mkstemp(suffix=".md", prefix=f"{output_path.stem}_")
+            os.close(handle)
+            markdown_path = self._write_markdown_report(final_state, temp_name)
+
+        reference_doc = Path(f"{self.config.get('save_dir')}/template.docx")
+        export_args = (
+            markdown_path,
+            output_path,
+            reference_doc if reference_doc.is_file() else None,
+            self.config.get("word_export_engine", "auto"),
+            remove_markdown,
+        )
+        if self.config.get("word_export_background", True):
+            self.word_export_future = submit_word_export(*export_args)
+            print(f"DEBUG: Word export to {output_path} is running in the background.", flush=True)
+            return
 
-        Args:
-            markdown_string: The string containing your final markdown text.
-            output_filename: The name of the Word file to create (e.g., "my_document.docx").
-        """
         try:
-            # Use pypandoc to convert the string
-            # 'md' is the source format (Markdown)
-            # 'docx' is the target format (Word)
-            pypandoc.convert_text(
-                markdown_string,
-                'docx',
-                format='md',
-                outputfile=output_filename,
-                extra_args=[
-                    f"--reference-doc={self.config.get('save_dir')}/template.docx",
-                ]
-            )
-            
-            print(f"\nSuccessfully exported Word document to: {os.path.abspath(output_filename)}\n")
-
-        except FileNotFoundError:
-            print("\n--- ERROR ---")
-            print("Pandoc executable not found.")
-            print("Please ensure Pandoc is installed on your system and available in your PATH.")
+            export_markdown_to_word(*export_args)
         except Exception as e:
             print(f"\nAn error occurred during conversion: {e}")
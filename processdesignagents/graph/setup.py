@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 import time
 from functools import wraps
-from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 from langgraph.prebuilt import ToolNode
 
 from processdesignagents.agents.utils.agent_states import DesignState
-from processdesignagents.agents import *
+from processdesignagents import agents
+
+if TYPE_CHECKING:  # provider SDKs load only when a provider is selected
+    from langchain_openai import ChatOpenAI
 
 class GraphSetup:
     """Handle the setup and configuration of the agent graph."""
@@ -54,27 +56,27 @@ class GraphSetup:
         graph = StateGraph(DesignState)
         self.agent_execution_order = []
         
-        process_requirements_analyst = create_process_requiruments_analyst(self.quick_thinking_llm)
-        innovative_researcher = create_innovative_researcher(self.quick_thinking_llm)
-        conservative_researcher = create_conservative_researcher(self.quick_thinking_llm)
-        concept_detailer = create_concept_detailer(
+        process_requirements_analyst = agents.create_process_requiruments_analyst(self.quick_thinking_llm)
+        innovative_researcher = agents.create_innovative_researcher(self.quick_thinking_llm)
+        conservative_researcher = agents.create_conservative_researcher(self.quick_thinking_llm)
+        concept_detailer = agents.create_concept_detailer(
             self.deep_thinking_llm,
             lambda: self.concept_selection_provider,
         )
-        component_list_researcher = create_component_list_researcher(self.quick_thinking_llm)
-        design_basis_analyst = create_design_basis_analyst(self.quick_thinking_llm)
-        flowsheet_design_agent = create_flowsheet_design_agent(self.quick_thinking_llm)
-        equipment_stream_catalog_agent = create_equipment_stream_catalog_agent(self.quick_structured_llm)
-        stream_property_estimation_agent = create_stream_property_estimation_agent(
+        component_list_researcher = agents.create_component_list_researcher(self.quick_thinking_llm)
+        design_basis_analyst = agents.create_design_basis_analyst(self.quick_thinking_llm)
+        flowsheet_design_agent = agents.create_flowsheet_design_agent(self.quick_thinking_llm)
+        equipment_stream_catalog_agent = agents.create_equipment_stream_catalog_agent(self.quick_structured_llm)
+        stream_property_estimation_agent = agents.create_stream_property_estimation_agent(
             llm=self.deep_thinking_llm,
             max_count=self.max_agent_call,
         )
-        equipment_sizing_agent = create_equipment_sizing_agent(
+        equipment_sizing_agent = agents.create_equipment_sizing_agent(
             llm=self.deep_thinking_llm,
             max_count=self.max_agent_call,
         )
-        safety_risk_analyst = create_safety_risk_analyst(self.deep_thinking_llm)
-        project_manager = create_project_manager(self.quick_thinking_llm)
+        safety_risk_analyst = agents.create_safety_risk_analyst(self.deep_thinking_llm)
+        project_manager = agents.create_project_manager(self.quick_thinking_llm)
         
         # Set up all node function by wrapping with delay timer
         # process_requirements_analyst = self._wrap_with_delay(create_process_requiruments_analyst(self.quick_thinking_llm))
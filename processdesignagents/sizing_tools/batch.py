@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from processdesignagents.utils.process_pool import (
+    DEFAULT_MIN_PARALLEL_BATCH,
+    attach_shared_array,
+    map_sharded,
+    run_sharded,
+)
+
+from .config import get_config, set_config
+from .interface import equipment_sizing, get_sizing_route
+from .results import SizingResult
+
+# One call's arguments: a positional tuple/list or a keyword mapping.
+SizingArgs = Union[Sequence[Any], Mapping[str, Any]]
+
+_WORKER_CONFIG: Optional[Dict[str, Any]] = None
+
+
+def _prepare_worker(config: Dict[str, Any]) -> None:
+    """Apply the parent's config snapshot inside a pool worker, with the dispatch output silenced.
+
+    Spawned workers start from DEFAULT_CONFIG, so routes set with
+    `set_config` in the parent must travel with every shard. The snapshot is
+    only applied when it changed since the last shard this process ran.
+    """
+    global _WORKER_CONFIG
+    if config != _WORKER_CONFIG:
+        set_config(config)
+        set_config({"sizing_log_mode": "quiet"})
+        _WORKER_CONFIG = config
+
+
+def _call(method: str, args: SizingArgs) -> SizingResult:
+    if isinstance(args, Mapping):
+        return equipment_sizing(method, **args)
+    return equipment_sizing(method, *args)
+
+
+def _numeric_row(result: SizingResult, fields: Sequence[str]) -> List[float]:
+    row = []
+    for field in fields:
+        value = result.values.get(field)
+        row.append(float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan)
+    return row
+
+
+def _size_results_worker(rows: Sequence[SizingArgs], method: str, config: Dict[str, Any]) -> List[SizingResult]:
+    _prepare_worker(config)
+    return [_call(method, args) for args in rows]
+
+
+def _size_fields_worker(
+    block_name: str,
+    shape,
+    start: int,
+    rows: Sequence[SizingArgs],
+    method: str,
+    fields: Sequence[str],
+    config: Dict[str, Any],
+) -> None:
+    _prepare_worker(config)
+    values = [_numeric_row(_call(method, args), fields) for args in rows]
+    with attach_shared_array(block_name, shape) as out:
+        out[start:start + len(values)] = values
+
+
+def size_batch(
+    method: str,
+    rows: Sequence[SizingArgs],
+    max_workers: Optional[int] = None,
+    min_parallel: int = DEFAULT_MIN_PARALLEL_BATCH,
+) -> List[SizingResult]:
+    """Run one sizing method for many argument sets; returns results in input order.
+
+    Batches of at least `min_parallel` rows are sharded across the process
+    pool (one worker per core by default); smaller ones run in this process.
+    Workers use a snapshot of this process's sizing config.
+    """
+    get_sizing_route(method)  # reject unknown methods before any work is shipped
+    if len(rows) < min_parallel:
+        return [_call(method, args) for args in rows]
+    return map_sharded(_size_results_worker, list(rows), method, get_config(), max_workers=max_workers)
+
+
+def size_batch_fields(
+    method: str,
+    rows: Sequence[SizingArgs],
+    fields: Sequence[str],
+    max_workers: Optional[int] = None,
+    min_parallel: int = DEFAULT_MIN_PARALLEL_BATCH,
+) -> np.ndarray:
+    """Return a (len(rows), len(fields)) array of numeric result fields.
+
+    Meant for sweeps and Monte Carlo studies. Workers write the requested
+    fields straight into a shared-memory array instead of pickling result
+    objects. Failed calls and non-numeric fields are NaN.
+    """
+    get_sizing_route(method)
+    fields = list(fields)
+    if len(rows) < min_parallel:
+        if not len(rows):
+            return np.empty((0, len(fields)))
+        return np.array([_numeric_row(_call(method, args), fields) for args in rows], dtype=float)
+    return run_sharded(
+        _size_fields_worker, list(rows), len(fields), method, fields, get_config(), max_workers=max_workers
+    )
+
+
+def rows_from_columns(**columns: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Turn equal-length keyword columns into keyword rows for `size_batch`."""
+    if not columns:
+        return []
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) != 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}.")
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
@@ -0,0 +1,130 @@
+"""
+Vectorized multistage compressor staging with optimal interstage pressures.
+
+For polytropic stages with intercooling, the total power is smallest when
+every stage has the same discharge temperature. Setting the derivative of
+sum(T_i r_i^s) to zero under the overall pressure-ratio constraint gives
+T_i r_i^s equal for all stages. So each stage count has a closed-form
+optimum, including intercooler pressure drops and a first-stage suction
+temperature that differs from the intercooler outlet. All candidate stage
+counts of all cases are evaluated as one (cases, stage counts, stages)
+array, and the fewest feasible stages are picked per case.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+import numpy as np
+
+from .constants import GAS_CONSTANT_J_KMOL_K
+
+
+def compressor_design(
+    mass_flow_kg_s,
+    inlet_pressure_pa,
+    discharge_pressure_pa,
+    inlet_temperature_k=298.15,
+    molecular_weight=28.97,
+    specific_heat_ratio=1.4,
+    compressibility=1.0,
+    polytropic_efficiency=0.80,
+    max_discharge_temperature_k=423.15,
+    intercooler_outlet_temperature_k=None,
+    intercooler_pressure_drop_fraction=0.02,
+    max_stage_ratio=4.0,
+    max_stages: int = 8,
+) -> Dict[str, np.ndarray]:
+    """Stage a batch of compressors with the fewest stages, at minimum power for that count.
+
+    Candidate stage counts 1..`max_stages` are all evaluated at their
+    optimal interstage pressures. A count is feasible when every stage
+    stays under `max_discharge_temperature_k` and `max_stage_ratio`. The
+    fewest feasible stages are chosen, since each extra stage adds a
+    casing or impeller and an intercooler. Their interstage pressures are
+    the minimum-power split for that count. More stages always need less
+    power, and "power_by_stage_count_kw" gives that trade-off.
+
+    Args:
+        mass_flow_kg_s: Gas mass flow.
+        inlet_pressure_pa, discharge_pressure_pa: Absolute suction and final discharge pressure.
+        inlet_temperature_k: First-stage suction temperature.
+        molecular_weight, specific_heat_ratio, compressibility: Gas properties (averaged over the
+            compression path; see `blowdown.gas_properties`).
+        polytropic_efficiency: Stage polytropic efficiency.
+        max_discharge_temperature_k: Stage discharge temperature limit.
+        intercooler_outlet_temperature_k: Suction temperature of stages 2..N (default: inlet temperature).
+        intercooler_pressure_drop_fraction: Fractional pressure loss across each intercooler.
+        max_stage_ratio: Mechanical limit on the stage pressure ratio.
+        max_stages: Largest stage count considered.
+
+    Returns:
+        Arrays over cases: "number_of_stages" (NaN when no count is
+        feasible), "total_power_kw" and "max_discharge_temperature_k". It
+        also returns (cases, max_stages) arrays padded with NaN:
+        "stage_pressure_ratio", "stage_discharge_pressure_pa",
+        "stage_discharge_temperature_k", "stage_power_kw" and
+        "intercooler_duty_kw" (the cooler after each stage but the last).
+        "power_by_stage_count_kw" gives the power of every candidate count,
+        NaN where it is infeasible.
+    """
+    if intercooler_outlet_temperature_k is None:
+        intercooler_outlet_temperature_k = inlet_temperature_k
+    inputs = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+        mass_flow_kg_s, inlet_pressure_pa, discharge_pressure_pa, inlet_temperature_k, molecular_weight,
+        specific_heat_ratio, compressibility, polytropic_efficiency, max_discharge_temperature_k,
+        intercooler_outlet_temperature_k, intercooler_pressure_drop_fraction, max_stage_ratio,
+    )))
+    (flow, p_in, p_out, t_in, mw, k, z, efficiency, t_limit, t_cool, drop, ratio_limit) = (
+        np.array(value).reshape(-1, 1, 1) for value in inputs
+    )
+
+    counts = np.arange(1, max_stages + 1, dtype=float).reshape(1, -1, 1)
+    stage = np.arange(1, max_stages + 1, dtype=float).reshape(1, 1, -1)
+    in_use = stage <= counts
+    exponent = (k - 1.0) / (k * efficiency)
+    r_specific = GAS_CONSTANT_J_KMOL_K / mw
+
+    # Intercooler losses raise the pressure ratio the stages must deliver
+    effective_ratio = p_out / p_in / (1.0 - drop) ** (counts - 1.0)
+    suction_t = np.where(stage == 1, t_in, t_cool)
+    log_suction_sum = np.sum(np.where(in_use, np.log(suction_t), 0.0), axis=2, keepdims=True)
+    # Equal-discharge-temperature optimum: N ln T_d = s ln R_eff + sum ln T_i
+    discharge_t = np.exp((exponent * np.log(effective_ratio) + log_suction_sum) / counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(in_use, (discharge_t / suction_t) ** (1.0 / exponent), np.nan)
+        head = z * r_specific * suction_t / exponent * (ratio**exponent - 1.0)
+        stage_power = flow * head / efficiency / 1000.0
+    loss = np.where(stage < counts, 1.0 - drop, 1.0)
+    discharge_p = p_in * np.cumprod(np.where(in_use, ratio * loss, 1.0), axis=2) / loss
+    discharge_p = np.where(in_use, discharge_p, np.nan)
+    cp = k * r_specific / (k - 1.0)
+    duty = np.where(stage < counts, flow * cp * (discharge_t - t_cool) / 1000.0, np.nan)
+
+    power = np.nansum(stage_power, axis=2)
+    feasible = (
+        (discharge_t[..., 0] <= t_limit[..., 0])
+        & (np.nanmax(ratio, axis=2) <= ratio_limit[..., 0])
+        & (effective_ratio[..., 0] > 1.0)
+    )
+    candidate_power = np.where(feasible, power, np.nan)
+    any_feasible = feasible.any(axis=1)
+    # First (fewest-stage) feasible count
+    choice = np.argmax(feasible, axis=1)
+    rows = np.arange(len(choice))
+
+    def pick(values):
+        picked = np.broadcast_to(values, ratio.shape[: values.ndim])[rows, choice]
+        return np.where(any_feasible.reshape((-1,) + (1,) * (picked.ndim - 1)), picked, np.nan)
+
+    return {
+        "number_of_stages": pick(counts[..., 0]),
+        "total_power_kw": pick(power),
+        "max_discharge_temperature_k": pick(discharge_t[..., 0]),
+        "stage_pressure_ratio": pick(ratio),
+        "stage_discharge_pressure_pa": pick(discharge_p),
+        "stage_discharge_temperature_k": pick(np.where(in_use, discharge_t, np.nan)),
+        "stage_power_kw": pick(stage_power),
+        "intercooler_duty_kw": pick(duty),
+        "power_by_stage_count_kw": candidate_power,
+    }
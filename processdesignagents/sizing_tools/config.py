@@ -6,6 +6,9 @@ from typing import Dict, Optional
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
 DATA_DIR: Optional[str] = None
+# Bumped by every `set_config` so derived tables (e.g. the sizing dispatch
+# table in `interface.py`) know when to rebuild.
+_config_version = 0
 
 
 def initialize_config():
@@ -18,11 +21,12 @@ def initialize_config():
 
 def set_config(config: Dict):
     """Update the configuration with custom values."""
-    global _config, DATA_DIR
+    global _config, DATA_DIR, _config_version
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
     _config.update(config)
     DATA_DIR = _config["data_dir"]
+    _config_version += 1
 
 
 def get_config() -> Dict:
@@ -32,5 +36,10 @@ def get_config() -> Dict:
     return _config.copy()
 
 
+def get_config_version() -> int:
+    """Return a counter that changes whenever `set_config` is called."""
+    return _config_version
+
+
 # Initialize with default config
 initialize_config()
@@ -0,0 +1,8 @@
+"""
+Physical constants shared by the vectorized sizing engines.
+
+Molecular weights are in kg/kmol throughout, so the gas constant is per
+kmol: rho = P * MW / (Z * R * T) with P in Pa and T in K gives kg/m³.
+"""
+
+GAS_CONSTANT_J_KMOL_K = 8314.462618  # J/(kmol K)
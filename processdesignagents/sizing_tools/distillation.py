@@ -0,0 +1,251 @@
+"""
+Vectorized Fenske-Underwood-Gilliland (FUG) shortcut design of distillation columns.
+
+Every input may be given per column (leading axis = columns) or once for the
+whole batch, so a reflux-ratio or recovery trade study over thousands of
+columns is a handful of NumPy operations.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .constants import GAS_CONSTANT_J_KMOL_K
+
+TROUTON_KJ_KMOL_K = 88.0  # latent heat / normal boiling point, kJ/(kmol K)
+
+
+def underwood_roots(
+    relative_volatility: np.ndarray,
+    feed_composition: np.ndarray,
+    feed_quality: np.ndarray,
+    tol: float = 1e-12,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Solve the Underwood feed equation sum(a_i z_i / (a_i - theta)) = 1 - q.
+
+    The equation has exactly one root between each pair of adjacent
+    volatilities (it rises monotonically from -inf to +inf between poles).
+    All roots of all columns are found together by bracketed Newton: a
+    Newton step that leaves the current bracket is replaced by bisection.
+
+    Args:
+        relative_volatility: (columns, components) volatilities.
+        feed_composition: (columns, components) feed mole fractions, all > 0.
+        feed_quality: (columns,) feed q (1 = saturated liquid, 0 = saturated vapour).
+
+    Returns:
+        (columns, components - 1) roots, the k-th lying between the k-th and
+        (k+1)-th smallest volatility; NaN for intervals of equal volatilities.
+    """
+    alpha = np.asarray(relative_volatility, dtype=float)
+    z = np.asarray(feed_composition, dtype=float)
+    ordered = np.sort(alpha, axis=1)
+    lower, upper = ordered[:, :-1], ordered[:, 1:]
+    valid = upper > lower * (1.0 + 1e-12)
+
+    weights = (alpha * z)[:, None, :]
+    poles = alpha[:, None, :]
+    target = (1.0 - np.asarray(feed_quality, dtype=float))[:, None]
+    theta = 0.5 * (lower + upper)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iter):
+            distance = poles - theta[..., None]
+            value = (weights / distance).sum(axis=-1) - target
+            slope = (weights / distance**2).sum(axis=-1)
+            above = value > 0
+            upper = np.where(above, theta, upper)
+            lower = np.where(above, lower, theta)
+            step = theta - value / slope
+            step = np.where((step > lower) & (step < upper), step, 0.5 * (lower + upper))
+            converged = np.abs(step - theta) <= tol * np.maximum(1.0, np.abs(theta))
+            theta = step
+            if converged[valid].all():
+                break
+    return np.where(valid, theta, np.nan)
+
+
+def gilliland_stages(minimum_stages: np.ndarray, minimum_reflux: np.ndarray, reflux: np.ndarray) -> np.ndarray:
+    """Theoretical stages from the Gilliland correlation (Molokanov form); NaN when R <= Rmin."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = (reflux - minimum_reflux) / (reflux + 1.0)
+        y = 1.0 - np.exp((1.0 + 54.4 * x) / (11.0 + 117.2 * x) * (x - 1.0) / np.sqrt(x))
+        stages = (minimum_stages + y) / (1.0 - y)
+    return np.where(x > 0, stages, np.nan)
+
+
+def fair_flooding_velocity(
+    flow_parameter: np.ndarray,
+    liquid_density_kg_m3: np.ndarray,
+    vapor_density_kg_m3: np.ndarray,
+    surface_tension_mn_m: np.ndarray,
+    tray_spacing_m: np.ndarray,
+) -> np.ndarray:
+    """Sieve-tray flooding velocity in m/s (Fair's chart, Lygeros-Magoulas fit)."""
+    capacity = 0.0105 + 8.127e-4 * (tray_spacing_m * 1000.0) ** 0.755 * np.exp(-1.463 * flow_parameter**0.842)
+    capacity = capacity * (surface_tension_mn_m / 20.0) ** 0.2
+    return capacity * np.sqrt((liquid_density_kg_m3 - vapor_density_kg_m3) / vapor_density_kg_m3)
+
+
+def _broadcast(rows: int, value, components: Optional[int] = None) -> np.ndarray:
+    shape = (rows,) if components is None else (rows, components)
+    return np.broadcast_to(np.asarray(value, dtype=float), shape)
+
+
+def fug_design(
+    relative_volatility,
+    feed_composition,
+    feed_flow_kmol_h,
+    light_key: int,
+    heavy_key: int,
+    light_key_recovery,
+    heavy_key_recovery,
+    feed_quality=1.0,
+    reflux_factor=1.3,
+    pressure_pa=201325.0,
+    top_temperature_k=350.0,
+    vapor_molecular_weight=60.0,
+    liquid_density_kg_m3=750.0,
+    surface_tension_mn_m=20.0,
+    tray_spacing_m=0.6,
+    tray_efficiency=0.7,
+    flood_fraction=0.8,
+    downcomer_area_fraction=0.12,
+    latent_heat_kj_kmol=None,
+) -> Dict[str, np.ndarray]:
+    """Shortcut-design a batch of columns; every output is an array over columns.
+
+    Steps: Fenske minimum stages from the key recoveries, Fenske
+    distribution of the non-key components, Underwood minimum reflux from
+    every root between the key volatilities (the largest value governs),
+    Gilliland stages at `reflux_factor * Rmin`, Kirkbride feed stage, and a
+    top-section diameter sized at `flood_fraction` of the Fair flooding
+    velocity. The vapour density is ideal gas at the top conditions; pass
+    liquid properties from the property engine (e.g. `flash_properties_batch`)
+    where they are known. Duties use `latent_heat_kj_kmol`, or Trouton's rule
+    at the top temperature when it is not given.
+
+    Args:
+        relative_volatility: (components,) or (columns, components) volatilities, any reference.
+        feed_composition: Feed mole fractions, same shape rules; every fraction must be > 0.
+        feed_flow_kmol_h: Feed flow in kmol/h.
+        light_key, heavy_key: Component indices of the keys (shared by the batch).
+        light_key_recovery: Fraction of the light key recovered in the distillate.
+        heavy_key_recovery: Fraction of the heavy key recovered in the bottoms.
+        feed_quality: Feed q.
+        reflux_factor: Operating reflux ratio / minimum reflux ratio.
+        pressure_pa: Column top pressure, absolute Pa.
+        top_temperature_k: Top (condenser) temperature in K.
+        vapor_molecular_weight: Overhead vapour molecular weight in kg/kmol.
+        liquid_density_kg_m3: Reflux liquid density.
+        surface_tension_mn_m: Reflux liquid surface tension in mN/m.
+        tray_spacing_m: Tray spacing.
+        tray_efficiency: Overall tray efficiency (0-1).
+
+    Returns:
+        Arrays keyed by result name (see the end of the function). Columns
+        with infeasible specifications are NaN.
+    """
+    alpha_in = np.asarray(relative_volatility, dtype=float)
+    z_in = np.asarray(feed_composition, dtype=float)
+    components = alpha_in.shape[-1]
+    scalars = [
+        feed_flow_kmol_h, light_key_recovery, heavy_key_recovery, feed_quality, reflux_factor, pressure_pa,
+        top_temperature_k, vapor_molecular_weight, liquid_density_kg_m3, surface_tension_mn_m,
+        tray_spacing_m, tray_efficiency, flood_fraction, downcomer_area_fraction,
+    ]
+    if latent_heat_kj_kmol is not None:
+        scalars.append(latent_heat_kj_kmol)
+    rows = max(
+        [alpha_in.shape[0] if alpha_in.ndim > 1 else 1, z_in.shape[0] if z_in.ndim > 1 else 1]
+        + [np.size(value) for value in scalars]
+    )
+    alpha = _broadcast(rows, alpha_in, components)
+    z = _broadcast(rows, z_in, components)
+    (feed, recovery_lk, recovery_hk, q, factor, pressure, t_top, mw, rho_l, sigma, spacing, efficiency,
+     flood, downcomer) = (_broadcast(rows, value) for value in scalars[:14])
+
+    z = z / z.sum(axis=1, keepdims=True)
+    alpha = alpha / alpha[:, [heavy_key]]
+    feasible = (
+        (alpha[:, light_key] > 1.0)
+        & (z > 0).all(axis=1)
+        & (recovery_lk > 0) & (recovery_lk < 1)
+        & (recovery_hk > 0) & (recovery_hk < 1)
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Fenske minimum stages and non-key distribution (d_i / b_i = a_i^Nmin * d_HK / b_HK)
+        minimum_stages = np.log(
+            recovery_lk / (1 - recovery_lk) * recovery_hk / (1 - recovery_hk)
+        ) / np.log(alpha[:, light_key])
+        split = alpha ** minimum_stages[:, None] * ((1 - recovery_hk) / recovery_hk)[:, None]
+        component_feed = feed[:, None] * z
+        distillate_flows = component_feed * split / (1 + split)
+        distillate = distillate_flows.sum(axis=1)
+        bottoms_flows = component_feed - distillate_flows
+        bottoms = feed - distillate
+        x_distillate = distillate_flows / distillate[:, None]
+        x_bottoms = bottoms_flows / bottoms[:, None]
+
+        # Underwood: each root between the key volatilities gives a bound on Rmin
+        roots = underwood_roots(alpha, z, q)
+        ordered = np.sort(alpha, axis=1)
+        active = (ordered[:, :-1] >= 1.0 - 1e-12) & (ordered[:, 1:] <= alpha[:, [light_key]] + 1e-12)
+        bounds = (
+            (alpha * x_distillate)[:, None, :] / (alpha[:, None, :] - roots[..., None])
+        ).sum(axis=-1) - 1.0
+        bounds = np.where(active & np.isfinite(bounds), bounds, -np.inf)
+        governing = np.argmax(bounds, axis=1)
+        minimum_reflux = np.maximum(np.take_along_axis(bounds, governing[:, None], axis=1)[:, 0], 0.0)
+        theta = np.take_along_axis(roots, governing[:, None], axis=1)[:, 0]
+
+        reflux = factor * minimum_reflux
+        stages = gilliland_stages(minimum_stages, minimum_reflux, reflux)
+        kirkbride = (
+            bottoms / distillate * z[:, heavy_key] / z[:, light_key]
+            * (x_bottoms[:, light_key] / x_distillate[:, heavy_key]) ** 2
+        ) ** 0.206
+        stages_above_feed = stages * kirkbride / (1 + kirkbride)
+        actual_trays = np.ceil((stages - 1.0) / efficiency)  # the reboiler is one theoretical stage
+
+        # Top-section hydraulics
+        vapor = distillate * (reflux + 1.0)
+        boilup = vapor - (1.0 - q) * feed
+        rho_v = pressure * mw / (GAS_CONSTANT_J_KMOL_K * t_top)
+        flow_parameter = reflux / (reflux + 1.0) * np.sqrt(rho_v / rho_l)
+        flooding_velocity = fair_flooding_velocity(flow_parameter, rho_l, rho_v, sigma, spacing)
+        vapor_m3_s = vapor * mw / rho_v / 3600.0
+        area = vapor_m3_s / (flood * flooding_velocity) / (1.0 - downcomer)
+        diameter = np.sqrt(4.0 * area / np.pi)
+
+        latent = _broadcast(rows, latent_heat_kj_kmol) if latent_heat_kj_kmol is not None else TROUTON_KJ_KMOL_K * t_top
+        condenser_duty = vapor * latent / 3600.0
+        reboiler_duty = boilup * latent / 3600.0
+
+    results = {
+        "minimum_stages": minimum_stages,
+        "underwood_theta": theta,
+        "minimum_reflux_ratio": minimum_reflux,
+        "reflux_ratio": reflux,
+        "theoretical_stages": stages,
+        "feed_stage": stages_above_feed + 1.0,
+        "actual_trays": actual_trays,
+        "distillate_kmol_h": distillate,
+        "bottoms_kmol_h": bottoms,
+        "vapor_kmol_h": vapor,
+        "flooding_velocity_m_s": flooding_velocity,
+        "column_diameter_m": diameter,
+        "column_height_m": actual_trays * spacing,
+        "condenser_duty_kw": condenser_duty,
+        "reboiler_duty_kw": reboiler_duty,
+    }
+    # A non-finite diameter means the hydraulics are invalid (e.g. vapour denser than liquid)
+    bad = ~feasible | ~np.isfinite(stages) | (boilup <= 0) | ~np.isfinite(diameter)
+    for name, values in results.items():
+        results[name] = np.where(bad, np.nan, values)
+    results["distillate_composition"] = np.where(bad[:, None], np.nan, x_distillate)
+    results["bottoms_composition"] = np.where(bad[:, None], np.nan, x_bottoms)
+    return results
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
 #Import each methods
 from .preliminary import (
     prelim_basic_heat_exchanger_sizing,
@@ -21,7 +26,8 @@ from .preliminary import (
 )
 
 #Import configuration
-from .config import get_config
+from .config import get_config, get_config_version
+from .results import SizingResult
 
 # Tools organized by equipment category
 SIZING_TOOLS_BY_CATEGORIES = {
@@ -130,18 +136,29 @@ SIZING_TOOL_METHODS = {
     }
 }
 
+# Static method -> category lookup (the category table never changes at runtime)
+METHOD_CATEGORIES = {
+    method: category
+    for category, info in SIZING_TOOLS_BY_CATEGORIES.items()
+    for method in info["tools"]
+}
+
+# "verbose": every dispatch step, "summary": one line per call, "quiet": failures only
+SIZING_LOG_MODES = ("verbose", "summary", "quiet")
+
+
 def get_category_for_method(method: str) -> str:
     """Get the category that contains the specified method."""
-    for category, info in SIZING_TOOLS_BY_CATEGORIES.items():
-        if method in info["tools"]:
-            return category
-    raise ValueError(f"Method '{method}' not found in any category")
+    try:
+        return METHOD_CATEGORIES[method]
+    except KeyError:
+        raise ValueError(f"Method '{method}' not found in any category") from None
 
-def get_vendor(category: str, method: str = None) -> str:
+def get_vendor(category: str, method: str = None, config: Optional[Dict] = None) -> str:
     """Get the configured vendor for a data category or specific tool method.
     Tool-level configuration takes precedence over category-level.
     """
-    config = get_config()
+    config = config if config is not None else get_config()
     
     # Check tool-level configuration first (if method provided)
     if method:
@@ -153,67 +170,160 @@ def get_vendor(category: str, method: str = None) -> str:
     return config.get("category_level_methods", {}).get(category, "default")
 
 
-def equipment_sizing(method: str, *args, **kwargs) -> str:
-    """Route method calls to appropriate sizing implementation with fallback support."""
-    if method not in SIZING_TOOL_METHODS:
-        raise ValueError(f"Method '{method}' not suppored.")
-    else:
-        print(f"DEBUG: Calling method '{method}' with args: {args}, kwargs: {kwargs}", flush=True)
-        
+@dataclass(frozen=True)
+class SizingRoute:
+    """Compiled dispatch entry of one sizing method.
+
+    `vendors` lists (vendor, is_primary, implementations) in the order they
+    are tried: the configured vendors first, then the remaining ones as
+    fallbacks. Configured vendors without an implementation are kept (with
+    no implementations) so they can be reported as unsupported.
+    """
+
+    method: str
+    category: str
+    primary: Tuple[str, ...]
+    vendors: Tuple[Tuple[str, bool, Tuple[Callable, ...]], ...]
+
+    @property
+    def stop_after_first_success(self) -> bool:
+        return len(self.primary) == 1
+
+
+_ROUTES: Dict[str, SizingRoute] = {}
+_ROUTES_VERSION: Optional[int] = None
+_LOG_MODE = "summary"
+
+
+def _compile_route(method: str, config: Dict) -> SizingRoute:
     category = get_category_for_method(method)
-    method_config = get_vendor(category, method)
+    method_config = get_vendor(category, method, config)
+    available = SIZING_TOOL_METHODS[method]
 
-    primary_methods = [value.strip() for value in method_config.split(",") if value.strip()]
-    if not primary_methods:
-        primary_methods = list(SIZING_TOOL_METHODS[method].keys())
+    primary = [value.strip() for value in method_config.split(",") if value.strip()]
+    if not primary:
+        primary = list(available.keys())
+    ordered = primary + [candidate for candidate in available if candidate not in primary]
 
-    available_methods = list(SIZING_TOOL_METHODS[method].keys())
-    fallback_vendors = primary_methods + [
-        candidate for candidate in available_methods if candidate not in primary_methods
-    ]
+    vendors = []
+    for vendor in ordered:
+        impl = available.get(vendor)
+        impls = () if impl is None else tuple(impl) if isinstance(impl, list) else (impl,)
+        vendors.append((vendor, vendor in primary, impls))
+    return SizingRoute(method=method, category=category, primary=tuple(primary), vendors=tuple(vendors))
 
-    primary_str = " → ".join(primary_methods)
-    fallback_str = " → ".join(fallback_vendors)
-    print(f"DEBUG: {method} - Primary: [{primary_str}], Fallback: [{fallback_str}]")
+
+def _refresh_routes() -> None:
+    """Rebuild the dispatch table from the current configuration."""
+    global _ROUTES, _ROUTES_VERSION, _LOG_MODE
+    config = get_config()
+    _ROUTES = {method: _compile_route(method, config) for method in SIZING_TOOL_METHODS}
+    log_mode = config.get("sizing_log_mode", "summary")
+    _LOG_MODE = log_mode if log_mode in SIZING_LOG_MODES else "summary"
+    _ROUTES_VERSION = get_config_version()
+    if _LOG_MODE != "verbose":
+        # Reported per call in verbose mode; once per configuration otherwise.
+        for route in _ROUTES.values():
+            for vendor, is_primary, impls in route.vendors:
+                if is_primary and not impls and vendor != "default":
+                    print(f"INFO: Method '{vendor}' not supported for '{route.method}', using fallback.")
+
+
+def get_sizing_route(method: str) -> SizingRoute:
+    """Return the compiled route for `method`; rebuilt only after `set_config`."""
+    if _ROUTES_VERSION != get_config_version():
+        _refresh_routes()
+    try:
+        return _ROUTES[method]
+    except KeyError:
+        raise ValueError(f"Method '{method}' not suppored.") from None
+
+
+def clear_sizing_dispatch_cache() -> None:
+    """Force the dispatch table to be rebuilt on the next call (e.g. after editing the method tables)."""
+    global _ROUTES_VERSION
+    _ROUTES_VERSION = None
+
+
+def equipment_sizing(method: str, *args, **kwargs) -> SizingResult:
+    """Route method calls to appropriate sizing implementation with fallback support.
+
+    Returns the `SizingResult` of the first implementation that ran; results
+    of further vendors (multi-vendor configs) are attached as
+    `alternatives`. Nothing is serialized here: the LangChain tools in
+    `sizing_tools/tools/` call `to_json()` on the result.
+
+    The route (category, vendor order and implementations) comes from the
+    precompiled dispatch table. The `sizing_log_mode` config key selects the
+    output: "verbose" prints every dispatch step, "summary" a single
+    `SIZING:` line per call and "quiet" only failures.
+    """
+    route = get_sizing_route(method)
+    verbose = _LOG_MODE == "verbose"
+    if verbose:
+        print(f"DEBUG: Calling method '{method}' with args: {args}, kwargs: {kwargs}", flush=True)
+        primary_str = " → ".join(route.primary)
+        fallback_str = " → ".join(vendor for vendor, _, _ in route.vendors)
+        print(f"DEBUG: {method} - Primary: [{primary_str}], Fallback: [{fallback_str}]")
+    start = time.perf_counter()
 
     results = []
+    used_vendors = []
     method_attempt_count = 0
 
-    for vendor_method in fallback_vendors:
-        vendor_impl = SIZING_TOOL_METHODS[method].get(vendor_method)
-        if vendor_impl is None:
-            if vendor_method in primary_methods:
+    for vendor_method, is_primary, impl_functions in route.vendors:
+        if not impl_functions:
+            if is_primary and verbose:
                 print(f"INFO: Method '{vendor_method}' not supported for '{method}', trying fallback.")
             continue
 
         method_attempt_count += 1
-        is_primary = vendor_method in primary_methods
-        method_label = "PRIMARY" if is_primary else "FALLBACK"
-        print(f"DEBUG: Attempting {method_label} method '{vendor_method}' for {method} (attempt #{method_attempt_count})")
-
-        impl_functions = vendor_impl if isinstance(vendor_impl, list) else [vendor_impl]
-        if len(impl_functions) > 1:
-            print(f"DEBUG: Method '{vendor_method}' exposes {len(impl_functions)} implementations")
+        if verbose:
+            method_label = "PRIMARY" if is_primary else "FALLBACK"
+            print(f"DEBUG: Attempting {method_label} method '{vendor_method}' for {method} (attempt #{method_attempt_count})")
+            if len(impl_functions) > 1:
+                print(f"DEBUG: Method '{vendor_method}' exposes {len(impl_functions)} implementations")
 
         vendor_results = []
         for impl_func in impl_functions:
             try:
-                print(f"DEBUG: Calling {impl_func.__name__} via '{vendor_method}'...")
-                vendor_results.append(impl_func(*args, **kwargs))
-                print(f"SUCCESS: {impl_func.__name__} via '{vendor_method}' completed")
+                if verbose:
+                    print(f"DEBUG: Calling {impl_func.__name__} via '{vendor_method}'...")
+                result = SizingResult.coerce(method, impl_func(*args, **kwargs))
+                vendor_results.append(result)
+                if verbose:
+                    print(f"DEBUG: {impl_func.__name__}: {json.dumps(result.values)}", flush=True)
+                    print(f"SUCCESS: {impl_func.__name__} via '{vendor_method}' completed")
             except Exception as exc:
-                print(f"FAILED: {impl_func.__name__} via '{vendor_method}' raised: {exc}")
+                print(f"FAILED: {method} - {impl_func.__name__} via '{vendor_method}' raised: {exc}")
 
         if vendor_results:
             results.extend(vendor_results)
-            print(f"SUCCESS: Collected {len(vendor_results)} result(s) using '{vendor_method}'")
-            if len(primary_methods) == 1:
-                print(f"DEBUG: Stopping after successful method '{vendor_method}' (single-vendor config)")
+            used_vendors.append(vendor_method)
+            if verbose:
+                print(f"SUCCESS: Collected {len(vendor_results)} result(s) using '{vendor_method}'")
+            if route.stop_after_first_success:
+                if verbose:
+                    print(f"DEBUG: Stopping after successful method '{vendor_method}' (single-vendor config)")
                 break
-        else:
+        elif verbose:
             print(f"FAILED: No usable results from method '{vendor_method}'")
 
+    if not results:
+        results.append(SizingResult.failure(method, f"No sizing implementation produced a result for '{method}'."))
+    elif not results[0].ok and _LOG_MODE == "quiet":
+        print(f"FAILED: {method} - {results[0].error}")
+
+    if _LOG_MODE == "summary":
+        status = "ok" if used_vendors and results[0].ok else "error"
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        print(
+            f"SIZING: method={method} category={route.category} vendors={','.join(used_vendors) or '-'} "
+            f"status={status} results={len(results)} ms={elapsed_ms:.2f}",
+            flush=True,
+        )
+
     if len(results) == 1:
         return results[0]
-
-    return "\n".join(str(result) for result in results)
+    primary = results[0]
+    return SizingResult(primary.method, primary.values, alternatives=tuple(results[1:]))
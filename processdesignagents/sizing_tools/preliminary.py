@@ -5,10 +5,21 @@ Provides baseline function signatures for all 14 equipment sizing tools
 
 from __future__ import annotations
 
-import json
 import math
+import re
+
+import numpy as np
 from typing import Dict, List, Any
 
+from .absorption import PACKINGS, henry_to_k_value, kremser_design
+from .blowdown import blowdown_line_nps, gas_properties, size_blowdown_orifice
+from .compressor import compressor_design
+from .constants import GAS_CONSTANT_J_KMOL_K
+from .distillation import fug_design
+from .relief import PIPE_ID_MM, PIPE_NPS, relief_valve_design
+from .results import SizingResult
+from .shell_and_tube import design_shell_and_tube, lmtd_correction_factor
+
 # ============================================================================
 # HEAT TRANSFER EQUIPMENT
 # ============================================================================
@@ -21,9 +32,22 @@ def prelim_basic_heat_exchanger_sizing(
     t_cold_out: float,
     u_estimate: float,
     configuration: str = "1-2",
-) -> str:
+    hot_components: List[str] = None,
+    hot_mole_fractions: List[float] = None,
+    cold_components: List[str] = None,
+    cold_mole_fractions: List[float] = None,
+    hot_pressure_kpa: float = 500.0,
+    cold_pressure_kpa: float = 500.0,
+    hot_side: str = "tube",
+    max_pressure_drop_shell_kpa: float = 70.0,
+    max_pressure_drop_tube_kpa: float = 70.0,
+) -> SizingResult:
     """
     Performs preliminary sizing for a shell-and-tube heat exchanger based on energy balance.
+
+    With both fluid compositions, the exchanger is designed by Bell-Delaware rating of a
+    TEMA geometry grid: U and the pressure drops are calculated, and `u_estimate` and
+    `configuration` are not used. Without them, the area follows from `u_estimate`.
     
     Args:
         duty_kw: Heat duty in kilowatts.
@@ -32,31 +56,37 @@ def prelim_basic_heat_exchanger_sizing(
         t_cold_in: Cold side inlet temperature in °C.
         t_cold_out: Cold side outlet temperature in °C.
         u_estimate: Estimated overall heat transfer coefficient in W/m²-K.
-        configuration: Heat exchanger configuration (e.g., "1-2", "2-4"). Default "1-2".
+        configuration: Heat exchanger configuration "N-2N" (e.g., "1-2", "2-4") or "1-1". Default "1-2".
+        hot_components: Hot fluid component names for the rating. Optional.
+        hot_mole_fractions: Hot fluid mole fractions (required for mixtures). Optional.
+        cold_components: Cold fluid component names for the rating. Optional.
+        cold_mole_fractions: Cold fluid mole fractions (required for mixtures). Optional.
+        hot_pressure_kpa: Hot fluid pressure absolute in kPa. Default 500.0.
+        cold_pressure_kpa: Cold fluid pressure absolute in kPa. Default 500.0.
+        hot_side: Side of the hot fluid, "tube" or "shell". Default "tube".
+        max_pressure_drop_shell_kpa: Allowable shell-side pressure drop in kPa. Default 70.0.
+        max_pressure_drop_tube_kpa: Allowable tube-side pressure drop in kPa. Default 70.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
-             - area_m2: Required heat transfer area in m².
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - area_m2: Required heat transfer area in m² (installed area when rated).
              - lmtd_c: Log-mean temperature difference in °C.
              - u_design_w_m2k: Design overall heat transfer coefficient in W/m²-K.
              - configuration: Selected configuration with correction factor.
-             - pressure_drop_shell_kpa: Estimated shell-side pressure drop in kPa.
-             - pressure_drop_tube_kpa: Estimated tube-side pressure drop in kPa.
+             - pressure_drop_shell_kpa: Shell-side pressure drop in kPa (None without fluid data).
+             - pressure_drop_tube_kpa: Tube-side pressure drop in kPa (None without fluid data).
     """
     
     # --- 1. Validation ---
     if duty_kw <= 0 or u_estimate <= 0:
         results = {"error": "Duty and U-value must be positive numbers."}
-        print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("basic_heat_exchanger_sizing", results)
     if t_hot_in <= t_hot_out:
         results = {"error": "Hot inlet temperature must be greater than hot outlet temperature."}
-        print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("basic_heat_exchanger_sizing", results)
     if t_cold_out <= t_cold_in:
         results = {"error": "Cold outlet temperature must be greater than cold inlet temperature."}
-        print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("basic_heat_exchanger_sizing", results)
 
     # --- 2. Calculate LMTD (Log Mean Temperature Difference) ---
     delta_t1 = t_hot_in - t_cold_out
@@ -68,8 +98,7 @@ def prelim_basic_heat_exchanger_sizing(
             "delta_t1": delta_t1,
             "delta_t2": delta_t2
         }
-        print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("basic_heat_exchanger_sizing", results)
 
     if abs(delta_t1 - delta_t2) < 1e-6:
         lmtd_c = delta_t1
@@ -78,71 +107,112 @@ def prelim_basic_heat_exchanger_sizing(
         
     if lmtd_c <= 0:
          results = {"error": "LMTD is zero or negative, cannot calculate area. Check temperatures."}
-         print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-         return json.dumps(results)
+         return SizingResult("basic_heat_exchanger_sizing", results)
 
-    # --- 3. Calculate LMTD Correction Factor (Ft) ---
-    ft_correction = 1.0
-    ft_note = "Ft=1.0 (pure counter-current) assumed."
+    heat_duty_w = duty_kw * 1000
 
-    if configuration == "1-2":
-        # Calculate Ft for 1 shell pass, 2+ tube passes
-        P = (t_cold_out - t_cold_in) / (t_hot_in - t_cold_in)
-        R = (t_hot_in - t_hot_out) / (t_cold_out - t_cold_in)
-        
-        if not 0 < P < 1:
-            results = {"error": f"Invalid temperature effectiveness (P={round(P, 2)}). Check temperatures."}
-            print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-            return json.dumps(results)
+    # --- 3. Bell-Delaware rating when both fluids are known ---
+    if hot_components and cold_components:
+        if hot_side not in ("tube", "shell"):
+            results = {"error": "hot_side must be 'tube' or 'shell'."}
+            return SizingResult("basic_heat_exchanger_sizing", results)
+        from processdesignagents.agents.designers.tools.property_batch import flash_properties_batch
+
+        fluids = {}
+        for name, components, fractions, t_in, t_out, pressure_kpa in (
+            ("hot", hot_components, hot_mole_fractions, t_hot_in, t_hot_out, hot_pressure_kpa),
+            ("cold", cold_components, cold_mole_fractions, t_cold_in, t_cold_out, cold_pressure_kpa),
+        ):
+            # Inlet, outlet and mean states must share one single phase; properties at the mean
+            try:
+                states = flash_properties_batch(
+                    components, [t_in + 273.15, t_out + 273.15, (t_in + t_out) / 2 + 273.15],
+                    [pressure_kpa * 1000] * 3, fractions,
+                    outputs=("Dmass", "Cpmass", "viscosity", "conductivity", "Phase"),
+                )
+            except ValueError as exc:
+                results = {"error": f"Property flash failed for the {name} fluid {components}: {exc}"}
+                return SizingResult("basic_heat_exchanger_sizing", results)
+            density, cp, viscosity, conductivity, phase = states[2]
+            if not np.isfinite(states).all() or len(set(states[:, 4])) > 1 or phase == 6:
+                results = {"error": f"The {name} fluid changes phase or failed to flash between {t_in} and {t_out} °C; "
+                                    "the rating covers single-phase duties."}
+                return SizingResult("basic_heat_exchanger_sizing", results)
+            fluids[name] = {
+                "mass_flow_kg_s": heat_duty_w / (cp * (max(t_in, t_out) - min(t_in, t_out))),
+                "density_kg_m3": density,
+                "viscosity_pa_s": viscosity,
+                "cp_j_kgk": cp,
+                "conductivity_w_mk": conductivity,
+            }
+        shell_fluid, tube_fluid = (fluids["cold"], fluids["hot"]) if hot_side == "tube" else (fluids["hot"], fluids["cold"])
+        design = design_shell_and_tube(
+            heat_duty_w, t_hot_in, t_hot_out, t_cold_in, t_cold_out, shell_fluid, tube_fluid,
+            max_pressure_drop_shell_kpa * 1000, max_pressure_drop_tube_kpa * 1000,
+        )
+        if math.isnan(design["area_m2"]):
+            results = {"error": "No TEMA geometry up to 4 shells meets the duty within the pressure drop limits."}
+            return SizingResult("basic_heat_exchanger_sizing", results)
 
-        if R == 1:
-            R = 1.00001
-        
-        S = (R**2 + 1)**0.5
-        num_term = (1 - P) / (1 - P * R)
-        den_term_inner = ( (2/P) - 1 - R + S ) / ( (2/P) - 1 - R - S )
-        
-        if num_term <= 0 or den_term_inner <= 0:
-             results = {"error": "Invalid temp profile for Ft calc (log argument). Temp approach is too close."}
-             print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-             return json.dumps(results)
-             
-        num = S * math.log(num_term)
-        den = (R - 1) * math.log(den_term_inner)
-        
-        if den == 0:
-            ft_correction = 1.0
-            ft_note = "Ft calculation resulted in division by zero, using Ft=1.0."
-        else:
-            ft_correction = num / den
-            if ft_correction < 0.75:
-                 ft_note = f"Warning: Ft={round(ft_correction, 3)} is < 0.75. Multiple shells may be needed."
-            else:
-                 ft_note = "Ft calculated for 1-2 S&T."
-    
-    elif configuration.lower() in ["counter-current", "1-1"]:
+        shells = int(design["shells"])
+        passes = int(design["tube_passes"])
+        layout = "triangular (30°)" if design["layout_angle"] == 30 else "square (90°)"
+        results = {
+            "area_m2": round(design["area_m2"], 2),
+            "required_area_m2": round(design["required_area_m2"], 2),
+            "lmtd_c": round(lmtd_c, 2),
+            "ft_correction_factor": round(design["ft"], 3),
+            "corrected_lmtd_c": round(lmtd_c * design["ft"], 2),
+            "u_design_w_m2k": round(design["u_w_m2k"], 1),
+            "configuration": f"{shells}-{shells * passes} (Ft={round(design['ft'], 3)})",
+            "shells_in_series": shells,
+            "tubes_per_shell": int(design["tubes"]),
+            "tube_passes": passes,
+            "tube_od_mm": round(design["tube_od_m"] * 1000, 2),
+            "tube_length_m": design["tube_length_m"],
+            "tube_layout": f"{layout}, pitch {round(design['tube_od_m'] * 1250, 1)} mm",
+            "shell_id_mm": round(design["shell_id_m"] * 1000, 0),
+            "baffle_spacing_mm": round(design["baffle_spacing_m"] * 1000, 0),
+            "number_of_baffles": int(design["baffles"]),
+            "shell_side_h_w_m2k": round(design["shell_h_w_m2k"], 1),
+            "tube_side_h_w_m2k": round(design["tube_h_w_m2k"], 1),
+            "tube_velocity_m_s": round(design["tube_velocity_m_s"], 2),
+            "bell_delaware_factors": {name: round(design[name], 3) for name in ("jc", "jl", "jb", "jr")},
+            "pressure_drop_shell_kpa": round(design["shell_pressure_drop_pa"] / 1000, 2),
+            "pressure_drop_tube_kpa": round(design["tube_pressure_drop_pa"] / 1000, 2),
+            "pressure_drop_note": f"Bell-Delaware shell side, hot fluid on the {hot_side} side; nozzles excluded.",
+        }
+        return SizingResult("basic_heat_exchanger_sizing", results)
+
+    # --- 4. Calculate LMTD Correction Factor (Ft) ---
+    shell_passes, _, tube_passes = configuration.partition("-")
+    if configuration.lower() in ["counter-current", "1-1"]:
         ft_correction = 1.0
         ft_note = "Ft=1.0 (pure counter-current) assumed."
+    elif shell_passes.isdigit() and tube_passes.isdigit() and int(tube_passes) >= 2 * int(shell_passes) > 0:
+        P = (t_cold_out - t_cold_in) / (t_hot_in - t_cold_in)
+        R = (t_hot_in - t_hot_out) / (t_cold_out - t_cold_in)
+        ft_correction = float(lmtd_correction_factor(R, P, int(shell_passes)))
+        if math.isnan(ft_correction):
+            results = {"error": f"No {configuration} exchanger can meet this temperature profile (P={round(P, 2)}, R={round(R, 2)}); add shells."}
+            return SizingResult("basic_heat_exchanger_sizing", results)
+        if ft_correction < 0.75:
+            ft_note = f"Warning: Ft={round(ft_correction, 3)} is < 0.75. Multiple shells may be needed."
+        else:
+            ft_note = f"Ft calculated for {configuration} S&T."
     else:
+        ft_correction = 1.0
         ft_note = f"Configuration '{configuration}' Ft calculation not implemented. Using Ft=1.0."
 
     corrected_lmtd_c = lmtd_c * ft_correction
 
-    # --- 4. Calculate Area ---
-    heat_duty_w = duty_kw * 1000
-    
+    # --- 5. Calculate Area ---
     if corrected_lmtd_c <= 0:
          results = {"error": "Corrected LMTD is zero or negative, cannot calculate area."}
-         print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-         return json.dumps(results)
+         return SizingResult("basic_heat_exchanger_sizing", results)
          
     area_m2 = heat_duty_w / (u_estimate * corrected_lmtd_c)
 
-    # --- 5. Pressure Drop (Placeholder) ---
-    pressure_drop_shell_kpa = -1.0
-    pressure_drop_tube_kpa = -1.0
-    pressure_drop_note = "Not calculated. Requires fluid properties and detailed geometry."
-
     # --- 6. Format Output ---
     results = {
         "area_m2": round(area_m2, 2),
@@ -151,13 +221,13 @@ def prelim_basic_heat_exchanger_sizing(
         "corrected_lmtd_c": round(corrected_lmtd_c, 2),
         "u_design_w_m2k": u_estimate,
         "configuration": f"{configuration} (Ft={round(ft_correction, 3)})",
-        "pressure_drop_shell_kpa": pressure_drop_shell_kpa,
-        "pressure_drop_tube_kpa": pressure_drop_tube_kpa,
-        "pressure_drop_note": pressure_drop_note
+        "ft_note": ft_note,
+        "pressure_drop_shell_kpa": None,
+        "pressure_drop_tube_kpa": None,
+        "pressure_drop_note": "Not calculated. Give hot_components and cold_components for a Bell-Delaware rating."
     }
     
-    print(f"DEBUG: prelim_basic_heat_exchanger_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("basic_heat_exchanger_sizing", results)
 
 
 def prelim_air_cooler_sizing(
@@ -167,7 +237,7 @@ def prelim_air_cooler_sizing(
     ambient_temperature_c: float,
     design_approach: float,
     fluid_type: str = "hydrocarbon",
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for an air-cooled heat exchanger (finned tube cooler).
     
@@ -180,7 +250,7 @@ def prelim_air_cooler_sizing(
         fluid_type: Process fluid type (e.g., "hydrocarbon", "water", "glycol"). Default "hydrocarbon".
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - face_area_m2: Face area of cooler in m².
              - tube_length_m: Tube length in meters.
              - number_of_tubes: Number of finned tubes.
@@ -216,16 +286,13 @@ def prelim_air_cooler_sizing(
     
     if t_hot_in <= t_hot_out:
         results = {"error": "Process inlet temperature must be greater than outlet."}
-        print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("air_cooler_sizing", results)
     if t_cold_out <= t_cold_in:
         results = {"error": f"Air outlet temp ({t_cold_out}°C) is not higher than inlet ({t_cold_in}°C). Check approach."}
-        print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("air_cooler_sizing", results)
     if t_hot_out < t_cold_out:
         results = {"error": f"Process outlet ({t_hot_out}°C) is colder than air outlet ({t_cold_out}°C). Impossible approach."}
-        print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("air_cooler_sizing", results)
 
     delta_t1 = t_hot_in - t_cold_out
     delta_t2 = t_hot_out - t_cold_in
@@ -237,8 +304,7 @@ def prelim_air_cooler_sizing(
 
     if lmtd_c <= 0:
         results = {"error": "LMTD is zero or negative. Check temperatures."}
-        print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("air_cooler_sizing", results)
         
     corrected_lmtd_c = lmtd_c # Assume Ft=1.0 for simplicity
 
@@ -250,8 +316,7 @@ def prelim_air_cooler_sizing(
     air_temp_rise = t_cold_out - t_cold_in
     if air_temp_rise <= 0:
          results = {"error": "Air temperature does not rise. Check inputs."}
-         print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-         return json.dumps(results)
+         return SizingResult("air_cooler_sizing", results)
          
     air_mass_flow_kg_s = heat_duty_w / (AIR_CP_J_KG_K * air_temp_rise)
     air_vol_flow_m3_s = air_mass_flow_kg_s / AIR_DENSITY_KG_M3
@@ -277,8 +342,7 @@ def prelim_air_cooler_sizing(
         "cooling_capacity_kw": duty_kw
     }
     
-    print(f"DEBUG: prelim_air_cooler_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("air_cooler_sizing", results)
 
 
 # ============================================================================
@@ -292,7 +356,7 @@ def prelim_pump_sizing(
     fluid_density_kg_m3: float,
     pump_efficiency: float = 0.75,
     motor_efficiency: float = 0.90,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a pump (centrifugal or positive displacement).
     
@@ -305,7 +369,7 @@ def prelim_pump_sizing(
         motor_efficiency: Motor efficiency (0.0-1.0). Default 0.90.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - volumetric_flow_m3_h: Volumetric flow at inlet in m³/h.
              - total_head_m: Total dynamic head in meters.
              - discharge_pressure_barg: Discharge pressure in barg.
@@ -321,16 +385,13 @@ def prelim_pump_sizing(
     
     if outlet_pressure_barg <= inlet_pressure_barg:
          results = {"error": "Outlet pressure must be greater than inlet pressure."}
-         print(f"DEBUG: prelim_pump_sizing: {json.dumps(results)}", flush=True)
-         return json.dumps(results)
+         return SizingResult("pump_sizing", results)
     if not 0 < pump_efficiency <= 1.0 or not 0 < motor_efficiency <= 1.0:
         results = {"error": "Efficiencies must be between 0.0 and 1.0 (e.g., 0.75 for 75%)."}
-        print(f"DEBUG: prelim_pump_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("pump_sizing", results)
     if mass_flow_kg_h <= 0 or fluid_density_kg_m3 <= 0:
         results = {"error": "Mass flow and density must be positive numbers."}
-        print(f"DEBUG: prelim_pump_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("pump_sizing", results)
 
     # --- 2. Calculate Volumetric Flow ---
     volumetric_flow_m3_h = mass_flow_kg_h / fluid_density_kg_m3
@@ -375,8 +436,7 @@ def prelim_pump_sizing(
         "pump_type": pump_type
     }
     
-    print(f"DEBUG: prelim_pump_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("pump_sizing", results)
 
 
 def prelim_compressor_sizing(
@@ -386,9 +446,21 @@ def prelim_compressor_sizing(
     gas_type: str = "air",
     efficiency_polytropic: float = 0.80,
     intercooling: bool = True,
-) -> str:
+    inlet_temperature_c: float = 25.0,
+    components: List[str] = None,
+    mole_fractions: List[float] = None,
+    max_discharge_temperature_c: float = 150.0,
+    intercooler_outlet_temperature_c: float = None,
+) -> SizingResult:
     """
     Performs preliminary sizing for a compressor based on key process parameters.
+
+    Staging rule: the fewest stages whose discharge temperatures stay under
+    `max_discharge_temperature_c` and whose ratios stay at or below 4 per
+    stage (with intercooling) are used. The interstage pressures of that
+    count minimize power, which gives every stage the same discharge
+    temperature. Gas properties come from CoolProp when `components` is
+    given, otherwise from a table keyed by `gas_type`.
     
     Args:
         inlet_flow_m3_min: Inlet flow rate in m³/min (at inlet conditions, actual).
@@ -397,24 +469,27 @@ def prelim_compressor_sizing(
         gas_type: Gas type (e.g., "air", "nitrogen", "ethylene", "propane", "natural_gas"). Default "air".
         efficiency_polytropic: Polytropic efficiency as decimal (0.0-1.0). Default 0.80.
         intercooling: Whether intercooling between stages is available. Default True.
+        inlet_temperature_c: Suction temperature in °C. Default 25.0.
+        components: Gas component names for real-gas properties. Optional.
+        mole_fractions: Component mole fractions (required for mixtures). Optional.
+        max_discharge_temperature_c: Stage discharge temperature limit in °C. Default 150.0.
+        intercooler_outlet_temperature_c: Gas temperature after each intercooler in °C. Default: inlet temperature.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
-             - number_of_stages: Estimated number of compression stages.
-             - discharge_temperature_c: Final discharge temperature in °C.
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - number_of_stages: Number of compression stages.
+             - discharge_temperature_c: Highest stage discharge temperature in °C.
              - compression_ratio: Overall compression ratio (P_out / P_in).
-             - power_kw: Polytropic power requirement in kW.
+             - power_kw: Polytropic gas power requirement in kW.
              - motor_power_kw: Electric motor rated power with service factor in kW.
              - compressor_type: Recommendation (e.g., "Centrifugal", "Reciprocating", "Screw").
              - stage_compression_ratios: Individual stage compression ratios.
-             - intercooler_duty_kw: Heat removal per intercooler in kW (if applicable).
+             - stage_discharge_pressures_kpa: Individual stage discharge pressures in kPa.
+             - intercooler_duties_kw: Heat removal of each intercooler in kW.
+             - intercooler_duty_kw: Total intercooler heat removal in kW.
     """
 
     # --- 1. Constants and Basic Validation ---
-    INLET_TEMP_C = 25.0
-    INLET_TEMP_K = INLET_TEMP_C + 273.15
-    R_UNIVERSAL = 8314.5  # J/(kmol·K)
-    MAX_RATIO_PER_STAGE = 4.0
     MOTOR_EFFICIENCY_FACTOR = 0.95 # Includes motor eff and gear losses
 
     GAS_PROPERTIES = {
@@ -429,81 +504,64 @@ def prelim_compressor_sizing(
 
     if discharge_pressure_kpa <= inlet_pressure_kpa:
         results = {"error": "Discharge pressure must be greater than inlet pressure."}
-        print(f"DEBUG: prelim_compressor_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("compressor_sizing", results)
     
     if not 0 < efficiency_polytropic <= 1.0:
         results = {"error": "Polytropic efficiency must be a positive decimal <= 1.0."}
-        print(f"DEBUG: prelim_compressor_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("compressor_sizing", results)
 
-    # --- 2. Get Gas Properties ---
-    gas_data = GAS_PROPERTIES.get(gas_type.lower(), GAS_PROPERTIES["default"])
-    k = gas_data["k"]
-    mw = gas_data["mw"]
-    z_avg = gas_data["Z"]
-    r_gas_j_kg_k = R_UNIVERSAL / mw
+    # --- 2. Get Gas Properties (suction/discharge-pressure average for real gases) ---
+    inlet_temp_k = inlet_temperature_c + 273.15
+    inlet_pressure_pa = inlet_pressure_kpa * 1000
+    if components:
+        props = gas_properties(components, mole_fractions, inlet_temp_k,
+                               [inlet_pressure_pa, discharge_pressure_kpa * 1000])
+        k, mw, z_avg = (float(np.mean(props[key])) for key in ("specific_heat_ratio", "molecular_weight",
+                                                                 "compressibility"))
+        if not all(math.isfinite(value) for value in (k, mw, z_avg)):
+            results = {"error": f"Property flash failed for {components} at the compressor conditions."}
+            return SizingResult("compressor_sizing", results)
+    else:
+        gas_data = GAS_PROPERTIES.get(gas_type.lower(), GAS_PROPERTIES["default"])
+        k, mw, z_avg = gas_data["k"], gas_data["mw"], gas_data["Z"]
 
-    # --- 3. Calculate Staging ---
+    # --- 3. Optimize Staging ---
+    density_inlet_kg_m3 = inlet_pressure_pa * mw / (z_avg * GAS_CONSTANT_J_KMOL_K * inlet_temp_k)
+    mass_flow_kg_s = density_inlet_kg_m3 * inlet_flow_m3_min / 60
     total_ratio = discharge_pressure_kpa / inlet_pressure_kpa
-    number_of_stages = 1
-    
-    if intercooling:
-        number_of_stages = int(math.ceil(math.log(total_ratio) / math.log(MAX_RATIO_PER_STAGE)))
-        if number_of_stages == 0:
-            number_of_stages = 1
-
-    ratio_per_stage = total_ratio ** (1 / number_of_stages)
-
-    # --- 4. Calculate Polytropic Head and Discharge Temp ---
-    m = (k - 1) / k
-    n_minus_1_over_n = m / efficiency_polytropic
-    n_over_n_minus_1 = 1 / n_minus_1_over_n
-    
-    discharge_temp_k = INLET_TEMP_K * (ratio_per_stage ** n_minus_1_over_n)
-    discharge_temp_c = discharge_temp_k - 273.15
-
-    if not intercooling:
-        # If no intercooling, the final temp is based on the *total* ratio
-        discharge_temp_k = INLET_TEMP_K * (total_ratio ** n_minus_1_over_n)
-        discharge_temp_c = discharge_temp_k - 273.15
-
-    # --- 5. Calculate Power ---
-    inlet_pressure_pa = inlet_pressure_kpa * 1000
-    density_inlet_kg_m3 = inlet_pressure_pa / (z_avg * r_gas_j_kg_k * INLET_TEMP_K)
-    inlet_flow_m3_s = inlet_flow_m3_min / 60
-    mass_flow_kg_s = density_inlet_kg_m3 * inlet_flow_m3_s
-
-    # Polytropic Head (H_p) per stage in J/kg
-    head_per_stage_j_kg = (
-        z_avg * r_gas_j_kg_k * INLET_TEMP_K * n_over_n_minus_1 *
-        ((ratio_per_stage ** n_minus_1_over_n) - 1)
+    cooled_temp_k = inlet_temp_k if intercooler_outlet_temperature_c is None else intercooler_outlet_temperature_c + 273.15
+    limit_k = max_discharge_temperature_c + 273.15
+
+    design = compressor_design(
+        mass_flow_kg_s,
+        inlet_pressure_pa,
+        discharge_pressure_kpa * 1000,
+        inlet_temp_k,
+        mw,
+        k,
+        z_avg,
+        efficiency_polytropic,
+        # A single casing is limited only by the check below
+        limit_k if intercooling else np.inf,
+        cooled_temp_k,
+        max_stage_ratio=4.0 if intercooling else np.inf,
+        max_stages=8 if intercooling else 1,
     )
-    
-    total_head_j_kg = head_per_stage_j_kg * number_of_stages
-    
-    # If not intercooled, head is calculated on total ratio
-    if not intercooling:
-        total_head_j_kg = (
-            z_avg * r_gas_j_kg_k * INLET_TEMP_K * n_over_n_minus_1 *
-            ((total_ratio ** n_minus_1_over_n) - 1)
-        )
-        
-    power_kw = (mass_flow_kg_s * total_head_j_kg) / 1000
+    if math.isnan(design["number_of_stages"][0]):
+        results = {"error": f"No staging up to 8 stages meets {max_discharge_temperature_c} °C and a ratio of 4 per stage."}
+        return SizingResult("compressor_sizing", results)
+    number_of_stages = int(design["number_of_stages"][0])
+    discharge_temp_k = float(design["max_discharge_temperature_k"][0])
+    if not intercooling and discharge_temp_k > limit_k:
+        results = {"error": f"Single-stage discharge temperature {discharge_temp_k - 273.15:.0f} °C exceeds "
+                            f"{max_discharge_temperature_c} °C; allow intercooling."}
+        return SizingResult("compressor_sizing", results)
+
+    power_kw = float(design["total_power_kw"][0])
     motor_power_kw = power_kw / MOTOR_EFFICIENCY_FACTOR
+    intercooler_duties_kw = [round(float(duty), 2) for duty in design["intercooler_duty_kw"][0, :number_of_stages - 1]]
 
-    # --- 6. Intercooler Duty ---
-    intercooler_duty_kw = 0.0
-    if intercooling and number_of_stages > 1:
-        # Duty = m_dot * Cp * (T_out - T_in)
-        # Cp = k * R_s / (k-1)
-        cp_j_kg_k = k * r_gas_j_kg_k / (k - 1)
-        # Heat to remove per stage (to get back to INLET_TEMP_K)
-        duty_per_stage_w = mass_flow_kg_s * cp_j_kg_k * (discharge_temp_k - INLET_TEMP_K)
-        # Total duty is for (N-1) intercoolers
-        intercooler_duty_kw = (duty_per_stage_w * (number_of_stages - 1)) / 1000
-
-    # --- 7. Determine Compressor Type ---
+    # --- 4. Determine Compressor Type ---
     if inlet_flow_m3_min < 10:
         compressor_type = "Reciprocating"
     elif inlet_flow_m3_min > 150:
@@ -511,20 +569,26 @@ def prelim_compressor_sizing(
     else:
         compressor_type = "Rotary Screw / Centrifugal"
 
-    # --- 8. Format Output ---
+    # --- 5. Format Output ---
     results = {
         "number_of_stages": number_of_stages,
-        "discharge_temperature_c": round(discharge_temp_c, 2),
+        "discharge_temperature_c": round(discharge_temp_k - 273.15, 2),
         "compression_ratio": round(total_ratio, 3),
         "power_kw": round(power_kw, 2),
         "motor_power_kw": round(motor_power_kw, 2),
         "compressor_type": compressor_type,
-        "stage_compression_ratios": [round(ratio_per_stage, 3)] * number_of_stages,
-        "intercooler_duty_kw": round(intercooler_duty_kw, 2)
+        "stage_compression_ratios": [round(float(r), 3) for r in design["stage_pressure_ratio"][0, :number_of_stages]],
+        "stage_discharge_pressures_kpa": [
+            round(float(p) / 1000, 1) for p in design["stage_discharge_pressure_pa"][0, :number_of_stages]
+        ],
+        "intercooler_duties_kw": intercooler_duties_kw,
+        "intercooler_duty_kw": round(float(sum(intercooler_duties_kw)), 2),
+        "specific_heat_ratio": round(k, 4),
+        "molecular_weight": round(mw, 3),
+        "compressibility": round(z_avg, 4),
     }
 
-    print(f"DEBUG: prelim_compressor_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("compressor_sizing", results)
 
 
 # ============================================================================
@@ -540,9 +604,22 @@ def prelim_distillation_column_sizing(
     relative_volatility: float,
     tray_efficiency_percent: float = 70.0,
     design_pressure_barg: float = 1.0,
-) -> str:
+    feed_quality_q: float = 1.0,
+    reflux_ratio_factor: float = 1.3,
+    vapor_molecular_weight_kg_kmol: float = 60.0,
+    liquid_density_kg_m3: float = 750.0,
+    top_temperature_c: float = None,
+    latent_heat_kj_kmol: float = None,
+    operating_pressure_barg: float = None,
+) -> SizingResult:
     """
-    Performs preliminary sizing for a distillation column.
+    Performs preliminary sizing for a binary (or pseudo-binary key) distillation column.
+
+    Fenske-Underwood-Gilliland shortcut from `distillation.fug_design`; the
+    diameter is sized at 80% of the Fair flooding velocity of the top section.
+    The vapour density and flooding velocity use the operating pressure, which
+    defaults to the design pressure. That is conservative for the diameter,
+    because the vapour is denser at the higher design pressure.
     
     Args:
         feed_flow_kmol_h: Feed flow rate in kmol/h.
@@ -553,12 +630,21 @@ def prelim_distillation_column_sizing(
         relative_volatility: Relative volatility of light/heavy key components.
         tray_efficiency_percent: Tray efficiency (Murphree) in percent. Default 70.0.
         design_pressure_barg: Column design pressure in barg. Default 1.0.
+        feed_quality_q: Feed thermal condition q (1.0 = saturated liquid). Default 1.0.
+        reflux_ratio_factor: Operating / minimum reflux ratio. Default 1.3.
+        vapor_molecular_weight_kg_kmol: Overhead vapour molecular weight. Default 60.0.
+        liquid_density_kg_m3: Reflux liquid density in kg/m³. Default 750.0.
+        top_temperature_c: Condenser temperature in °C. Defaults to the feed temperature.
+        latent_heat_kj_kmol: Overhead latent heat in kJ/kmol. Defaults to Trouton's rule.
+        operating_pressure_barg: Top operating pressure in barg. Defaults to the design pressure.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
-             - theoretical_stages: Minimum number of theoretical stages (Fenske).
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - minimum_stages: Minimum number of theoretical stages (Fenske).
+             - theoretical_stages: Theoretical stages at the operating reflux (Gilliland).
              - minimum_reflux_ratio: Minimum reflux ratio (Underwood).
              - operating_reflux_ratio: Recommended operating reflux ratio.
+             - feed_stage: Theoretical feed stage counted from the top (Kirkbride).
              - actual_trays: Actual number of trays accounting for efficiency.
              - column_diameter_mm: Internal column diameter in mm.
              - column_height_m: Column height from first to last tray in meters.
@@ -566,58 +652,73 @@ def prelim_distillation_column_sizing(
              - condenser_duty_kw: Condenser heat duty (cooling) in kW.
              - tray_type: Recommended tray type (e.g., "sieve", "valve", "bubble_cap").
     """
-    
-    try:
-        # --- 1. Fenske Equation for Minimum Stages ---
-        xd = overhead_composition
-        xb = bottoms_composition
-        alpha = relative_volatility
-        term1 = (xd / (1 - xd))
-        term2 = ((1 - xb) / xb)
-        N_min = math.log(term1 * term2) / math.log(alpha)
-        
-        # --- 2. Underwood Equation for Minimum Reflux (assuming q=1, saturated liquid feed) ---
-        xf = feed_composition
-        q = 1.0 
-        # Solve for theta (root of Underwood eq) - not implemented, using shortcut
-        R_min = (1 / (alpha - 1)) * ( (xd / xf) - (alpha * (1-xd) / (1-xf)) )
-        if R_min < 0: R_min = 0.5 # Fallback
-
-        # --- 3. Gilliland Correlation (Heuristic) ---
-        R_op = 1.3 * R_min
-        
-        # Heuristic for actual stages
-        actual_trays_theoretical = 2.5 * N_min 
-        actual_trays = math.ceil(actual_trays_theoretical / (tray_efficiency_percent / 100.0))
-
-        # --- 4. Diameter & Height (Very rough heuristics) ---
-        # Diameter based on feed flow
-        column_diameter_mm = 500 + (feed_flow_kmol_h * 10)
-        # Height based on tray spacing (0.6m)
-        column_height_m = actual_trays * 0.6 
-
-        # --- 5. Duties (Placeholder) ---
-        # Requires latent heat, which is not provided.
-        reboiler_duty_kw = -1.0
-        condenser_duty_kw = -1.0
-        
+    xd, xb, xf = overhead_composition, bottoms_composition, feed_composition
+    if not 0 < xb < xf < xd < 1:
+        results = {"error": "Compositions must satisfy 0 < bottoms < feed < overhead < 1."}
+        return SizingResult("distillation_column_sizing", results)
+    if relative_volatility <= 1.0:
+        results = {"error": "Relative volatility must be greater than 1."}
+        return SizingResult("distillation_column_sizing", results)
+    if feed_flow_kmol_h <= 0 or not 0 < tray_efficiency_percent <= 100:
+        results = {"error": "Feed flow must be positive and tray efficiency between 0 and 100%."}
+        return SizingResult("distillation_column_sizing", results)
+
+    operating_pressure = design_pressure_barg if operating_pressure_barg is None else operating_pressure_barg
+    pressure_pa = (operating_pressure + 1.01325) * 1e5
+    top_temperature = feed_temperature_c if top_temperature_c is None else top_temperature_c
+    if not pressure_pa > 0 or not top_temperature > -273.15:
+        results = {"error": "Operating pressure must be above full vacuum (-1.01325 barg) "
+                            "and the top temperature above absolute zero."}
+        return SizingResult("distillation_column_sizing", results)
+    vapor_density = pressure_pa * vapor_molecular_weight_kg_kmol / (GAS_CONSTANT_J_KMOL_K * (top_temperature + 273.15))
+    if not vapor_molecular_weight_kg_kmol > 0 or not liquid_density_kg_m3 > vapor_density:
         results = {
-            "theoretical_stages": round(N_min, 2),
-            "minimum_reflux_ratio": round(R_min, 2),
-            "operating_reflux_ratio": round(R_op, 2),
-            "actual_trays": actual_trays,
-            "column_diameter_mm": round(column_diameter_mm, 0),
-            "column_height_m": round(column_height_m, 2),
-            "reboiler_duty_kw": reboiler_duty_kw,
-            "condenser_duty_kw": condenser_duty_kw,
-            "tray_type": "Sieve Trays"
+            "error": "Vapour molecular weight must be positive and the liquid density above the vapour density.",
+            "vapor_density_kg_m3": round(vapor_density, 3),
         }
+        return SizingResult("distillation_column_sizing", results)
+
+    # Key recoveries that reproduce the specified product purities
+    distillate_fraction = (xf - xb) / (xd - xb)
+    design = fug_design(
+        [relative_volatility, 1.0],
+        [xf, 1.0 - xf],
+        feed_flow_kmol_h,
+        light_key=0,
+        heavy_key=1,
+        light_key_recovery=distillate_fraction * xd / xf,
+        heavy_key_recovery=(1 - distillate_fraction) * (1 - xb) / (1 - xf),
+        feed_quality=feed_quality_q,
+        reflux_factor=reflux_ratio_factor,
+        pressure_pa=pressure_pa,
+        top_temperature_k=top_temperature + 273.15,
+        vapor_molecular_weight=vapor_molecular_weight_kg_kmol,
+        liquid_density_kg_m3=liquid_density_kg_m3,
+        tray_efficiency=tray_efficiency_percent / 100.0,
+        latent_heat_kj_kmol=latent_heat_kj_kmol,
+    )
+    values = {name: float(column[0]) for name, column in design.items() if column.ndim == 1}
+    if math.isnan(values["theoretical_stages"]):
+        results = {"error": "Specification is infeasible (check reflux factor, feed quality, compositions "
+                            "and physical properties)."}
+        return SizingResult("distillation_column_sizing", results)
 
-    except Exception as e:
-        results = {"error": f"Calculation failed. Check inputs. {str(e)}"}
+    results = {
+        "minimum_stages": round(values["minimum_stages"], 2),
+        "theoretical_stages": round(values["theoretical_stages"], 2),
+        "minimum_reflux_ratio": round(values["minimum_reflux_ratio"], 3),
+        "operating_reflux_ratio": round(values["reflux_ratio"], 3),
+        "feed_stage": math.ceil(values["feed_stage"]),
+        "actual_trays": int(values["actual_trays"]),
+        "column_diameter_mm": round(values["column_diameter_m"] * 1000, 0),
+        "column_height_m": round(values["column_height_m"], 2),
+        "flooding_velocity_m_s": round(values["flooding_velocity_m_s"], 3),
+        "reboiler_duty_kw": round(values["reboiler_duty_kw"], 1),
+        "condenser_duty_kw": round(values["condenser_duty_kw"], 1),
+        "tray_type": "Sieve Trays"
+    }
 
-    print(f"DEBUG: prelim_distillation_column_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("distillation_column_sizing", results)
 
 
 def prelim_absorption_column_sizing(
@@ -627,59 +728,100 @@ def prelim_absorption_column_sizing(
     solvent_type: str = "water",
     henry_constant: float = None,
     design_pressure_barg: float = 1.0,
-) -> str:
+    k_value: float = None,
+    lg_ratio_factor: float = 1.5,
+    temperature_c: float = 40.0,
+    gas_molecular_weight_kg_kmol: float = 29.0,
+    packing: str = "25 mm metal Pall rings",
+) -> SizingResult:
     """
-    Performs preliminary sizing for an absorption column.
+    Performs preliminary sizing for a packed absorption column (Kremser method).
     
     Args:
         gas_flow_kmol_h: Gas inlet flow rate in kmol/h.
         inlet_concentration: Component concentration in inlet gas (mole fraction, 0.0-1.0).
         outlet_concentration: Component concentration in outlet gas (mole fraction, 0.0-1.0).
         solvent_type: Solvent medium (e.g., "water", "MEA", "DEA", "MDEA"). Default "water".
-        henry_constant: Henry's law constant (Pa·m³/mol) or equilibrium data. Optional.
+        henry_constant: Henry's law constant in Pa·m³/mol (p = H·c). Used when k_value is not given.
         design_pressure_barg: Column design pressure in barg. Default 1.0.
+        k_value: Equilibrium slope m (y = m·x) at column conditions; effective value for reactive solvents.
+        lg_ratio_factor: Operating / minimum liquid-to-gas ratio. Default 1.5.
+        temperature_c: Operating temperature in °C. Default 40.0.
+        gas_molecular_weight_kg_kmol: Feed gas molecular weight. Default 29.0.
+        packing: Packing name from `absorption.PACKINGS`. Default "25 mm metal Pall rings".
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
-             - number_of_stages: Number of theoretical stages required.
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - number_of_stages: Number of theoretical stages required (Kremser).
+             - minimum_lg_ratio: Minimum solvent/gas molar ratio (solute-free basis).
+             - operating_lg_ratio: Operating solvent/gas molar ratio.
+             - absorption_factor: Absorption factor A = (L/G) / m.
              - column_diameter_mm: Internal column diameter in mm.
-             - column_height_m: Total packed or tray height in meters.
+             - column_height_m: Total packed height in meters.
              - solvent_circulation_kg_h: Solvent circulation rate in kg/h.
-             - packing_type: Recommended packing type and size.
+             - packing_type: Packing used for the hydraulics.
              - pressure_drop_total_kpa: Total pressure drop across column in kPa.
     """
     
-    # --- 1. Solvent Properties (Heuristic) ---
-    SOLVENT_MW = {"water": 18.015, "mea": 61.08, "dea": 105.14, "mdea": 119.16}
-    mw = SOLVENT_MW.get(solvent_type.lower(), 18.015)
+    # --- 1. Solvent Properties: MW (kg/kmol), density (kg/m³), viscosity (cP) ---
+    SOLVENTS = {
+        "water": (18.015, 997.0, 0.89),
+        "mea": (61.08, 1010.0, 2.0),
+        "dea": (105.14, 1040.0, 3.0),
+        "mdea": (119.16, 1040.0, 4.0),
+    }
+    mw, density, viscosity = SOLVENTS.get(solvent_type.lower(), SOLVENTS["water"])
+    pressure_pa = (design_pressure_barg + 1.01325) * 1e5
+
+    if not 0 < outlet_concentration < inlet_concentration < 1:
+        results = {"error": "Concentrations must satisfy 0 < outlet < inlet < 1."}
+        return SizingResult("absorption_column_sizing", results)
+    if not pressure_pa > 0 or not temperature_c > -273.15 or not gas_molecular_weight_kg_kmol > 0:
+        results = {"error": "Pressure must be above full vacuum (-1.01325 barg), the temperature above absolute "
+                            "zero and the gas molecular weight positive."}
+        return SizingResult("absorption_column_sizing", results)
+    if k_value is None:
+        if henry_constant is None:
+            results = {"error": "Equilibrium data required: provide k_value (y = m·x) or henry_constant (Pa·m³/mol)."}
+            return SizingResult("absorption_column_sizing", results)
+        k_value = float(henry_to_k_value(henry_constant, pressure_pa, density, mw))
+    if packing not in PACKINGS:
+        results = {"error": f"Unknown packing '{packing}'. Choose from: {', '.join(PACKINGS)}."}
+        return SizingResult("absorption_column_sizing", results)
+
+    # --- 2. Kremser stages, solvent rate and packing hydraulics ---
+    design = kremser_design(
+        gas_flow_kmol_h,
+        inlet_concentration,
+        outlet_concentration,
+        k_value,
+        lg_factor=lg_ratio_factor,
+        pressure_pa=pressure_pa,
+        temperature_k=temperature_c + 273.15,
+        gas_molecular_weight=gas_molecular_weight_kg_kmol,
+        solvent_molecular_weight=mw,
+        liquid_density_kg_m3=density,
+        liquid_viscosity_cp=viscosity,
+        packing=packing,
+    )
+    values = {name: float(column[0]) for name, column in design.items()}
+    if math.isnan(values["theoretical_stages"]):
+        results = {"error": "Specification is infeasible (check k_value, L/G factor > 1 and concentrations)."}
+        return SizingResult("absorption_column_sizing", results)
 
-    # --- 2. Sizing (Heuristic) ---
-    # Kremser equation is too complex without equilibrium data. Use heuristics.
-    number_of_stages = 8  # Placeholder
-    
-    # Solvent circulation
-    L_kmol_h = gas_flow_kmol_h * 1.5 # Assume 1.5x Gas flow on molar basis
-    solvent_circulation_kg_h = L_kmol_h * mw
-    
-    # Diameter
-    column_diameter_mm = 400 + (gas_flow_kmol_h * 10)
-    
-    # Height
-    column_height_m = number_of_stages * 2.0 # 2m of packing per stage
-    
-    pressure_drop_total_kpa = 15.0 # Placeholder
-    
     results = {
-        "number_of_stages": number_of_stages,
-        "column_diameter_mm": round(column_diameter_mm, 0),
-        "column_height_m": round(column_height_m, 2),
-        "solvent_circulation_kg_h": round(solvent_circulation_kg_h, 2),
-        "packing_type": "1-inch Ceramic Raschig Rings",
-        "pressure_drop_total_kpa": pressure_drop_total_kpa
+        "number_of_stages": math.ceil(values["theoretical_stages"]),
+        "minimum_lg_ratio": round(values["minimum_lg_ratio"], 4),
+        "operating_lg_ratio": round(values["lg_ratio"], 4),
+        "absorption_factor": round(values["absorption_factor"], 3),
+        "column_diameter_mm": round(values["column_diameter_m"] * 1000, 0),
+        "column_height_m": round(values["packed_height_m"], 2),
+        "solvent_circulation_kg_h": round(values["solvent_kg_h"], 2),
+        "packing_type": packing,
+        "pressure_drop_total_kpa": round(values["pressure_drop_kpa"], 2)
     }
     
-    print(f"DEBUG: prelim_absorption_column_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("absorption_column_sizing", results)
 
 
 def prelim_separator_vessel_sizing(
@@ -691,7 +833,7 @@ def prelim_separator_vessel_sizing(
     residence_time_min: float = 3.0,
     design_pressure_barg: float = 5.0,
     design_temperature_c: float = 40.0,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a two-phase or three-phase separator vessel.
     
@@ -706,7 +848,7 @@ def prelim_separator_vessel_sizing(
         design_temperature_c: Design temperature in °C. Default 40.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - vessel_volume_m3: Required vessel volume in m³.
              - diameter_mm: Vessel diameter in mm.
              - length_mm: Vessel length (or height for vertical) in mm.
@@ -751,8 +893,7 @@ def prelim_separator_vessel_sizing(
     except Exception as e:
         results = {"error": f"Calculation failed. Check inputs. {str(e)}"}
         
-    print(f"DEBUG: prelim_separator_vessel_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("separator_vessel_sizing", results)
 
 
 # ============================================================================
@@ -766,48 +907,119 @@ def prelim_pressure_safety_valve_sizing(
     back_pressure_barg: float,
     fluid_phase: str = "vapor",
     fluid_density_kg_m3: float = None,
-) -> str:
+    molecular_weight: float = None,
+    relieving_temperature_c: float = 40.0,
+    specific_heat_ratio: float = 1.3,
+    compressibility: float = 1.0,
+    overpressure_percent: float = 10.0,
+    liquid_viscosity_cp: float = 1.0,
+) -> SizingResult:
     """
-    Performs preliminary sizing for a pressure safety valve (PSV).
+    Performs preliminary sizing for a pressure safety valve (PSV) per API 520 Part I / API 526.
     
     Args:
         protected_equipment_id: Equipment ID being protected (e.g., "E-101", "R-101").
         required_relief_flow_kg_h: Required relief capacity in kg/h.
         relief_pressure_barg: Relief valve set pressure in barg.
         back_pressure_barg: Downstream backpressure in barg.
-        fluid_phase: Fluid phase being relieved (e.g., "liquid", "vapor", "two-phase"). Default "vapor".
-        fluid_density_kg_m3: Fluid density at relief conditions in kg/m³. Optional.
+        fluid_phase: Fluid phase being relieved ("vapor"/"gas", "steam" or "liquid"). Default "vapor".
+        fluid_density_kg_m3: Fluid density at relief conditions in kg/m³. Required for liquids;
+            gives the molecular weight of a vapor when molecular_weight is not set.
+        molecular_weight: Vapor molecular weight in kg/kmol.
+        relieving_temperature_c: Relieving temperature in °C. Default 40.0.
+        specific_heat_ratio: Vapor Cp/Cv. Default 1.3.
+        compressibility: Vapor compressibility factor Z. Default 1.0.
+        overpressure_percent: Allowable overpressure (10 for process cases, 21 for fire). Default 10.0.
+        liquid_viscosity_cp: Liquid viscosity in cP. Default 1.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - orifice_designation: API 526 letter orifice.
+             - required_orifice_area_mm2: Calculated effective area in mm².
+             - number_of_valves: Valves in parallel (more than one above the T orifice).
+             - flow_regime: "critical", "subcritical", "steam" or "liquid".
              - outlet_nozzle_diameter_mm: Outlet nozzle diameter in mm.
-             - valve_capacity_kg_h: Verified valve capacity in kg/h.
+             - valve_capacity_kg_h: Rated capacity of the selected valve(s) in kg/h.
              - set_pressure_barg: PSV set pressure in barg.
              - cracking_pressure_barg: Valve cracking pressure in barg.
-             - valve_size_class: Valve size classification (e.g., "Size 1", "Size 2").
+             - valve_size_class: Valve size (inlet x orifice x outlet, e.g., 3" x L x 4").
+             - inlet_line_size_in / outlet_line_size_in: Line sizes from the 3% / 10% rules.
              - discharge_requirement: Discharge line sizing recommendation.
     """
-    
-    # API 520 sizing is extremely complex. This is a placeholder.
-    # Heuristic: Find a standard orifice size.
-    # 'J' Orifice Area = 2.853 in^2 = 0.00184 m^2
-    orifice_size = "J Orifice"
-    outlet_nozzle_diameter_mm = 100 # 4"
-    valve_capacity_kg_h = required_relief_flow_kg_h # Assume it's sized correctly
-    cracking_pressure_barg = relief_pressure_barg * 0.98 # Approx
-    valve_size_class = f"3\" x {orifice_size} x 4\"" # Inlet x Orifice x Outlet
+    phase = fluid_phase.lower()
+    if phase in ("two-phase", "two_phase", "mixed"):
+        results = {"error": "Two-phase relief needs the API 520 Annex C (omega) method; size it as a detailed case."}
+        return SizingResult("pressure_safety_valve_sizing", results)
+    if required_relief_flow_kg_h <= 0 or relief_pressure_barg <= 0 or back_pressure_barg >= relief_pressure_barg:
+        results = {"error": "Relief flow and set pressure must be positive and back pressure below set pressure."}
+        return SizingResult("pressure_safety_valve_sizing", results)
+    if phase == "liquid" and not fluid_density_kg_m3:
+        results = {"error": "Liquid relief requires fluid_density_kg_m3."}
+        return SizingResult("pressure_safety_valve_sizing", results)
+    if phase in ("vapor", "vapour", "gas") and molecular_weight is None:
+        if not fluid_density_kg_m3:
+            results = {"error": "Vapor relief requires molecular_weight or fluid_density_kg_m3."}
+            return SizingResult("pressure_safety_valve_sizing", results)
+        relieving_pa = (relief_pressure_barg * (1 + overpressure_percent / 100.0) + 1.01325) * 1e5
+        molecular_weight = (
+            fluid_density_kg_m3 * compressibility * GAS_CONSTANT_J_KMOL_K * (relieving_temperature_c + 273.15)
+            / relieving_pa
+        )
+
+    design = relief_valve_design(
+        required_relief_flow_kg_h,
+        relief_pressure_barg,
+        back_pressure_barg,
+        phase=phase,
+        molecular_weight=molecular_weight or 18.015,
+        relieving_temperature_c=relieving_temperature_c,
+        specific_heat_ratio=specific_heat_ratio,
+        compressibility=compressibility,
+        liquid_density_kg_m3=fluid_density_kg_m3 or 1000.0,
+        liquid_viscosity_cp=liquid_viscosity_cp,
+        overpressure_fraction=overpressure_percent / 100.0,
+    )
+    if not design["orifice"][0]:
+        results = {"error": f"Unsupported fluid phase '{fluid_phase}' or inconsistent relief data."}
+        return SizingResult("pressure_safety_valve_sizing", results)
+    values = {name: column[0] for name, column in design.items()}
+
+    valves = int(values["number_of_valves"])
+    orifice = str(values["orifice"])
+    inlet_nps = float(values["valve_inlet_nps"])
+    outlet_nps = float(values["valve_outlet_nps"])
+    valve_size_class = f"{inlet_nps:g}\" x {orifice} x {outlet_nps:g}\""  # Inlet x Orifice x Outlet
+    if valves > 1:
+        valve_size_class = f"{valves} x {valve_size_class}"
+    if math.isnan(values["outlet_line_nps"]):
+        outlet_line = "larger than 24\""
+        discharge_requirement = "No standard line up to 24 in keeps built-up back pressure within 10% of set; use a balanced valve or review the header."
+    else:
+        outlet_line = f"{values['outlet_line_nps']:g}\""
+        discharge_requirement = (
+            f"{outlet_line} discharge line to flare header or safe location "
+            f"(built-up back pressure {values['built_up_back_pressure_percent_of_set']:.1f}% of set)."
+        )
     
     results = {
-        "outlet_nozzle_diameter_mm": outlet_nozzle_diameter_mm,
-        "valve_capacity_kg_h": valve_capacity_kg_h,
+        "orifice_designation": orifice,
+        "required_orifice_area_mm2": round(float(values["required_area_mm2"]), 1),
+        "orifice_area_mm2": round(float(values["orifice_area_mm2"]), 1),
+        "number_of_valves": valves,
+        "flow_regime": str(values["flow_regime"]),
+        "outlet_nozzle_diameter_mm": round(outlet_nps * 25.4, 0),
+        "valve_capacity_kg_h": round(float(values["rated_capacity_kg_h"]), 1),
         "set_pressure_barg": relief_pressure_barg,
-        "cracking_pressure_barg": round(cracking_pressure_barg, 2),
+        "relieving_pressure_barg": round(float(values["relieving_pressure_barg"]), 2),
+        "cracking_pressure_barg": round(relief_pressure_barg * 0.98, 2),
         "valve_size_class": valve_size_class,
-        "discharge_requirement": "Discharge to flare header or safe location."
+        "inlet_line_size_in": None if math.isnan(values["inlet_line_nps"]) else float(values["inlet_line_nps"]),
+        "outlet_line_size_in": None if math.isnan(values["outlet_line_nps"]) else float(values["outlet_line_nps"]),
+        "inlet_pressure_loss_percent": round(float(values["inlet_loss_percent_of_set"]), 2),
+        "discharge_requirement": discharge_requirement
     }
     
-    print(f"DEBUG: prelim_pressure_safety_valve_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("pressure_safety_valve_sizing", results)
 
 
 def prelim_blowdown_valve_sizing(
@@ -818,59 +1030,130 @@ def prelim_blowdown_valve_sizing(
     final_pressure_barg: float = 0.5,
     fluid_type: str = "hydrocarbon",
     fluid_density_kg_m3: float = None,
-) -> str:
+    molecular_weight: float = None,
+    temperature_c: float = 40.0,
+    specific_heat_ratio: float = None,
+    compressibility: float = 1.0,
+    heat_input_kw: float = 0.0,
+    back_pressure_barg: float = 0.0,
+) -> SizingResult:
     """
     Performs preliminary sizing for a blowdown valve for equipment depressurization.
+
+    The restriction orifice is the smallest that reaches the final pressure in the
+    blowdown time in a dynamic (adiabatic, choked/subcritical flow) simulation.
     
     Args:
         protected_equipment_id: Equipment ID being protected.
-        equipment_volume_m3: Equipment internal volume in m³.
+        equipment_volume_m3: Equipment internal (gas) volume in m³.
         blowdown_time_minutes: Desired depressurization time in minutes.
         initial_pressure_barg: Initial system pressure in barg.
         final_pressure_barg: Final pressure after blowdown in barg. Default 0.5.
-        fluid_type: Fluid type (e.g., "hydrocarbon", "water", "steam", "air"). Default "hydrocarbon".
-        fluid_density_kg_m3: Fluid density in kg/m³. Optional.
+        fluid_type: Gas type (e.g., "hydrocarbon", "air", "nitrogen", "hydrogen", "co2", "steam"). Default "hydrocarbon".
+            Liquids (water, oil, condensate, ...) are rejected: the model only covers gas inventories.
+        fluid_density_kg_m3: Gas density at initial conditions in kg/m³. Optional; sets the molecular weight.
+        molecular_weight: Gas molecular weight in kg/kmol. Optional; overrides the fluid type default.
+            Given or derived from the density, it must not exceed 200 kg/kmol.
+        temperature_c: Initial gas temperature in °C. Default 40.0.
+        specific_heat_ratio: Gas Cp/Cv. Optional; defaults by fluid type.
+        compressibility: Gas compressibility factor Z. Default 1.0.
+        heat_input_kw: Heat input during blowdown in kW (e.g., API 521 fire case). Default 0.0.
+        back_pressure_barg: Flare/vent system back pressure in barg. Default 0.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
-             - required_valve_flow_capacity_kg_h: Required valve flow capacity in kg/h.
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
+             - restriction_orifice_diameter_mm: Required restriction orifice bore in mm.
+             - required_valve_flow_capacity_kg_h: Peak (initial) blowdown flow in kg/h.
              - valve_inlet_diameter_mm: Inlet connection diameter in mm.
              - valve_outlet_diameter_mm: Outlet connection diameter in mm.
              - blowdown_line_diameter_mm: Blowdown discharge line diameter in mm.
+             - minimum_gas_temperature_c: Lowest vessel gas temperature during blowdown in °C.
              - valve_actuation_type: Recommended actuation (e.g., "manual_ball", "solenoid").
              - discharge_time_minutes: Actual depressurization time achievable in minutes.
     """
-    
-    if fluid_density_kg_m3 is None:
-        fluid_density_kg_m3 = 50.0 # Guess for a gas
-        
-    # Heuristic: Avg flow = (Total Mass) / Time
-    total_mass_kg = equipment_volume_m3 * fluid_density_kg_m3
-    blowdown_time_h = blowdown_time_minutes / 60.0
-    
-    if blowdown_time_h == 0:
-         results = {"error": "Blowdown time must be > 0."}
-         print(f"DEBUG: prelim_blowdown_valve_sizing: {json.dumps(results)}", flush=True)
-         return json.dumps(results)
-         
-    required_valve_flow_capacity_kg_h = total_mass_kg / blowdown_time_h
-    
-    # Heuristic sizing
-    valve_inlet_diameter_mm = 50 # 2"
-    valve_outlet_diameter_mm = 80 # 3"
-    blowdown_line_diameter_mm = 100 # 4"
-    
+    # Gas defaults by fluid type: molecular weight (kg/kmol), Cp/Cv
+    GASES = {
+        "hydrocarbon": (20.0, 1.27),
+        "air": (28.96, 1.40),
+        "nitrogen": (28.01, 1.40),
+        "hydrogen": (2.016, 1.41),
+        "co2": (44.01, 1.29),
+        "steam": (18.015, 1.33),
+    }
+    # Words naming a liquid inventory, which the gas blowdown model cannot size
+    LIQUIDS = {"water", "liquid", "oil", "crude", "condensate", "diesel", "gasoline", "naphtha", "kerosene",
+               "glycol", "amine", "brine", "methanol"}
+    # Heaviest molecular weight accepted as a gas; a liquid density gives several hundred
+    MAX_GAS_MW = 200.0
+    fluid = fluid_type.lower()
+    if LIQUIDS.intersection(re.findall(r"[a-z]+", fluid)):
+        results = {"error": f"'{fluid_type}' is a liquid; blowdown sizing covers gas inventories only."}
+        return SizingResult("blowdown_valve_sizing", results)
+    if fluid not in GASES and molecular_weight is None and fluid_density_kg_m3 is None:
+        results = {"error": f"Unknown gas '{fluid_type}'. Use one of {', '.join(GASES)} or give molecular_weight."}
+        return SizingResult("blowdown_valve_sizing", results)
+    if blowdown_time_minutes <= 0 or equipment_volume_m3 <= 0:
+        results = {"error": "Blowdown time and equipment volume must be > 0."}
+        return SizingResult("blowdown_valve_sizing", results)
+    if not back_pressure_barg < final_pressure_barg < initial_pressure_barg:
+        results = {"error": "Pressures must satisfy back pressure < final pressure < initial pressure."}
+        return SizingResult("blowdown_valve_sizing", results)
+
+    default_mw, default_k = GASES.get(fluid, GASES["hydrocarbon"])
+    temperature_k = temperature_c + 273.15
+    initial_pressure_pa = (initial_pressure_barg + 1.01325) * 1e5
+    back_pressure_pa = (back_pressure_barg + 1.01325) * 1e5
+    if molecular_weight is None:
+        molecular_weight = (
+            fluid_density_kg_m3 * compressibility * GAS_CONSTANT_J_KMOL_K * temperature_k / initial_pressure_pa
+            if fluid_density_kg_m3 else default_mw
+        )
+    if not 0 < molecular_weight <= MAX_GAS_MW:
+        results = {
+            "error": f"Molecular weight must be between 0 and {MAX_GAS_MW:g} kg/kmol for a gas; check the "
+                     "density (a liquid density gives several hundred).",
+            "molecular_weight": round(molecular_weight, 1),
+        }
+        return SizingResult("blowdown_valve_sizing", results)
+    k = specific_heat_ratio or default_k
+
+    design = size_blowdown_orifice(
+        equipment_volume_m3,
+        initial_pressure_pa,
+        (final_pressure_barg + 1.01325) * 1e5,
+        blowdown_time_minutes * 60.0,
+        initial_temperature_k=temperature_k,
+        molecular_weight=molecular_weight,
+        specific_heat_ratio=k,
+        compressibility=compressibility,
+        back_pressure_pa=back_pressure_pa,
+        heat_input_kw=heat_input_kw,
+    )
+    values = {name: float(column[0]) for name, column in design.items()}
+    if math.isnan(values["orifice_diameter_mm"]):
+        results = {"error": "No orifice up to 600 mm meets the blowdown time (check heat input and time)."}
+        return SizingResult("blowdown_valve_sizing", results)
+
+    # Valve body: smallest standard size with orifice/pipe diameter ratio <= 0.7; outlet one size larger
+    valve_index = min(int(np.searchsorted(PIPE_ID_MM * 0.7, values["orifice_diameter_mm"])), len(PIPE_NPS) - 2)
+    inlet_nps, outlet_nps = float(PIPE_NPS[valve_index]), float(PIPE_NPS[valve_index + 1])
+    line_nps = float(blowdown_line_nps(values["initial_flow_kg_h"], back_pressure_pa, temperature_k, molecular_weight,
+                                       k, compressibility)[0])
+    line_nps = max(line_nps, outlet_nps) if not math.isnan(line_nps) else line_nps
+
     results = {
-        "required_valve_flow_capacity_kg_h": round(required_valve_flow_capacity_kg_h, 2),
-        "valve_inlet_diameter_mm": valve_inlet_diameter_mm,
-        "valve_outlet_diameter_mm": valve_outlet_diameter_mm,
-        "blowdown_line_diameter_mm": blowdown_line_diameter_mm,
+        "restriction_orifice_diameter_mm": round(values["orifice_diameter_mm"], 1),
+        "required_valve_flow_capacity_kg_h": round(values["initial_flow_kg_h"], 2),
+        "valve_inlet_diameter_mm": round(inlet_nps * 25.4, 0),
+        "valve_outlet_diameter_mm": round(outlet_nps * 25.4, 0),
+        "blowdown_line_diameter_mm": None if math.isnan(line_nps) else round(line_nps * 25.4, 0),
+        "minimum_gas_temperature_c": round(values["minimum_temperature_k"] - 273.15, 1),
+        "released_mass_kg": round(values["released_mass_kg"], 1),
         "valve_actuation_type": "Automated Ball Valve (Fail-Open)",
-        "discharge_time_minutes": blowdown_time_minutes
+        "discharge_time_minutes": round(values["blowdown_time_s"] / 60.0, 2)
     }
     
-    print(f"DEBUG: prelim_blowdown_valve_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("blowdown_valve_sizing", results)
 
 
 def prelim_vent_valve_sizing(
@@ -880,7 +1163,7 @@ def prelim_vent_valve_sizing(
     vapor_density_kg_m3: float,
     equipment_pressure_barg: float,
     vent_line_length_m: float = 5.0,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for an atmospheric vent valve for vapor release.
     
@@ -893,7 +1176,7 @@ def prelim_vent_valve_sizing(
         vent_line_length_m: Length of vent line to discharge point in meters. Default 5.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - vent_valve_diameter_mm: Vent valve outlet diameter in mm.
              - vent_line_diameter_mm: Vapor line diameter in mm.
              - volumetric_flow_m3_h: Volumetric flow through vent in m³/h.
@@ -905,8 +1188,7 @@ def prelim_vent_valve_sizing(
     vapor_flow_kg_h = vapor_flow_kmol_h * (vapor_molecular_weight / 1000.0) # kmol->mol->g->kg
     if vapor_density_kg_m3 == 0:
         results = {"error": "Density cannot be zero."}
-        print(f"DEBUG: prelim_vent_valve_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("vent_valve_sizing", results)
         
     volumetric_flow_m3_h = vapor_flow_kg_h / vapor_density_kg_m3
     volumetric_flow_m3_s = volumetric_flow_m3_h / 3600
@@ -927,8 +1209,7 @@ def prelim_vent_valve_sizing(
         "valve_type": "Conservation Vent (P-V Valve)"
     }
     
-    print(f"DEBUG: prelim_vent_valve_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("vent_valve_sizing", results)
 
 
 # ============================================================================
@@ -942,7 +1223,7 @@ def prelim_storage_tank_sizing(
     design_pressure_barg: float = 0.1,
     design_temperature_c: float = 40.0,
     tank_type: str = "vertical_cylindrical",
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for an atmospheric or low-pressure storage tank.
     
@@ -955,7 +1236,7 @@ def prelim_storage_tank_sizing(
         tank_type: Tank type (e.g., "vertical_cylindrical", "horizontal", "spherical"). Default "vertical_cylindrical".
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - tank_diameter_mm: Tank diameter in mm.
              - tank_height_mm: Tank height in mm.
              - shell_thickness_mm: Shell plate thickness in mm.
@@ -966,8 +1247,7 @@ def prelim_storage_tank_sizing(
     
     if design_capacity_m3 <= 0:
         results = {"error": "Design capacity must be positive."}
-        print(f"DEBUG: prelim_storage_tank_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("storage_tank_sizing", results)
 
     # --- 1. Dimensions ---
     # Assume H/D ratio of 1 for simplicity
@@ -1001,8 +1281,7 @@ def prelim_storage_tank_sizing(
         "nozzle_connections": "1x 12\" Inlet, 1x 12\" Outlet, 1x 4\" Drain, 1x 24\" Manway"
     }
     
-    print(f"DEBUG: prelim_storage_tank_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("storage_tank_sizing", results)
 
 
 def prelim_surge_drum_sizing(
@@ -1012,7 +1291,7 @@ def prelim_surge_drum_sizing(
     surge_time_minutes: float = 10.0,
     operating_pressure_barg: float = 1.0,
     l_d_ratio: float = 3.0,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a surge/buffer drum for process flow stabilization.
     
@@ -1025,7 +1304,7 @@ def prelim_surge_drum_sizing(
         l_d_ratio: Length-to-diameter ratio. Default 3.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - drum_volume_m3: Required drum volume in m³.
              - drum_diameter_mm: Drum diameter in mm.
              - drum_length_mm: Drum length in mm.
@@ -1034,8 +1313,7 @@ def prelim_surge_drum_sizing(
     
     if fluid_density_kg_m3 == 0:
         results = {"error": "Density cannot be zero."}
-        print(f"DEBUG: prelim_surge_drum_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("surge_drum_sizing", results)
         
     # --- 1. Volume ---
     # Size based on the max flow
@@ -1059,8 +1337,7 @@ def prelim_surge_drum_sizing(
         "liquid_level_control": "Guided Wave Radar Level Transmitter (LT) and Level Control Valve (LCV)"
     }
     
-    print(f"DEBUG: prelim_surge_drum_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("surge_drum_sizing", results)
 
 
 # ============================================================================
@@ -1075,7 +1352,7 @@ def prelim_reactor_vessel_sizing(
     heat_removal_kw: float = 0.0,
     design_pressure_barg: float = 5.0,
     design_temperature_c: float = 60.0,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a reactor vessel based on residence time and reaction requirements.
     
@@ -1089,7 +1366,7 @@ def prelim_reactor_vessel_sizing(
         design_temperature_c: Design temperature in °C. Default 60.0.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - reactor_volume_m3: Required reactor volume in m³.
              - reactor_diameter_mm: Reactor diameter in mm.
              - reactor_height_mm: Reactor height in mm.
@@ -1100,8 +1377,7 @@ def prelim_reactor_vessel_sizing(
     
     if mixture_density_kg_m3 == 0:
         results = {"error": "Density cannot be zero."}
-        print(f"DEBUG: prelim_reactor_vessel_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("reactor_vessel_sizing", results)
         
     # --- 1. Volume ---
     vol_flow_m3_h = feed_flow_kg_h / mixture_density_kg_m3
@@ -1133,8 +1409,7 @@ def prelim_reactor_vessel_sizing(
         "baffle_configuration": "4 Baffles, Pitched-Blade Turbine Impeller"
     }
     
-    print(f"DEBUG: prelim_reactor_vessel_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("reactor_vessel_sizing", results)
 
 
 # ============================================================================
@@ -1149,7 +1424,7 @@ def prelim_knockout_drum_sizing(
     residence_time_seconds: float = 180.0,
     vapor_mw: float = 30.0, # g/mol
     liquid_density_kg_m3: float = 800.0,
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a knockout drum for liquid removal from vapor streams.
     
@@ -1163,7 +1438,7 @@ def prelim_knockout_drum_sizing(
         liquid_density_kg_m3: Liquid Density (kg/m3) - Added for volume calc.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - drum_volume_m3: Required drum volume in m³.
              - drum_diameter_mm: Drum diameter in mm.
              - drum_length_mm: Drum length in mm.
@@ -1173,8 +1448,7 @@ def prelim_knockout_drum_sizing(
     
     if liquid_density_kg_m3 == 0:
         results = {"error": "Liquid density cannot be zero."}
-        print(f"DEBUG: prelim_knockout_drum_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("knockout_drum_sizing", results)
 
     # --- 1. Calculate Liquid Volume ---
     total_mass_flow_kg_h = vapor_flow_kmol_h * (vapor_mw / 1000.0) # kmol->mol->g->kg
@@ -1199,8 +1473,7 @@ def prelim_knockout_drum_sizing(
         "mist_eliminator_type": "Wire Mesh Demister Pad"
     }
     
-    print(f"DEBUG: prelim_knockout_drum_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("knockout_drum_sizing", results)
 
 
 def prelim_filter_vessel_sizing(
@@ -1209,7 +1482,7 @@ def prelim_filter_vessel_sizing(
     design_pressure_barg: float = 3.0,
     design_temperature_c: float = 40.0,
     filter_media_permeability_m_s: float = 0.002, # 0.002 m/s = 7.2 m/h (typical)
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a filter vessel for solid-liquid or solid-gas separation.
     
@@ -1221,7 +1494,7 @@ def prelim_filter_vessel_sizing(
         filter_media_permeability_m_s: Filter media permeability or typical face velocity in m/s. Default 0.002.
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - filter_area_m2: Required filter media area in m².
              - vessel_volume_m3: Vessel volume for filter housing in m³.
              - vessel_diameter_mm: Vessel diameter in mm.
@@ -1233,8 +1506,7 @@ def prelim_filter_vessel_sizing(
     fluid_flow_m3_s = fluid_flow_m3_h / 3600.0
     if filter_media_permeability_m_s == 0:
         results = {"error": "Permeability cannot be zero."}
-        print(f"DEBUG: prelim_filter_vessel_sizing: {json.dumps(results)}", flush=True)
-        return json.dumps(results)
+        return SizingResult("filter_vessel_sizing", results)
         
     filter_area_m2 = fluid_flow_m3_s / filter_media_permeability_m_s
     
@@ -1257,8 +1529,7 @@ def prelim_filter_vessel_sizing(
         "replacement_schedule_hours": 720 # Placeholder (e.g., 1 month)
     }
     
-    print(f"DEBUG: prelim_filter_vessel_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("filter_vessel_sizing", results)
 
 
 def prelim_dryer_vessel_sizing(
@@ -1267,7 +1538,7 @@ def prelim_dryer_vessel_sizing(
     outlet_moisture_ppm: float,
     design_pressure_barg: float = 3.0,
     regeneration_type: str = "heated_air",
-) -> str:
+) -> SizingResult:
     """
     Performs preliminary sizing for a gas dryer vessel for moisture removal.
     
@@ -1279,7 +1550,7 @@ def prelim_dryer_vessel_sizing(
         regeneration_type: Regeneration method (e.g., "heated_air", "vacuum", "pressure_swing"). Default "heated_air".
     
     Returns:
-        str: A JSON formatted string with sizing results, including:
+        SizingResult: Sizing results (an "error" entry on invalid input), including:
              - dryer_vessel_volume_m3: Dryer vessel volume in m³.
              - desiccant_volume_m3: Desiccant bed volume in m³.
              - vessel_diameter_mm: Vessel diameter in mm.
@@ -1315,6 +1586,5 @@ def prelim_dryer_vessel_sizing(
         "regeneration_duty_kw": round(regeneration_duty_kw, 2)
     }
     
-    print(f"DEBUG: prelim_dryer_vessel_sizing: {json.dumps(results)}", flush=True)
-    return json.dumps(results, indent=4)
+    return SizingResult("dryer_vessel_sizing", results)
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional, Tuple
+
+
+class SizingResult:
+    """Outcome of one sizing calculation.
+
+    `values` holds the result fields in report order; a failed calculation
+    carries an "error" entry (plus any diagnostic fields) instead. Sizing
+    functions return this object and `to_json` is only called at the
+    LangChain tool boundary, so batch callers never pay for serialization.
+    `alternatives` holds extra results when several vendor implementations
+    ran for one call.
+    """
+
+    __slots__ = ("method", "values", "alternatives")
+
+    def __init__(
+        self,
+        method: str,
+        values: Dict[str, Any],
+        alternatives: Tuple["SizingResult", ...] = (),
+    ) -> None:
+        self.method = method
+        self.values = values
+        self.alternatives = alternatives
+
+    @classmethod
+    def failure(cls, method: str, message: str, **details: Any) -> "SizingResult":
+        return cls(method, {"error": message, **details})
+
+    @classmethod
+    def coerce(cls, method: str, value: Any) -> "SizingResult":
+        """Wrap a legacy implementation's dict or JSON string return value."""
+        if isinstance(value, SizingResult):
+            return value
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                return cls(method, {"result": value})
+        if isinstance(value, dict):
+            return cls(method, value)
+        return cls(method, {"result": value})
+
+    @property
+    def ok(self) -> bool:
+        return "error" not in self.values
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.values.get("error")
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.values)
+
+    def to_json(self) -> str:
+        """Serialize for an LLM tool response (compact for errors, indented otherwise)."""
+        text = json.dumps(self.values, indent=4) if self.ok else json.dumps(self.values)
+        if not self.alternatives:
+            return text
+        return "\n".join([text] + [alternative.to_json() for alternative in self.alternatives])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SizingResult):
+            return NotImplemented
+        return (self.method, self.values, self.alternatives) == (other.method, other.values, other.alternatives)
+
+    def __repr__(self) -> str:
+        return f"SizingResult(method={self.method!r}, values={self.values!r})"
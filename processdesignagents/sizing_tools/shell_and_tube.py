@@ -0,0 +1,315 @@
+"""
+Vectorized Bell-Delaware rating and geometry search for shell-and-tube exchangers.
+
+`rate_shell_and_tube` rates geometries (shells in series, tubes per shell,
+tube size, layout, pitch, passes, baffle spacing) for single-phase duties.
+The shell side uses the Taborek form of the Bell-Delaware method: ideal
+tube-bank j and f factors corrected for baffle cut (Jc), leakage (Jl),
+bundle bypass (Jb) and laminar build-up (Jr). The tube side uses
+Gnielinski/Petukhov. `design_shell_and_tube` rates a whole grid of TEMA
+geometries in one call and keeps the smallest area that meets the duty and
+both pressure-drop limits. Baffles are equally spaced (Js = Rs = 1), there
+are no sealing strips, and nozzle losses are ignored.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping
+
+import numpy as np
+
+# BWG 14 tubes: outside diameter and wall thickness in m
+TUBE_SIZES = ((0.01905, 0.00211), (0.0254, 0.00277))
+TUBE_LENGTHS_M = (2.44, 3.66, 4.88, 6.10)
+TUBE_PASSES = (1, 2, 4, 6)
+# Central baffle spacing as a fraction of the shell diameter (TEMA: 0.2 to 1.0)
+BAFFLE_SPACING_RATIOS = (0.2, 0.3, 0.45, 0.6, 1.0)
+LAYOUT_ANGLES = (30, 90)
+PITCH_RATIO = 1.25
+BAFFLE_CUT = 0.25
+TUBE_BAFFLE_CLEARANCE_M = 0.0008
+_FLUID_KEYS = ("mass_flow_kg_s", "density_kg_m3", "viscosity_pa_s", "cp_j_kgk", "conductivity_w_mk")
+
+# Bundle diameter D_b = d_o (N_t / K1)^(1/n1) by layout and tube passes (Sinnott, Table 12.4)
+BUNDLE_CONSTANTS = {
+    30: {1: (0.319, 2.142), 2: (0.249, 2.207), 4: (0.175, 2.285), 6: (0.0743, 2.499)},
+    90: {1: (0.215, 2.207), 2: (0.156, 2.291), 4: (0.158, 2.263), 6: (0.0402, 2.617)},
+}
+
+# Taborek ideal tube-bank coefficients: Reynolds lower bounds and (a1, a2, b1, b2) per band, then (a3, a4, b3, b4)
+_TABOREK_BANDS = (1e4, 1e3, 1e2, 1e1, 0.0)
+_TABOREK = {
+    30: (
+        ((0.321, -0.388, 0.372, -0.123), (0.321, -0.388, 0.486, -0.152), (0.593, -0.477, 4.570, -0.476),
+         (1.360, -0.657, 45.100, -0.973), (1.400, -0.667, 48.000, -1.000)),
+        (1.450, 0.519, 7.00, 0.500),
+    ),
+    90: (
+        ((0.370, -0.396, 0.391, -0.148), (0.107, -0.266, 0.0815, 0.022), (0.408, -0.460, 6.0900, -0.602),
+         (0.900, -0.631, 32.100, -0.963), (0.970, -0.667, 35.000, -1.000)),
+        (1.187, 0.370, 6.30, 0.378),
+    ),
+}
+
+
+def lmtd_correction_factor(r, p, shells=1) -> np.ndarray:
+    """Ft of an N-shell, 2N-tube-pass exchanger (Bowman); NaN where the duty is infeasible.
+
+    `r` is the capacity ratio and `p` the overall thermal effectiveness of the
+    fluid whose temperature ratio defines it. Each shell is a 1-2 exchanger at
+    the per-shell effectiveness.
+    """
+    r, p, n = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (r, p, shells)))
+    unity = np.abs(r - 1.0) < 1e-6
+    r_safe = np.where(unity, 2.0, r)
+    s = np.sqrt(r**2 + 1.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = ((1.0 - p * r_safe) / (1.0 - p)) ** (1.0 / n)
+        p1 = np.where(unity, p / (n - n * p + p), (1.0 - x) / (r_safe - x))
+        inner = (2.0 / p1 - 1.0 - r + s) / (2.0 / p1 - 1.0 - r - s)
+        # R = 1 limit of s ln((1 - P1) / (1 - P1 R)) / (R - 1)
+        numerator = np.where(unity, s * p1 / (1.0 - p1), s * np.log((1.0 - p1) / (1.0 - p1 * r_safe)) / (r_safe - 1.0))
+        ft = numerator / np.log(inner)
+    return np.where((p > 0) & (p < 1) & (inner > 0) & np.isfinite(ft) & (ft > 0), ft, np.nan)
+
+
+def _taborek(reynolds, layout, coefficient_offset):
+    """Ideal tube-bank j (offset 0) or f (offset 2) factor at the pitch ratio `PITCH_RATIO`."""
+    value = np.zeros_like(reynolds)
+    for angle, (bands, exponents) in _TABOREK.items():
+        band = np.select([reynolds >= bound for bound in _TABOREK_BANDS], range(len(_TABOREK_BANDS)))
+        coefficients = np.asarray(bands)[band]
+        c1, c2 = coefficients[..., coefficient_offset], coefficients[..., coefficient_offset + 1]
+        c3, c4 = exponents[coefficient_offset], exponents[coefficient_offset + 1]
+        power = c3 / (1.0 + 0.14 * reynolds**c4)
+        value = np.where(layout == angle, c1 * (1.33 / PITCH_RATIO) ** power * reynolds**c2, value)
+    return value
+
+
+def rate_shell_and_tube(
+    shells,
+    tubes,
+    tube_od_m,
+    tube_wall_m,
+    tube_length_m,
+    tube_passes,
+    layout_angle,
+    baffle_spacing_ratio,
+    shell_fluid: Mapping[str, float],
+    tube_fluid: Mapping[str, float],
+    shell_fouling_m2k_w=2e-4,
+    tube_fouling_m2k_w=2e-4,
+    wall_conductivity_w_mk=45.0,
+) -> Dict[str, np.ndarray]:
+    """Rate a batch of geometries with the Bell-Delaware method; every output is an array over rows.
+
+    The bundle diameter follows from the tube count, layout and passes, and
+    the shell adds a fixed-tubesheet clearance. The pitch is `PITCH_RATIO`
+    times the tube diameter with a 25% baffle cut. Shells are in series on
+    both sides, so each fluid sees every shell.
+
+    Args:
+        shells, tubes: Shells in series and tubes per shell.
+        tube_od_m, tube_wall_m, tube_length_m: Tube dimensions.
+        tube_passes: Tube passes per shell (1 is pure counter-current).
+        layout_angle: 30 (triangular) or 90 (square).
+        baffle_spacing_ratio: Central baffle spacing / shell diameter.
+        shell_fluid, tube_fluid: "mass_flow_kg_s", "density_kg_m3",
+            "viscosity_pa_s", "cp_j_kgk" and "conductivity_w_mk" (scalars or arrays).
+        shell_fouling_m2k_w, tube_fouling_m2k_w: Fouling resistances.
+        wall_conductivity_w_mk: Tube wall conductivity.
+
+    Returns:
+        Arrays keyed by result name: geometry, film coefficients, Bell-Delaware
+        factors, U (outside area basis), area and pressure drops.
+    """
+    inputs = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (
+        shells, tubes, tube_od_m, tube_wall_m, tube_length_m, tube_passes, layout_angle, baffle_spacing_ratio,
+    )))
+    (n_shells, n_tubes, do, wall, length, passes, layout, spacing_ratio) = (np.atleast_1d(value) for value in inputs)
+    ms, rho_s, mu_s, cp_s, k_s = (np.asarray(shell_fluid[key], dtype=float) for key in _FLUID_KEYS)
+    mt, rho_t, mu_t, cp_t, k_t = (np.asarray(tube_fluid[key], dtype=float) for key in _FLUID_KEYS)
+
+    # --- Geometry ---
+    k1, n1 = np.zeros_like(do), np.ones_like(do)
+    for angle, by_passes in BUNDLE_CONSTANTS.items():
+        for count, (k_value, n_value) in by_passes.items():
+            selected = (layout == angle) & (passes == count)
+            k1, n1 = np.where(selected, k_value, k1), np.where(selected, n_value, n1)
+    bundle = do * (n_tubes / k1) ** (1.0 / n1)
+    shell_id = bundle + 0.010 + 0.010 * bundle
+    pitch = PITCH_RATIO * do
+    row_pitch = np.where(layout == 30, 0.866 * pitch, pitch)
+    baffles = np.maximum(np.floor(length / (spacing_ratio * shell_id)) - 1.0, 1.0)
+    spacing = length / (baffles + 1.0)
+    di = do - 2.0 * wall
+    area = n_shells * n_tubes * np.pi * do * length
+
+    # --- Shell side: ideal tube bank ---
+    tube_limit = bundle - do
+    bypass_gap = shell_id - bundle
+    crossflow_area = spacing * (bypass_gap + tube_limit / pitch * (pitch - do))
+    mass_velocity = ms / crossflow_area
+    re_s = do * mass_velocity / mu_s
+    pr_s = cp_s * mu_s / k_s
+    h_ideal = _taborek(re_s, layout, 0) * cp_s * mass_velocity * pr_s ** (-2.0 / 3.0)
+    f_ideal = _taborek(re_s, layout, 2)
+
+    # --- Bell-Delaware correction factors ---
+    theta_ctl = 2.0 * np.arccos(np.clip(shell_id * (1.0 - 2.0 * BAFFLE_CUT) / tube_limit, -1.0, 1.0))
+    window_fraction = (theta_ctl - np.sin(theta_ctl)) / (2.0 * np.pi)
+    jc = 0.55 + 0.72 * (1.0 - 2.0 * window_fraction)
+    theta_ds = 2.0 * np.arccos(1.0 - 2.0 * BAFFLE_CUT)
+    shell_baffle_clearance = 0.0031 + 0.004 * shell_id
+    shell_leak = np.pi * shell_id * shell_baffle_clearance / 2.0 * (1.0 - theta_ds / (2.0 * np.pi))
+    tube_leak = np.pi / 4.0 * ((do + TUBE_BAFFLE_CLEARANCE_M) ** 2 - do**2) * n_tubes * (1.0 - window_fraction)
+    rs = shell_leak / (shell_leak + tube_leak)
+    rlm = (shell_leak + tube_leak) / crossflow_area
+    jl = 0.44 * (1.0 - rs) + (1.0 - 0.44 * (1.0 - rs)) * np.exp(-2.2 * rlm)
+    bypass_fraction = spacing * bypass_gap / crossflow_area
+    jb = np.exp(-np.where(re_s < 100.0, 1.35, 1.25) * bypass_fraction)
+    rows_crossflow = shell_id * (1.0 - 2.0 * BAFFLE_CUT) / row_pitch
+    rows_window = 0.8 / row_pitch * (shell_id * BAFFLE_CUT - (shell_id - tube_limit) / 2.0)
+    jr_laminar = (10.0 / ((rows_crossflow + rows_window) * (baffles + 1.0))) ** 0.18
+    jr = np.where(re_s >= 100.0, 1.0, np.where(re_s <= 20.0, jr_laminar,
+                                                jr_laminar + (20.0 - re_s) / 80.0 * (jr_laminar - 1.0)))
+    h_shell = h_ideal * jc * jl * jb * jr
+
+    # --- Shell side pressure drop ---
+    dp_ideal = 2.0 * f_ideal * rows_crossflow * mass_velocity**2 / rho_s
+    rl = np.exp(-1.33 * (1.0 + rs) * rlm ** (-0.15 * (1.0 + rs) + 0.8))
+    rb = np.exp(-np.where(re_s < 100.0, 4.5, 3.7) * bypass_fraction)
+    window_area = shell_id**2 / 8.0 * (theta_ds - np.sin(theta_ds)) - n_tubes * window_fraction * np.pi * do**2 / 4.0
+    window_velocity = ms / np.sqrt(crossflow_area * window_area)
+    window_diameter = 4.0 * window_area / (np.pi * do * n_tubes * window_fraction + shell_id * theta_ds)
+    dp_window = np.where(
+        re_s >= 100.0,
+        (2.0 + 0.6 * rows_window) * window_velocity**2 / (2.0 * rho_s),
+        26.0 * mu_s * window_velocity / rho_s * (rows_window / (pitch - do) + spacing / window_diameter**2)
+        + window_velocity**2 / rho_s,
+    )
+    dp_shell = n_shells * (
+        (baffles - 1.0) * dp_ideal * rb * rl
+        + baffles * dp_window * rl
+        + 2.0 * dp_ideal * (1.0 + rows_window / rows_crossflow) * rb
+    )
+
+    # --- Tube side ---
+    flow_area = n_tubes / passes * np.pi * di**2 / 4.0
+    velocity = mt / (rho_t * flow_area)
+    re_t = rho_t * velocity * di / mu_t
+    pr_t = cp_t * mu_t / k_t
+    with np.errstate(invalid="ignore"):
+        friction = np.where(re_t >= 2300.0, (0.790 * np.log(re_t) - 1.64) ** -2, 64.0 / re_t)
+        nusselt = np.where(
+            re_t >= 2300.0,
+            friction / 8.0 * (re_t - 1000.0) * pr_t / (1.0 + 12.7 * np.sqrt(friction / 8.0) * (pr_t ** (2.0 / 3.0) - 1.0)),
+            np.maximum(3.66, 1.86 * (re_t * pr_t * di / (length * passes)) ** (1.0 / 3.0)),
+        )
+    h_tube = nusselt * k_t / di
+    # Straight-tube friction plus four velocity heads per pass for the return bends
+    dp_tube = n_shells * passes * (friction * length / di + 4.0) * rho_t * velocity**2 / 2.0
+
+    resistance = (
+        1.0 / h_shell + shell_fouling_m2k_w + do * np.log(do / di) / (2.0 * wall_conductivity_w_mk)
+        + (tube_fouling_m2k_w + 1.0 / h_tube) * do / di
+    )
+    return {
+        "shell_id_m": shell_id,
+        "bundle_diameter_m": bundle,
+        "baffle_spacing_m": spacing,
+        "baffles": baffles,
+        "area_m2": area,
+        "shell_reynolds": re_s,
+        "shell_h_w_m2k": h_shell,
+        "jc": jc,
+        "jl": jl,
+        "jb": jb,
+        "jr": jr,
+        "tube_reynolds": re_t,
+        "tube_velocity_m_s": velocity,
+        "tube_h_w_m2k": h_tube,
+        "u_w_m2k": 1.0 / resistance,
+        "shell_pressure_drop_pa": dp_shell,
+        "tube_pressure_drop_pa": dp_tube,
+    }
+
+
+def design_shell_and_tube(
+    duty_w: float,
+    t_hot_in: float,
+    t_hot_out: float,
+    t_cold_in: float,
+    t_cold_out: float,
+    shell_fluid: Mapping[str, float],
+    tube_fluid: Mapping[str, float],
+    max_shell_pressure_drop_pa: float = 70e3,
+    max_tube_pressure_drop_pa: float = 70e3,
+    max_shells: int = 4,
+    tube_counts=None,
+    **rating_options,
+) -> Dict[str, float]:
+    """Cheapest geometry that meets the duty and pressure-drop limits.
+
+    Every combination of tube size, layout, length, passes, baffle spacing
+    and tube count is rated for one shell in a single `rate_shell_and_tube`
+    call. The result is then broadcast over 1..`max_shells` shells in
+    series, since a shell's film coefficients do not depend on how many
+    follow it. A row is feasible when:
+    - its area covers Q / (U Ft LMTD);
+    - Ft >= 0.75;
+    - both pressure drops are within their limits;
+    - the tube length is 3 to 15 shell diameters.
+    Feasible rows are ranked by shells x (area per shell)^0.65, a
+    purchase-cost proxy that prefers one large shell to several small ones.
+    Temperatures may be in °C or K.
+
+    Returns:
+        The rating of the selected geometry as floats, plus its geometry, Ft,
+        required area, "candidates" and "feasible_candidates". Every value
+        is NaN when nothing is feasible.
+    """
+    if tube_counts is None:
+        tube_counts = np.unique(np.round(np.geomspace(8, 4000, 80)))
+    axes = np.meshgrid(
+        np.arange(len(TUBE_SIZES)), LAYOUT_ANGLES, TUBE_LENGTHS_M, TUBE_PASSES, BAFFLE_SPACING_RATIOS, tube_counts,
+        indexing="ij",
+    )
+    size, layout, length, passes, spacing, tubes = (axis.reshape(-1) for axis in axes)
+    tube_od = np.asarray(TUBE_SIZES)[size, 0]
+    tube_wall = np.asarray(TUBE_SIZES)[size, 1]
+    rating = rate_shell_and_tube(1, tubes, tube_od, tube_wall, length, passes, layout, spacing,
+                                 shell_fluid, tube_fluid, **rating_options)
+
+    # (shells, geometries): per-shell rating scaled to shells in series
+    shells = np.arange(1, max_shells + 1, dtype=float)[:, None]
+    area = shells * rating["area_m2"]
+    shell_dp = shells * rating["shell_pressure_drop_pa"]
+    tube_dp = shells * rating["tube_pressure_drop_pa"]
+    delta_1, delta_2 = t_hot_in - t_cold_out, t_hot_out - t_cold_in
+    lmtd = delta_1 if abs(delta_1 - delta_2) < 1e-9 else (delta_1 - delta_2) / np.log(delta_1 / delta_2)
+    r = (t_hot_in - t_hot_out) / (t_cold_out - t_cold_in)
+    p = (t_cold_out - t_cold_in) / (t_hot_in - t_cold_in)
+    ft = np.where(passes == 1, 1.0, lmtd_correction_factor(r, p, shells))
+    required_area = duty_w / (rating["u_w_m2k"] * ft * lmtd)
+    aspect = length / rating["shell_id_m"]
+    feasible = (
+        (ft >= 0.75)
+        & (area >= required_area)
+        & (shell_dp <= max_shell_pressure_drop_pa)
+        & (tube_dp <= max_tube_pressure_drop_pa)
+        & (aspect >= 3.0) & (aspect <= 15.0)
+    )
+
+    design = dict(rating, area_m2=area, shell_pressure_drop_pa=shell_dp, tube_pressure_drop_pa=tube_dp,
+                  shells=shells, tubes=tubes, tube_od_m=tube_od, tube_wall_m=tube_wall, tube_length_m=length,
+                  tube_passes=passes, layout_angle=layout, ft=ft, required_area_m2=required_area)
+    if not feasible.any():
+        best = {name: float("nan") for name in design}
+    else:
+        cost = np.where(feasible, shells * rating["area_m2"] ** 0.65, np.inf)
+        index = np.unravel_index(int(np.argmin(cost)), feasible.shape)
+        best = {name: float(np.broadcast_to(values, feasible.shape)[index]) for name, values in design.items()}
+    best["candidates"] = float(feasible.size)
+    best["feasible_candidates"] = float(feasible.sum())
+    return best
@@ -25,7 +25,7 @@ def size_pump_basic(
         fluid_density_kg_m3,
         pump_efficiency,
         motor_efficiency,
-    )
+    ).to_json()
 
 
 @tool
@@ -36,16 +36,24 @@ def size_compressor_basic(
     gas_type: str = "air",
     efficiency_polytropic: float = 0.80,
     intercooling: bool = True,
+    inlet_temperature_c: float = 25.0,
+    components: list[str] | None = None,
+    mole_fractions: list[float] | None = None,
+    max_discharge_temperature_c: float = 150.0,
 ) -> str:
     """
-    Preliminary sizing for compressors, returning staging, discharge conditions, and power. Pressures are in absolute Pascals.
+    Compressor sizing with the fewest stages meeting the discharge-temperature and 4:1 stage-ratio limits, at minimum-power interstage pressures, returning stage pressures, power, and intercooler duties. Give `components`/`mole_fractions` for real-gas properties. Pressures are in absolute Pascals.
     """
     return equipment_sizing(
         "compressor_sizing",
         inlet_flow_m3_min,
-        inlet_pressure_pa,
-        discharge_pressure_pa,
+        inlet_pressure_pa / 1000,
+        discharge_pressure_pa / 1000,
         gas_type,
         efficiency_polytropic,
         intercooling,
-    )
+        inlet_temperature_c,
+        components,
+        mole_fractions,
+        max_discharge_temperature_c,
+    ).to_json()
@@ -14,9 +14,16 @@ def size_heat_exchanger_basic(
     t_cold_out: float,
     u_estimate: float,
     configuration: str = "1-2",
+    hot_components: list[str] | None = None,
+    hot_mole_fractions: list[float] | None = None,
+    cold_components: list[str] | None = None,
+    cold_mole_fractions: list[float] | None = None,
+    hot_pressure_pa: float = 500000.0,
+    cold_pressure_pa: float = 500000.0,
+    hot_side: str = "tube",
 ) -> str:
     """
-    Preliminary sizing for a shell-and-tube exchanger using the LMTD method.
+    Shell-and-tube exchanger sizing using the LMTD method. Give hot and cold `components` (and mole fractions for mixtures) to design the geometry by Bell-Delaware rating with shell/tube pressure drops. Pressures are in absolute Pascals.
     """
     return equipment_sizing(
         "basic_heat_exchanger_sizing",
@@ -27,7 +34,14 @@ def size_heat_exchanger_basic(
         t_cold_out,
         u_estimate,
         configuration,
-    )
+        hot_components,
+        hot_mole_fractions,
+        cold_components,
+        cold_mole_fractions,
+        hot_pressure_pa / 1000,
+        cold_pressure_pa / 1000,
+        hot_side,
+    ).to_json()
 
 
 @tool
@@ -50,7 +64,7 @@ def size_air_cooler_basic(
         ambient_temperature_c,
         design_approach,
         fluid_type,
-    )
+    ).to_json()
 
 
 # Backwards compatibility alias.
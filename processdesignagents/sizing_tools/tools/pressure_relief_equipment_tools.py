@@ -13,19 +13,24 @@ def size_pressure_safety_valve_basic(
     back_pressure_pa: float,
     fluid_phase: str = "vapor",
     fluid_density_kg_m3: float | None = None,
+    molecular_weight: float | None = None,
+    relieving_temperature_c: float = 40.0,
 ) -> str:
     """
-    Preliminary PSV sizing returning nozzle, capacity, and valve class recommendations. Pressures are in absolute Pascals.
+    API 520 PSV sizing: required orifice area, API 526 letter orifice, rated capacity and inlet/outlet line sizes. Pressures are in absolute Pascals.
+    Vapor relief needs molecular_weight (or fluid_density_kg_m3 at relief conditions); liquid relief needs fluid_density_kg_m3.
     """
     return equipment_sizing(
         "pressure_safety_valve_sizing",
         protected_equipment_id,
         required_relief_flow_kg_h,
-        relief_pressure_pa,
-        back_pressure_pa,
+        relief_pressure_pa / 1e5 - 1.01325,
+        back_pressure_pa / 1e5 - 1.01325,
         fluid_phase,
         fluid_density_kg_m3,
-    )
+        molecular_weight,
+        relieving_temperature_c,
+    ).to_json()
 
 
 @tool
@@ -37,20 +42,28 @@ def size_blowdown_valve_basic(
     final_pressure_pa: float = 151325.0,
     fluid_type: str = "hydrocarbon",
     fluid_density_kg_m3: float | None = None,
+    molecular_weight: float | None = None,
+    temperature_c: float = 40.0,
+    heat_input_kw: float = 0.0,
 ) -> str:
     """
-    Preliminary blowdown valve sizing estimating capacities and connection diameters. Pressures are in absolute Pascals.
+    Blowdown valve sizing from a dynamic depressurization simulation: restriction orifice, peak flow, minimum gas temperature and connection diameters. Pressures are in absolute Pascals.
     """
     return equipment_sizing(
         "blowdown_valve_sizing",
         protected_equipment_id,
         equipment_volume_m3,
         blowdown_time_minutes,
-        initial_pressure_pa,
-        final_pressure_pa,
+        initial_pressure_pa / 1e5 - 1.01325,
+        final_pressure_pa / 1e5 - 1.01325,
         fluid_type,
         fluid_density_kg_m3,
-    )
+        molecular_weight,
+        temperature_c,
+        None,
+        1.0,
+        heat_input_kw,
+    ).to_json()
 
 
 @tool
@@ -73,4 +86,4 @@ def size_vent_valve_basic(
         vapor_density_kg_m3,
         relieving_temperature_c,
         relieving_pressure_pa,
-    )
+    ).to_json()
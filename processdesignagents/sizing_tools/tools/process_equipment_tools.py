@@ -27,4 +27,4 @@ def size_reactor_vessel_basic(
         heat_removal_kw,
         design_pressure_pa,
         design_temperature_c,
-    )
+    ).to_json()
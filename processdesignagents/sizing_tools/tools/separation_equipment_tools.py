@@ -28,8 +28,8 @@ def size_distillation_column_basic(
         feed_composition,
         relative_volatility,
         tray_efficiency_percent,
-        design_pressure_pa,
-    )
+        design_pressure_pa / 1e5 - 1.01325,
+    ).to_json()
 
 
 @tool
@@ -40,9 +40,12 @@ def size_absorption_column_basic(
     solvent_type: str = "water",
     henry_constant: float | None = None,
     design_pressure_pa: float = 201325.0,
+    k_value: float | None = None,
+    lg_ratio_factor: float = 1.5,
 ) -> str:
     """
-    Preliminary absorption column sizing using heuristic stage and diameter estimates. Pressure is in absolute Pascals.
+    Preliminary packed absorber sizing (Kremser stages, minimum L/G x factor, Eckert flooding diameter). Pressure is in absolute Pascals.
+    Requires equilibrium data: k_value (y = m·x, effective value for amine solvents) or henry_constant in Pa·m³/mol.
     """
     return equipment_sizing(
         "absorption_column_sizing",
@@ -51,8 +54,10 @@ def size_absorption_column_basic(
         outlet_concentration,
         solvent_type,
         henry_constant,
-        design_pressure_pa,
-    )
+        design_pressure_pa / 1e5 - 1.01325,
+        k_value,
+        lg_ratio_factor,
+    ).to_json()
 
 
 @tool
@@ -79,4 +84,4 @@ def size_separator_vessel_basic(
         residence_time_min,
         design_pressure_pa,
         design_temperature_c,
-    )
+    ).to_json()
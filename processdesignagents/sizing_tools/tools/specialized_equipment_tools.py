@@ -27,7 +27,7 @@ def size_knockout_drum_basic(
         residence_time_seconds,
         vapor_mw,
         liquid_density_kg_m3,
-    )
+    ).to_json()
 
 
 @tool
@@ -48,7 +48,7 @@ def size_filter_vessel_basic(
         design_pressure_pa,
         design_temperature_c,
         filter_media_permeability_m_s,
-    )
+    ).to_json()
 
 
 @tool
@@ -69,4 +69,4 @@ def size_dryer_vessel_basic(
         outlet_moisture_ppm,
         design_pressure_pa,
         regeneration_type,
-    )
+    ).to_json()
@@ -25,7 +25,7 @@ def size_storage_tank_basic(
         design_pressure_pa,
         design_temperature_c,
         tank_type,
-    )
+    ).to_json()
 
 
 @tool
@@ -48,4 +48,4 @@ def size_surge_drum_basic(
         surge_time_minutes,
         operating_pressure_pa,
         l_d_ratio,
-    )
+    ).to_json()
@@ -1,2 +1,2 @@
-from .unit_converter.unit_converter.converter import convert, converts
+from .unit_converter.unit_converter.converter import convert, converts, convert_array
 
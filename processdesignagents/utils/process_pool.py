@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Below this many items a batch runs in the calling process: spawning and
+# warming workers costs far more than the calculation itself.
+DEFAULT_MIN_PARALLEL_BATCH = 256
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+
+
+def default_worker_count() -> int:
+    """Number of worker processes: the cores available to this process."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return max(1, os.cpu_count() or 1)
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared spawn-context process pool, creating it on first use."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    workers = max_workers or default_worker_count()
+    if _EXECUTOR is not None and _EXECUTOR_WORKERS != workers:
+        shutdown_process_pool()
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        _EXECUTOR_WORKERS = workers
+    return _EXECUTOR
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Stop the worker processes (they are restarted on the next batch)."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=wait)
+        _EXECUTOR = None
+        _EXECUTOR_WORKERS = 0
+
+
+def shard_ranges(count: int, shards: int) -> List[Tuple[int, int]]:
+    """Split `range(count)` into at most `shards` contiguous (start, stop) slices."""
+    shards = max(1, min(shards, count))
+    bounds = np.linspace(0, count, shards + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def map_sharded(
+    worker: Callable[..., List[Any]],
+    rows: Sequence[Any],
+    *args: Any,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Run `worker(rows[start:stop], *args)` on row shards; concatenate the returned lists.
+
+    Results are pickled back; use `run_sharded` for numeric results.
+    """
+    if not len(rows):
+        return []
+    pool = get_process_pool(max_workers)
+    futures = [
+        pool.submit(worker, rows[start:stop], *args)
+        for start, stop in shard_ranges(len(rows), _EXECUTOR_WORKERS * 4)
+    ]
+    results: List[Any] = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+def run_sharded(
+    worker: Callable[..., None],
+    rows: Sequence[Any],
+    columns: int,
+    *args: Any,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Fill a (len(rows), columns) float array by running `worker` on row shards.
+
+    The array lives in a shared-memory block. Each shard calls
+    `worker(block_name, shape, start, rows[start:stop], *args)` in a pool
+    process; the worker attaches with `attach_shared_array` and writes its
+    rows in place, so results never travel back as pickles. Rows a worker
+    leaves untouched stay NaN. `worker`, `rows` and `args` must be
+    picklable (module-level functions and plain data).
+    """
+    shape = (len(rows), columns)
+    if not len(rows):
+        return np.empty(shape)
+    block = shared_memory.SharedMemory(create=True, size=shape[0] * columns * 8)
+    try:
+        view = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        view.fill(np.nan)
+        del view
+        pool = get_process_pool(max_workers)
+        # A few shards per worker keeps the cores busy when rows differ in cost.
+        futures = [
+            pool.submit(worker, block.name, shape, start, rows[start:stop], *args)
+            for start, stop in shard_ranges(shape[0], _EXECUTOR_WORKERS * 4)
+        ]
+        for future in futures:
+            future.result()
+        return np.ndarray(shape, dtype=np.float64, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+@contextmanager
+def attach_shared_array(name: str, shape: Sequence[int]) -> Iterator[np.ndarray]:
+    """Attach to the float block of `run_sharded` (used inside workers).
+
+    Do not keep references to the array (or slices of it) after the block
+    is closed.
+    """
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block with the resource tracker,
+        # which would then unlink it (or warn) on the parent's behalf.
+        from multiprocessing import resource_tracker
+
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            block = shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+    array = np.ndarray(tuple(shape), dtype=np.float64, buffer=block.buf)
+    try:
+        yield array
+    finally:
+        del array
+        block.close()
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Type, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 class Quantity(BaseModel):
@@ -86,6 +93,7 @@ class Stream(BaseModel):
         description="Stream-specific design considerations or assumptions.",
     )
 
+
 class EquipmentAndStreamList(BaseModel):
     """Canonical equipment and stream list produced by the LangGraph pipeline."""
 
@@ -103,3 +111,106 @@ class EquipmentAndStreamList(BaseModel):
         default_factory=list,
         description="Outstanding assumptions, TBD items, or design caveats.",
     )
+
+
+# --------------------------------------------------------------------------- #
+# Cached schemas and validation helpers
+# --------------------------------------------------------------------------- #
+
+@lru_cache(maxsize=None)
+def cached_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Return `model.model_json_schema()`, generated once per model.
+
+    The returned dict is shared; copy it before modifying.
+    """
+    return model.model_json_schema()
+
+
+@lru_cache(maxsize=None)
+def cached_type_adapter(tp: Any) -> TypeAdapter:
+    """Return a `TypeAdapter` for `tp`, built once (e.g. `List[Stream]`)."""
+    return TypeAdapter(tp)
+
+
+def validate_equipment_and_stream_list(
+    data: Union[str, bytes, Mapping[str, Any]],
+    trusted: bool = False,
+) -> EquipmentAndStreamList:
+    """Validate an equipment/stream payload.
+
+    JSON text or bytes are validated directly by pydantic-core
+    (`model_validate_json`) without building intermediate dicts. With
+    `trusted=True` the payload is only parsed and the models are built with
+    `model_construct`, skipping validation, so payloads this package produced
+    itself (checkpoints, resume logs) load even when older ones have missing
+    or null fields. pydantic-core validation is already faster than
+    `model_construct` per object, so the trusted path is not a speed-up.
+
+    Raises:
+        pydantic.ValidationError: the payload does not match the contract
+            (see `format_validation_errors`).
+    """
+    if trusted:
+        payload = _loads(data) if isinstance(data, (str, bytes, bytearray)) else data
+        return _construct_equipment_and_stream_list(payload)
+    if isinstance(data, (str, bytes, bytearray)):
+        return EquipmentAndStreamList.model_validate_json(data)
+    return EquipmentAndStreamList.model_validate(data)
+
+
+def equipment_and_stream_errors(data: Union[str, bytes, Mapping[str, Any]]) -> List[str]:
+    """Return per-field error messages for a payload, or an empty list if it is valid."""
+    try:
+        validate_equipment_and_stream_list(data)
+    except ValidationError as exc:
+        return format_validation_errors(exc)
+    return []
+
+
+def format_validation_errors(exc: ValidationError) -> List[str]:
+    """Flatten a ValidationError into `"streams.3.properties.mass_flow.value: message"` lines."""
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or '<root>'}: {error['msg']}"
+        for error in exc.errors(include_url=False)
+    ]
+
+
+def _loads(data: Union[str, bytes, bytearray]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _construct_equipment_and_stream_list(payload: Mapping[str, Any]) -> EquipmentAndStreamList:
+    equipments = [
+        Equipment.model_construct(**{
+            **item,
+            "sizing_parameters": [
+                SizingParameter.model_construct(
+                    name=parameter.get("name"),
+                    quantity=Quantity.model_construct(**(parameter.get("quantity") or {})),
+                )
+                for parameter in item.get("sizing_parameters") or []
+            ],
+        })
+        for item in payload.get("equipments") or []
+    ]
+    streams = [
+        Stream.model_construct(**{
+            **item,
+            "properties": {
+                key: Quantity.model_construct(**value)
+                for key, value in (item.get("properties") or {}).items()
+            },
+            "compositions": {
+                key: CompositionEntry.model_construct(**value)
+                for key, value in (item.get("compositions") or {}).items()
+            },
+        })
+        for item in payload.get("streams") or []
+    ]
+    return EquipmentAndStreamList.model_construct(
+        equipments=equipments,
+        streams=streams,
+        notes_and_assumptions=list(payload.get("notes_and_assumptions") or []),
+    )
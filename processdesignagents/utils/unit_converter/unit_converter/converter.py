@@ -3,10 +3,86 @@
 
 """Converter object to handle string input."""
 
-from decimal import Decimal as D
+from decimal import Decimal as D, localcontext
+from functools import lru_cache
+from typing import Tuple
 
+from .exceptions import UnConsistentUnitsError
 from .parser import QuantityParser, UnitParser
 
+# Extra digits used while folding two units into a single factor and while
+# applying it, so results keep the full precision of the caller's context.
+_FACTOR_PRECISION = 50
+
+
+@lru_cache(maxsize=1024)
+def resolve_unit(unit: str) -> Tuple[D, D, tuple]:
+    """Parse a unit string once and return its (coef, offset, dimension).
+
+    :param unit: unit string, e.g. 'kg*h^-1'
+    :return: tuple (coef, offset, (L, M, T, I, THETA, N, J))
+
+    Examples :
+    ----------
+
+    >>> resolve_unit('km')
+    (Decimal('1E+3'), Decimal('0'), (1, 0, 0, 0, 0, 0, 0))
+    """
+    parsed = UnitParser().parse(unit)
+    dimension = (parsed.L, parsed.M, parsed.T, parsed.I,
+                 parsed.THETA, parsed.N, parsed.J)
+    return parsed.coef, parsed.offset, dimension
+
+
+@lru_cache(maxsize=4096)
+def conversion_factors(from_unit: str, to_unit: str) -> Tuple[D, D]:
+    """Return the (factor, shift) pair converting `from_unit` to `to_unit`.
+
+    A value converts as ``value * factor + shift``.
+
+    :param from_unit: unit string of the original value
+    :param to_unit: unit string of the desired value
+    :return: tuple (factor, shift)
+
+    Examples :
+    ----------
+
+    >>> conversion_factors('h', 's')
+    (Decimal('3600'), Decimal('0'))
+    """
+    coef, offset, dimension = resolve_unit(from_unit)
+    desired_coef, desired_offset, desired_dimension = resolve_unit(to_unit)
+    if dimension != desired_dimension:
+        raise UnConsistentUnitsError(to_unit, from_unit)
+
+    with localcontext() as ctx:
+        ctx.prec = _FACTOR_PRECISION
+        factor = coef / desired_coef
+        shift = (offset - desired_offset) / desired_coef
+    return factor, shift
+
+
+@lru_cache(maxsize=4096)
+def float_conversion_factors(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """Float version of :func:`conversion_factors` for vectorized use."""
+    factor, shift = conversion_factors(from_unit, to_unit)
+    return float(factor), float(shift)
+
+
+def clear_cache() -> None:
+    """Drop every cached unit and conversion factor."""
+    float_conversion_factors.cache_clear()
+    conversion_factors.cache_clear()
+    resolve_unit.cache_clear()
+
+
+def _split_quantity(quantity: str) -> Tuple[D, str]:
+    r = QuantityParser.quantity_re.match(quantity)
+    value = r.group("value")
+    if value is None:
+        return D('1'), r.group("unit")
+    return D(value.replace(',', '.')), r.group("unit")
+
 
 def convert(quantity: str, desired_unit: str) -> D:
     """
@@ -22,9 +98,12 @@ def convert(quantity: str, desired_unit: str) -> D:
     >>> convert('2.78 daN*mm^2', 'mN*µm^2')
     Decimal('2.78E+10')
     """
-    quantity = QuantityParser().parse(quantity)
-    desired_unit = UnitParser().parse(desired_unit)
-    return quantity.convert(desired_unit).value
+    value, unit = _split_quantity(quantity)
+    factor, shift = conversion_factors(unit.strip(), desired_unit.strip())
+    with localcontext() as ctx:
+        ctx.prec = _FACTOR_PRECISION
+        desired_value = value * factor + shift
+    return +desired_value
 
 
 def converts(quantity: str, desired_unit: str) -> str:
@@ -44,6 +123,48 @@ def converts(quantity: str, desired_unit: str) -> str:
     return str(convert(quantity, desired_unit))
 
 
+def convert_array(values, from_unit: str, to_unit: str, precise: bool = False):
+    """Convert a whole sequence of values from `from_unit` to `to_unit`.
+
+    Factors are resolved once and applied with NumPy in float arithmetic.
+    Offset units (°C, °F, barg, ...) are handled through the cached shift.
+
+    :param values: scalar, sequence or numpy array of values
+    :param from_unit: unit string of `values`
+    :param to_unit: desired unit string
+    :param precise: if True, convert element by element in Decimal
+                    arithmetic and return an object array of Decimal
+    :return: numpy array with the converted values
+
+    Examples :
+    ----------
+
+    >>> convert_array([0, 100], '°C', 'K')
+    array([273.15, 373.15])
+    """
+    import numpy as np
+
+    from_unit, to_unit = from_unit.strip(), to_unit.strip()
+    if precise:
+        factor, shift = conversion_factors(from_unit, to_unit)
+        flat = np.asarray(values, dtype=object)
+        converted = np.empty(flat.shape, dtype=object)
+        with localcontext() as ctx:
+            ctx.prec = _FACTOR_PRECISION
+            for idx, value in np.ndenumerate(flat):
+                value = value if isinstance(value, D) else D(str(value))
+                converted[idx] = value * factor + shift
+        for idx, value in np.ndenumerate(converted):
+            converted[idx] = +value
+        return converted
+
+    factor, shift = float_conversion_factors(from_unit, to_unit)
+    values = np.asarray(values, dtype=float)
+    if shift:
+        return values * factor + shift
+    return values * factor
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -9,6 +9,32 @@ from .data import PREFIXES, UNITS
 from .exceptions import UnitDoesntExistError
 from .units import Unit, Quantity
 
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻⁺', '0123456789-+')
+_TERMINAL = ''  # never a symbol character, marks the end of a unit symbol
+
+
+def _build_unit_trie(prefixes: dict, units: dict) -> dict:
+    """Build a character trie over every prefix + unit combination.
+
+    Ambiguous symbols are resolved deterministically: a bare unit always wins
+    over a prefixed one ('min' is minute, not milli-inch; 'T' is tesla), then
+    the shortest prefix, i.e. the longest unit symbol, wins.
+    """
+    trie = {}
+    for unit_s, unit in units.items():
+        for prefix_s, prefix in prefixes.items():
+            node = trie
+            for char in prefix_s + unit_s:
+                node = node.setdefault(char, {})
+            rank = (prefix_s != '', len(prefix_s))
+            current = node.get(_TERMINAL)
+            if current is None or rank < current[0]:
+                node[_TERMINAL] = (rank, prefix * unit)
+    return trie
+
+
+UNIT_TRIE = _build_unit_trie(PREFIXES, UNITS)
+
 
 def parse(quantity: str) -> Quantity:
     return QuantityParser().parse(quantity)
@@ -30,34 +56,100 @@ class QuantityParser(object):
             return unit
 
 
+class _Group(object):
+    """Parse state of one parenthesis level of a compound unit."""
+    __slots__ = ("sign", "divided", "divided_before_slash", "slash_pending", "restore")
+
+    def __init__(self, sign: int, restore: bool = None):
+        self.sign = sign
+        self.divided = False
+        self.divided_before_slash = False
+        self.slash_pending = False
+        self.restore = restore
+
+    def term_sign(self) -> int:
+        return -self.sign if self.divided else self.sign
+
+
 class UnitParser(object):
-    unit_re = re.compile(r"(?P<unit>[a-zA-Z°Ωµ]+)\^?(?P<pow>[-+]?[0-9]*\.?[0-9]*)")
+    """Parse compound unit strings such as 'kg*m*s^-2', 'kJ/kg-K' or 'm³/h'.
+
+    Terms are separated by '*', '·', '.', '-' or spaces; every term after a
+    '/' goes to the denominator. A '/' directly before a parenthesized group
+    divides by that group only ('kg/(m2·h)*s' is kg*m^-2*h^-1*s). A power is
+    given with '^' ('m^2'), as trailing digits ('m2', 's-2') or as
+    superscripts ('m³', 'm⁻¹'). Unbalanced parentheses raise
+    UnitDoesntExistError.
+    """
+    unit_re = re.compile(
+        r"(?P<sep>[*·./()\s-]*)"
+        r"(?P<unit>[a-zA-Z°Ωµμ]+)"
+        r"(?:\^(?P<pow>[-+]?[0-9]*\.?[0-9]+)"
+        r"|(?P<sup>[⁻⁺]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)"
+        r"|(?P<digits>[-+]?[0-9]+(?:\.[0-9]+)?))?"
+    )
 
     def parse(self, unit: str) -> Unit:
-        l_unit_s = self.unit_re.findall(unit)
-        l_unit = [self._parse_unit(unit, power) for unit, power in l_unit_s]
+        l_unit = []
+        groups = [_Group(1)]
+        end = 0
+        for r in self.unit_re.finditer(unit):
+            self._read_separators(r.group("sep"), groups, unit)
+            power = (r.group("pow") or r.group("digits")
+                     or (r.group("sup") or '').translate(_SUPERSCRIPTS))
+            parsed = self._parse_unit(r.group("unit"), power)
+            l_unit.append(parsed ** -1 if groups[-1].term_sign() < 0 else parsed)
+            groups[-1].slash_pending = False
+            end = r.end()
+        self._read_separators(unit[end:], groups, unit)
+
+        if not l_unit or len(groups) != 1:
+            raise UnitDoesntExistError(unit)
         return reduce(lambda x, y: x * y, l_unit)
 
+    @staticmethod
+    def _read_separators(sep: str, groups: list, unit: str) -> None:
+        """Update the parenthesis group stack for the separators before a term."""
+        for char in sep:
+            group = groups[-1]
+            if char == '/':
+                if not group.slash_pending:
+                    group.divided_before_slash = group.divided
+                group.divided = group.slash_pending = True
+            elif char == '(':
+                # A group right after '/' is divided as a whole, then the '/' ends
+                restore = group.divided_before_slash if group.slash_pending else None
+                group.slash_pending = False
+                groups.append(_Group(group.term_sign(), restore))
+            elif char == ')':
+                if len(groups) == 1:
+                    raise UnitDoesntExistError(unit)
+                closed = groups.pop()
+                if closed.restore is not None:
+                    groups[-1].divided = closed.restore
+
     def _parse_unit(self, unit: str, power: str) -> Unit:
         if power == '':
             return self._parse_simple_unit(unit)
         else:
-            return self._parse_simple_unit(unit) ** float(power)
+            power = float(power)
+            if power.is_integer():
+                power = int(power)
+            return self._parse_simple_unit(unit) ** power
 
     @staticmethod
     def _parse_simple_unit(unit_s: str) -> Unit:
         """Parse a simple unit.
 
-        In other word, parse an unit without a power value.
+        In other word, parse an unit without a power value. The symbol is
+        walked through the precompiled prefix + unit trie in O(len(unit_s)).
         """
-        unit = None
-        for prefix in PREFIXES.keys():
-            if unit_s.startswith(prefix) and unit_s[len(prefix):] in UNITS.keys():
-                unit = UNITS[unit_s[len(prefix):]]
-                prefix = PREFIXES[prefix]
-                break
-        
-        if unit is None:
-            raise UnitDoesntExistError(unit_s)
+        node = UNIT_TRIE
+        for char in unit_s.replace('μ', 'µ'):
+            node = node.get(char)
+            if node is None:
+                raise UnitDoesntExistError(unit_s)
 
-        return prefix*unit
+        if _TERMINAL not in node:
+            raise UnitDoesntExistError(unit_s)
+        return node[_TERMINAL][1]
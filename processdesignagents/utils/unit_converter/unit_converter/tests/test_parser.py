@@ -5,6 +5,12 @@ import unittest
 from decimal import Decimal as D
 
 import pytest
+
+from unit_converter.parser import UnitParser
+from unit_converter.data import PREFIXES, UNITS
+from unit_converter.exceptions import UnitDoesntExistError
+from unit_converter.units import Unit
+
 #TODO: Update tests
 # from unit_converter.parser import UnitParser
 # from unit_converter.units import Unit, UNITS, PREFIXES
@@ -157,3 +163,51 @@ import pytest
 #         composed_unit_as_string = 'kg*m*s^-2'
 #         unit_expected = Unit('kg*m*s^-2.0', 'kilogram*meter*second^-2.0', M=1, L=1, T=-2)
 #         assert ComposedUnitParser().get_unit(composed_unit_as_string) == unit_expected
+
+
+
+# ------------------------
+# Test UnitParser class
+# ------------------------
+@pytest.mark.parametrize("unit_s, expected", [
+    ('min', UNITS['min']),
+    ('m', UNITS['m']),
+    ('T', UNITS['T']),
+    ('mm', PREFIXES['m'] * UNITS['m']),
+    ('µm', PREFIXES['µ'] * UNITS['m']),
+    ('μm', PREFIXES['µ'] * UNITS['m']),
+    ('dam', PREFIXES['da'] * UNITS['m']),
+])
+def test_parse_simple_unit_disambiguation(unit_s, expected):
+    assert UnitParser._parse_simple_unit(unit_s) == expected
+
+
+@pytest.mark.parametrize("unit_s, dimension", [
+    ('kJ/kg-K', dict(L=2, T=-2, THETA=-1)),
+    ('m³/h', dict(L=3, T=-1)),
+    ('W/m2-K', dict(M=1, T=-3, THETA=-1)),
+    ('kg*m*s^-2', dict(M=1, L=1, T=-2)),
+    ('kg/(m2·h)', dict(M=1, L=-2, T=-1)),
+    ('m⁻¹', dict(L=-1)),
+    ('kg/(m2·h)*s', dict(M=1, L=-2)),
+    ('J/(mol·K)', dict(M=1, L=2, T=-2, N=-1, THETA=-1)),
+    ('(kg·m)/s2', dict(M=1, L=1, T=-2)),
+    ('W/(m2·(K))', dict(M=1, T=-3, THETA=-1)),
+])
+def test_parse_compound_unit(unit_s, dimension):
+    assert UnitParser().parse(unit_s).is_same_dimension(Unit('', '', **dimension))
+
+
+def test_parse_division_coefficient():
+    assert float(UnitParser().parse('kg/h').coef) == pytest.approx(1 / 3600)
+
+
+@pytest.mark.parametrize("unit_s", ['kg/(m2·h', 'kg/m2)·h', '(kg'])
+def test_parse_unbalanced_parentheses(unit_s):
+    with pytest.raises(UnitDoesntExistError):
+        UnitParser().parse(unit_s)
+
+
+def test_parse_unknown_unit():
+    with pytest.raises(UnitDoesntExistError):
+        UnitParser().parse('furlongs')
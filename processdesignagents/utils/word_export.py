@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import pypandoc
+except ImportError:  # pragma: no cover - optional dependency
+    pypandoc = None
+
+try:
+    from docx import Document
+    from docx.shared import Pt
+except ImportError:  # pragma: no cover - optional dependency
+    Document = None
+    Pt = None
+
+WORD_EXPORT_ENGINES = ("auto", "pandoc", "docx")
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+(.*)$")
+_NUMBERED_RE = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_ALIGN_CELL_RE = re.compile(r"^:?-{3,}:?$")
+_INLINE_RE = re.compile(r"(\*\*[^*]+\*\*|__[^_]+__|\*[^*\s][^*]*\*|`[^`]+`)")
+_BREAK_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+@lru_cache(maxsize=1)
+def pandoc_available() -> bool:
+    """Return True if pypandoc can find a pandoc executable."""
+    if pypandoc is None:
+        return False
+    try:
+        pypandoc.get_pandoc_path()
+    except OSError:
+        return False
+    return True
+
+
+def export_markdown_to_word(
+    markdown_path: str | Path,
+    output_path: str | Path,
+    reference_doc: str | Path | None = None,
+    engine: str = "auto",
+    remove_markdown: bool = False,
+) -> str:
+    """Convert a markdown report file to a Word document.
+
+    Args:
+        markdown_path: Markdown file to convert.
+        output_path: Target .docx file.
+        reference_doc: Optional .docx whose styles are used.
+        engine: "pandoc" (external pandoc process), "docx" (native python-docx
+            renderer for headings, paragraphs, lists and pipe tables) or
+            "auto" (pandoc when installed, the native renderer otherwise).
+        remove_markdown: Delete `markdown_path` afterwards (temporary inputs).
+
+    Returns:
+        The absolute path of the written document.
+    """
+    if engine not in WORD_EXPORT_ENGINES:
+        raise ValueError(f"Unknown Word export engine '{engine}'. Use one of {WORD_EXPORT_ENGINES}.")
+    if reference_doc is not None and not Path(reference_doc).is_file():
+        reference_doc = None
+    if engine == "auto":
+        engine = "pandoc" if pandoc_available() else "docx"
+
+    try:
+        if engine == "pandoc":
+            if not pandoc_available():
+                raise RuntimeError("Pandoc executable not found. Install pandoc or use the 'docx' engine.")
+            extra_args = [f"--reference-doc={reference_doc}"] if reference_doc else []
+            pypandoc.convert_file(
+                str(markdown_path),
+                "docx",
+                format="md",
+                outputfile=str(output_path),
+                extra_args=extra_args,
+            )
+        else:
+            text = Path(markdown_path).read_text(encoding="utf-8")
+            markdown_to_docx(text, output_path, reference_doc=reference_doc)
+    finally:
+        if remove_markdown:
+            Path(markdown_path).unlink(missing_ok=True)
+
+    output = os.path.abspath(output_path)
+    print(f"\nSuccessfully exported Word document to: {output}\n", flush=True)
+    return output
+
+
+def submit_word_export(
+    markdown_path: str | Path,
+    output_path: str | Path,
+    reference_doc: str | Path | None = None,
+    engine: str = "auto",
+    remove_markdown: bool = False,
+) -> Future:
+    """Run `export_markdown_to_word` in a background worker process.
+
+    The worker is a single spawned process shared by every export, so the
+    caller returns immediately. Pending exports still finish at interpreter
+    exit. Errors are printed when the job ends and re-raised by
+    `future.result()`.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    future = _EXECUTOR.submit(
+        export_markdown_to_word,
+        str(markdown_path),
+        str(output_path),
+        str(reference_doc) if reference_doc else None,
+        engine,
+        remove_markdown,
+    )
+    future.add_done_callback(_report_failure)
+    return future
+
+
+def shutdown_word_export_worker(wait: bool = True) -> None:
+    """Stop the background worker, waiting for pending exports by default."""
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=wait)
+        _EXECUTOR = None
+
+
+def _report_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        print(f"\nAn error occurred during Word export: {error}", flush=True)
+
+
+# --------------------------------------------------------------------------- #
+# Native python-docx renderer
+# --------------------------------------------------------------------------- #
+
+def markdown_to_docx(markdown_text: str, output_path: str | Path, reference_doc: str | Path | None = None) -> None:
+    """Render the report markdown (headings, paragraphs, lists, rules, pipe tables) with python-docx."""
+    if Document is None:
+        raise ImportError(
+            "python-docx is required to export Word reports. Install with `pip install python-docx`."
+        )
+    document = Document(str(reference_doc)) if reference_doc else Document()
+    if reference_doc:
+        # Keep the template styles and page setup, drop its sample content.
+        body = document.element.body
+        for element in list(body):
+            if not element.tag.endswith("}sectPr"):
+                body.remove(element)
+
+    lines = markdown_text.splitlines()
+    paragraph: List[str] = []
+    index = 0
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            _add_inline(document.add_paragraph(), " ".join(part.strip() for part in paragraph))
+            paragraph.clear()
+
+    while index < len(lines):
+        line = lines[index]
+        stripped = line.strip()
+
+        if stripped.startswith("```"):
+            flush_paragraph()
+            index += 1
+            while index < len(lines) and not lines[index].strip().startswith("```"):
+                run = document.add_paragraph().add_run(lines[index])
+                run.font.name = "Courier New"
+                run.font.size = Pt(9)
+                index += 1
+            index += 1
+            continue
+
+        if stripped.startswith("|"):
+            flush_paragraph()
+            rows = []
+            while index < len(lines) and lines[index].strip().startswith("|"):
+                rows.append(_split_table_row(lines[index]))
+                index += 1
+            _add_table(document, rows)
+            continue
+
+        heading = _HEADING_RE.match(stripped)
+        if heading:
+            flush_paragraph()
+            document.add_heading(heading.group(2), level=len(heading.group(1)))
+        elif not stripped:
+            flush_paragraph()
+        elif _RULE_RE.match(stripped):
+            flush_paragraph()
+        elif _BULLET_RE.match(line):
+            flush_paragraph()
+            _add_list_item(document, _BULLET_RE.match(line).group(1), "List Bullet", "• ")
+        elif _NUMBERED_RE.match(line):
+            flush_paragraph()
+            number = stripped.split(maxsplit=1)[0]
+            _add_list_item(document, _NUMBERED_RE.match(line).group(1), "List Number", f"{number} ")
+        else:
+            paragraph.append(line)
+        index += 1
+
+    flush_paragraph()
+    document.save(str(output_path))
+
+
+def _split_table_row(line: str) -> List[str]:
+    cells = line.strip()
+    if cells.startswith("|"):
+        cells = cells[1:]
+    if cells.endswith("|"):
+        cells = cells[:-1]
+    return [cell.strip() for cell in cells.split("|")]
+
+
+def _add_table(document, rows: List[List[str]]) -> None:
+    rows = [row for row in rows if not all(_ALIGN_CELL_RE.match(cell) for cell in row if cell)]
+    if not rows:
+        return
+    width = max(len(row) for row in rows)
+    table = document.add_table(rows=len(rows), cols=width)
+    try:
+        table.style = "Table Grid"
+    except (KeyError, ValueError):
+        pass
+    for row_index, row in enumerate(rows):
+        cells = table.rows[row_index].cells
+        for column, text in enumerate(row):
+            _add_inline(cells[column].paragraphs[0], text, bold=row_index == 0)
+
+
+def _add_list_item(document, text: str, style: str, marker: str) -> None:
+    if any(candidate.name == style for candidate in document.styles):
+        paragraph = document.add_paragraph(style=style)
+    else:
+        paragraph = document.add_paragraph()
+        paragraph.add_run(marker)
+    _add_inline(paragraph, text)
+
+
+def _add_inline(paragraph, text: str, bold: bool = False) -> None:
+    """Add runs for **bold**, *italic* and `code` spans; <br> becomes a line break."""
+    for part_index, part in enumerate(_BREAK_RE.split(text)):
+        if part_index:
+            paragraph.add_run().add_break()
+        for token in _INLINE_RE.split(part):
+            if not token:
+                continue
+            if (token.startswith("**") and token.endswith("**")) or (token.startswith("__") and token.endswith("__")):
+                paragraph.add_run(token[2:-2]).bold = True
+            elif token.startswith("`") and token.endswith("`"):
+                run = paragraph.add_run(token[1:-1])
+                run.font.name = "Courier New"
+                run.bold = bold or None
+            elif token.startswith("*") and token.endswith("*") and len(token) > 2:
+                run = paragraph.add_run(token[1:-1])
+                run.italic = True
+                run.bold = bold or None
+            else:
+                paragraph.add_run(token).bold = bold or None
@@ -0,0 +1,78 @@
+"""Measure cold-start import time with `python -X importtime`.
+
+Usage:
+    python scripts/importtime_benchmark.py [module ...] [--top N] [--repeat N]
+
+Each module is imported in a fresh interpreter. The script prints the total
+cumulative import time (best of `--repeat` runs) and the slowest top-level
+packages, and flags heavy optional dependencies that were imported eagerly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_MODULES = [
+    "processdesignagents.graph.process_design_graph",
+    "cli.main",
+]
+# Dependencies that must only load when the feature that needs them is used.
+LAZY_DEPENDENCIES = [
+    "CoolProp",
+    "langchain_openai",
+    "langchain_google_genai",
+    "IPython",
+    "docx",
+    "pypandoc",
+    "sympy",
+]
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def measure(module: str) -> tuple[int, dict[str, int]]:
+    """Return (total cumulative µs, {module: cumulative µs}) for one cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2))
+    return cumulative.get(module, 0), cumulative
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    eager_found = False
+    for module in args.modules:
+        runs = [measure(module) for _ in range(max(1, args.repeat))]
+        total, cumulative = min(runs, key=lambda run: run[0])
+        top_level = {name: value for name, value in cumulative.items() if "." not in name}
+        print(f"{module}: {total / 1e6:.3f} s (best of {len(runs)})")
+        for name, value in sorted(top_level.items(), key=lambda item: -item[1])[: args.top]:
+            print(f"    {value / 1e6:8.3f} s  {name}")
+        eager = [name for name in LAZY_DEPENDENCIES if name in cumulative]
+        if eager:
+            eager_found = True
+            print(f"    eagerly imported: {', '.join(eager)}")
+    return 1 if eager_found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.absorption import kremser_design, kremser_stages
+from processdesignagents.sizing_tools.preliminary import prelim_absorption_column_sizing
+
+
+def test_kremser_stages_match_closed_form():
+    """A = 1.4 with 90% removal needs ln(3.571)/ln(1.4) stages; A = 1 uses the limiting form."""
+    np.testing.assert_allclose(kremser_stages(1.4, 0.01, 0.001, 0.0), np.log(10 * (1 - 1 / 1.4) + 1 / 1.4) / np.log(1.4))
+    np.testing.assert_allclose(kremser_stages(1.0, 0.01, 0.001, 0.0), 9.0)
+    assert np.isnan(kremser_stages(1.4, 0.01, 0.001, 0.002))
+
+
+def test_solvent_rate_sweep_is_vectorized():
+    """An L/G sweep is one call: more solvent means fewer stages and a wider column."""
+    factors = np.linspace(1.1, 3.0, 200)
+    sweep = kremser_design(1000.0, 0.12, 0.012, 0.5, lg_factor=factors)
+    single = kremser_design(1000.0, 0.12, 0.012, 0.5, lg_factor=factors[50])
+    np.testing.assert_allclose(sweep["theoretical_stages"][50], single["theoretical_stages"][0])
+    assert (np.diff(sweep["theoretical_stages"]) < 0).all()
+    assert (np.diff(sweep["column_diameter_m"]) > 0).all()
+    np.testing.assert_allclose(sweep["lg_ratio"] / sweep["minimum_lg_ratio"], factors)
+    assert np.isnan(kremser_design(1000.0, 0.12, 0.012, 0.5, lg_factor=0.9)["theoretical_stages"]).all()
+
+
+def test_preliminary_absorber_requires_equilibrium_data():
+    """The sizing tool converts Henry constants and refuses to guess equilibrium data."""
+    result = prelim_absorption_column_sizing(100.0, 0.01, 0.001, "water", henry_constant=3000.0, design_pressure_barg=9.0)
+    assert result.ok
+    assert abs(result["operating_lg_ratio"] / result["minimum_lg_ratio"] - 1.5) < 1e-4
+    assert result["column_diameter_mm"] > 0 and result["pressure_drop_total_kpa"] > 0
+    assert "Equilibrium data required" in prelim_absorption_column_sizing(100.0, 0.01, 0.001).error
+
+
+def test_invalid_gas_density_is_an_error_not_nan():
+    """Full vacuum, zero gas MW or sub-absolute-zero temperature give an error, never a NaN diameter."""
+    args = (100.0, 0.01, 0.001, "water")
+    for bad in (dict(design_pressure_barg=-1.5), dict(gas_molecular_weight_kg_kmol=0.0), dict(temperature_c=-300.0)):
+        result = prelim_absorption_column_sizing(*args, k_value=0.5, **bad)
+        assert not result.ok and "NaN" not in result.to_json()
+    design = kremser_design(100.0, 0.01, 0.001, 0.5, pressure_pa=0.0)
+    assert np.isnan(design["theoretical_stages"]).all() and np.isnan(design["column_diameter_m"]).all()
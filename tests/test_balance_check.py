@@ -0,0 +1,85 @@
+import pytest
+
+from processdesignagents.agents.utils.balance_check import TOTAL, check_flowsheet_balance
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+
+
+def _stream(stream_id, mass_flow, water=None):
+    stream = {"id": stream_id, "properties": {"mass_flow": {"value": mass_flow, "unit": "kg/h"}}}
+    if water is not None:
+        stream["compositions"] = {
+            "m_Water": {"value": water, "unit": "mass fraction"},
+            "m_Ethanol": {"value": 1.0 - water, "unit": "mass fraction"},
+        }
+    return stream
+
+
+def _flowsheet(streams, equipments):
+    return Flowsheet.from_dict({"equipments": equipments, "streams": streams})
+
+
+def test_balanced_splitter_passes():
+    """A splitter whose outlets add up to the inlet has no imbalance."""
+    flowsheet = _flowsheet(
+        [_stream("1", 1000.0, 0.5), _stream("2", 600.0, 0.5), _stream("3", 400.0, 0.5)],
+        [{"id": "T-101", "category": "Splitter", "streams_in": ["1"], "streams_out": ["2", "3"]}],
+    )
+    report = check_flowsheet_balance(flowsheet)
+    assert report.ok
+    assert report.summary() == "Mass balance closes for every unit."
+
+
+def test_imbalances_are_ranked_by_magnitude():
+    """Total and component residuals are reported, largest first."""
+    flowsheet = _flowsheet(
+        [
+            _stream("1", 1000.0, 0.5),
+            _stream("2", 900.0, 0.5),
+            _stream("3", 1000.0, 0.9),
+            _stream("4", 1000.0, 0.5),
+        ],
+        [
+            {"id": "E-101", "category": "Heat Exchanger", "streams_in": ["1"], "streams_out": ["2"]},
+            {"id": "V-101", "category": "Vessel", "streams_in": ["2"], "streams_out": ["3"]},
+            {"id": "R-101", "category": "Reactor", "streams_in": ["3"], "streams_out": ["4"]},
+        ],
+    )
+    report = check_flowsheet_balance(flowsheet)
+    ranked = [(item.unit_id, item.component) for item in report.imbalances]
+    assert ranked[0] == ("V-101", "Water")
+    assert ("E-101", TOTAL) in ranked and ("V-101", TOTAL) in ranked
+    assert all(unit_id != "R-101" for unit_id, _ in ranked)
+    assert report.imbalances[0].residual_kg_h == pytest.approx(450.0 - 900.0)
+
+
+def test_missing_flows_are_reported_as_incomplete():
+    """Units touching unknown or flowless streams are not flagged as imbalanced."""
+    flowsheet = _flowsheet(
+        [_stream("1", 1000.0), {"id": "2", "properties": {}}],
+        [{"id": "P-101", "category": "Pump", "streams_in": ["1", "9"], "streams_out": ["2"]}],
+    )
+    report = check_flowsheet_balance(flowsheet)
+    assert report.ok
+    assert report.incomplete_units == ["P-101"]
+    assert report.unknown_streams == ["9"]
+
+
+def test_unknown_or_unconvertible_streams_skip_the_unit():
+    """A unit with an unknown stream ID or an unconvertible flow is incomplete, not imbalanced."""
+    flowsheet = _flowsheet(
+        [
+            _stream("1", 1000.0),
+            _stream("2", 400.0),
+            {"id": "3", "properties": {"mass_flow": {"value": 1000.0, "unit": "kg/hr"}}},
+            _stream("4", 10.0),
+        ],
+        [
+            {"id": "T-101", "category": "Splitter", "streams_in": ["1"], "streams_out": ["2", "9"]},
+            {"id": "P-101", "category": "Pump", "streams_in": ["3"], "streams_out": ["4"]},
+        ],
+    )
+    report = check_flowsheet_balance(flowsheet)
+    assert report.ok
+    assert report.incomplete_units == ["T-101", "P-101"]
+    assert report.unknown_streams == ["9"]
+    assert report.unconverted_streams == ["3"]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from processdesignagents.sizing_tools.batch import rows_from_columns, size_batch, size_batch_fields
+from processdesignagents.sizing_tools.config import get_config, set_config
+from processdesignagents.utils.process_pool import shard_ranges, shutdown_process_pool
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stop_workers():
+    yield
+    shutdown_process_pool()
+
+
+def _pump_rows(count):
+    return rows_from_columns(
+        mass_flow_kg_h=np.linspace(1e3, 1e5, count).tolist(),
+        inlet_pressure_barg=[0.0] * count,
+        outlet_pressure_barg=[4.0] * count,
+        fluid_density_kg_m3=[1000.0] * count,
+    )
+
+
+def test_shard_ranges_cover_every_row_once():
+    """Shards are contiguous, non-empty and cover the whole range."""
+    shards = shard_ranges(10, 4)
+    assert shards[0][0] == 0 and shards[-1][1] == 10
+    assert all(stop > start for start, stop in shards)
+    assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+    assert shard_ranges(2, 8) == [(0, 1), (1, 2)]
+
+
+def test_pool_results_match_serial_results():
+    """Sharded sizing batches return the same results, in order, as the serial path."""
+    rows = _pump_rows(40)
+    fields = ["motor_power_kw", "total_head_m", "pump_type"]
+    serial = size_batch_fields("pump_sizing", rows, fields)
+    pooled = size_batch_fields("pump_sizing", rows, fields, max_workers=2, min_parallel=1)
+    np.testing.assert_allclose(pooled[:, :2], serial[:, :2])
+    assert np.isnan(pooled[:, 2]).all()
+
+    results = size_batch("pump_sizing", rows, max_workers=2, min_parallel=1)
+    assert results == size_batch("pump_sizing", rows)
+
+
+def test_pool_workers_follow_parent_config():
+    """Routes set with set_config in the parent are used by the spawned workers."""
+    original = get_config()["sizing_tool_methods"]
+    # Listing the vendor twice makes every call run both and attach an alternative.
+    set_config({"sizing_tool_methods": {**original, "pump_sizing": "preliminary, preliminary"}})
+    try:
+        rows = _pump_rows(8)
+        pooled = size_batch("pump_sizing", rows, max_workers=2, min_parallel=1)
+        assert all(len(result.alternatives) == 1 for result in pooled)
+        assert pooled == size_batch("pump_sizing", rows)
+    finally:
+        set_config({"sizing_tool_methods": original})
+
+
+def test_property_batch_uses_shared_results():
+    """CoolProp batches give identical arrays serially and across workers."""
+    pytest.importorskip("CoolProp")
+    from processdesignagents.agents.designers.tools.property_batch import flash_properties_batch
+
+    temperatures = np.linspace(300.0, 350.0, 6)
+    pressures = np.full(6, 2e5)
+    serial = flash_properties_batch(["water"], temperatures, pressures, outputs=("Dmass", "Hmass"))
+    assert serial.shape == (6, 2)
+    assert 950.0 < serial[0, 0] < 1000.0
+    pooled = flash_properties_batch(
+        ["water"], temperatures, pressures, outputs=("Dmass", "Hmass"), max_workers=2, min_parallel=1
+    )
+    np.testing.assert_allclose(pooled, serial)
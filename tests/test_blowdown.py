@@ -0,0 +1,51 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.blowdown import simulate_blowdown, size_blowdown_orifice
+from processdesignagents.sizing_tools.preliminary import prelim_blowdown_valve_sizing
+
+
+def test_adiabatic_choked_blowdown_matches_closed_form():
+    """While choked, an isentropic vessel follows (P/P0)^(-(k-1)/2k) - 1 = (k-1)/2 t/tau."""
+    k, molecular_weight, t0, volume, area = 1.4, 28.0, 300.0, 10.0, 1e-4
+    p0, pf = 50e5, 10e5
+    sound_speed = np.sqrt(k * 8314.462618 * t0 / molecular_weight)
+    gamma = (2.0 / (k + 1.0)) ** ((k + 1.0) / (2.0 * (k - 1.0)))
+    tau = volume / (0.85 * area * sound_speed * gamma)
+    expected = 2.0 * tau / (k - 1.0) * ((pf / p0) ** (-(k - 1.0) / (2.0 * k)) - 1.0)
+    result = simulate_blowdown(area, volume, p0, pf, t0, molecular_weight, k)
+    np.testing.assert_allclose(result["time_s"], expected, rtol=1e-4)
+    np.testing.assert_allclose(result["minimum_temperature_k"], t0 * (pf / p0) ** ((k - 1.0) / k), rtol=1e-4)
+
+
+def test_sized_orifice_is_the_smallest_meeting_the_target():
+    """Scenarios size in one call; the chosen orifice meets the time and a 5% smaller one does not."""
+    design = size_blowdown_orifice([20.0, 50.0], 51e5, 7.9e5, 900.0, heat_input_kw=[0.0, 500.0])
+    assert (design["blowdown_time_s"] <= 900.0).all()
+    smaller = simulate_blowdown(np.pi / 4 * (0.95 * design["orifice_diameter_mm"] / 1000.0) ** 2,
+                                [20.0, 50.0], 51e5, 7.9e5, heat_input_kw=[0.0, 500.0])
+    assert (smaller["time_s"] > 900.0).all()
+    assert np.isnan(size_blowdown_orifice(20.0, 51e5, 7.9e5, 0.1)["orifice_diameter_mm"]).all()
+
+
+def test_preliminary_blowdown_reports_orifice_and_cold_temperature():
+    """The sizing tool reports the restriction orifice and cooling, more orifice under fire, and refuses liquids."""
+    result = prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9)
+    fire = prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9, heat_input_kw=300.0)
+    assert result["discharge_time_minutes"] <= 15.0
+    assert result["minimum_gas_temperature_c"] < 0.0
+    assert fire["restriction_orifice_diameter_mm"] > result["restriction_orifice_diameter_mm"]
+    assert result["blowdown_line_diameter_mm"] >= result["valve_outlet_diameter_mm"]
+    assert not prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9, fluid_type="water").ok
+
+
+def test_preliminary_blowdown_rejects_liquid_densities():
+    """Liquids are refused even with a density, and a density implying a liquid-like MW is an error."""
+    for fluid, density in (("water", 998.0), ("crude oil", 850.0)):
+        result = prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9, fluid_type=fluid,
+                                              fluid_density_kg_m3=density)
+        assert not result.ok and "liquid" in result["error"]
+    heavy = prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9, fluid_type="process gas",
+                                         fluid_density_kg_m3=850.0)
+    assert not heavy.ok and heavy["molecular_weight"] > 200.0
+    assert prelim_blowdown_valve_sizing("V-101", 20.0, 15.0, 50.0, 6.9, fluid_type="boil-off gas",
+                                        fluid_density_kg_m3=40.0).ok
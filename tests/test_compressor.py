@@ -0,0 +1,51 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.compressor import compressor_design
+from processdesignagents.sizing_tools.preliminary import prelim_compressor_sizing
+
+
+def test_two_stage_split_matches_brute_force_minimum():
+    """A hotter first-stage suction and intercooler losses shift the optimum; the closed form still finds it."""
+    kwargs = dict(inlet_temperature_k=330.0, intercooler_outlet_temperature_k=310.0, intercooler_pressure_drop_fraction=0.03)
+    design = compressor_design(2.0, 1e5, 12e5, max_stages=2, max_stage_ratio=10.0,
+                               max_discharge_temperature_k=600.0, **kwargs)
+    assert design["number_of_stages"][0] == 2
+    exponent = 0.4 / (1.4 * 0.8)
+    first = np.linspace(2.0, 6.0, 20001)
+    second = 12.0 / (first * 0.97)
+    power = 330.0 * (first**exponent - 1.0) + 310.0 * (second**exponent - 1.0)
+    np.testing.assert_allclose(design["stage_pressure_ratio"][0, 0], first[np.argmin(power)], rtol=1e-3)
+    np.testing.assert_allclose(design["stage_discharge_pressure_pa"][0, 1], 12e5)
+    temperatures = design["stage_discharge_temperature_k"][0, :2]
+    np.testing.assert_allclose(temperatures[0], temperatures[1])
+
+
+def test_stage_count_respects_temperature_limit_across_a_batch():
+    """One call stages many cases; tighter limits need more stages and impossible ones come back NaN."""
+    limits = np.array([500.0, 420.0, 380.0, 300.0])
+    design = compressor_design(1.0, 1e5, 30e5, 300.0, max_discharge_temperature_k=limits)
+    stages = design["number_of_stages"]
+    assert np.isnan(stages[-1]) and (np.diff(stages[:-1]) >= 0).all()
+    assert (design["max_discharge_temperature_k"][:-1] <= limits[:-1]).all()
+    single = compressor_design(1.0, 1e5, 30e5, 300.0, max_discharge_temperature_k=limits[1])
+    np.testing.assert_allclose(single["total_power_kw"], design["total_power_kw"][1])
+
+
+def test_preliminary_compressor_uses_real_gas_properties():
+    """Component lists are flashed in CoolProp; a single casing over the temperature limit is refused."""
+    result = prelim_compressor_sizing(100.0, 100.0, 5000.0, components=["methane", "ethane"], mole_fractions=[0.9, 0.1])
+    assert 17.0 < result["molecular_weight"] < 18.0
+    assert result["compressibility"] < 1.0
+    assert result["discharge_temperature_c"] <= 150.0
+    assert len(result["intercooler_duties_kw"]) == result["number_of_stages"] - 1
+    assert result["stage_discharge_pressures_kpa"][-1] == 5000.0
+    assert not prelim_compressor_sizing(100.0, 100.0, 300.0, intercooling=False).ok
+
+
+def test_fewest_feasible_stages_are_chosen():
+    """The stage count is the smallest one meeting the limits, not the lowest-power one."""
+    design = compressor_design(1.0, 1e5, 30e5, 300.0, max_discharge_temperature_k=420.0)
+    feasible = np.isfinite(design["power_by_stage_count_kw"][0])
+    assert design["number_of_stages"][0] == np.argmax(feasible) + 1
+    assert design["number_of_stages"][0] < 8
+    assert design["max_discharge_temperature_k"][0] <= 420.0
@@ -0,0 +1,67 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.distillation import fug_design, underwood_roots
+from processdesignagents.sizing_tools.preliminary import prelim_distillation_column_sizing
+
+ALPHA = [4.0, 2.5, 1.6, 1.0, 0.6]
+FEED = [0.1, 0.2, 0.3, 0.25, 0.15]
+
+
+def test_underwood_roots_solve_the_feed_equation_between_volatilities():
+    """One root per volatility interval, each zeroing the Underwood equation."""
+    alpha = np.array([ALPHA, ALPHA])
+    z = np.array([FEED, FEED])
+    q = np.array([1.0, 0.4])
+    roots = underwood_roots(alpha, z, q)
+    ordered = np.sort(alpha, axis=1)
+    assert ((roots > ordered[:, :-1]) & (roots < ordered[:, 1:])).all()
+    residual = (alpha[:, None, :] * z[:, None, :] / (alpha[:, None, :] - roots[..., None])).sum(-1) - (1 - q)[:, None]
+    np.testing.assert_allclose(residual, 0.0, atol=1e-8)
+
+
+def test_binary_minimum_reflux_matches_closed_form():
+    """For a binary saturated-liquid feed, Underwood reduces to the analytic Rmin."""
+    design = fug_design([2.5, 1.0], [0.5, 0.5], 100.0, 0, 1, 0.98, 0.98)
+    xd = design["distillate_composition"][0, 0]
+    expected = (xd / 0.5 - 2.5 * (1 - xd) / 0.5) / 1.5
+    np.testing.assert_allclose(design["minimum_reflux_ratio"], expected, rtol=1e-9)
+    np.testing.assert_allclose(design["distillate_kmol_h"], 50.0)
+
+
+def test_reflux_trade_study_is_vectorized():
+    """A reflux sweep is one call; rows match single-column runs and stages fall with reflux."""
+    factors = np.linspace(1.05, 3.0, 50)
+    sweep = fug_design(ALPHA, FEED, 100.0, 2, 3, 0.95, 0.95, reflux_factor=factors)
+    single = fug_design(ALPHA, FEED, 100.0, 2, 3, 0.95, 0.95, reflux_factor=factors[7])
+    assert sweep["theoretical_stages"].shape == (50,)
+    np.testing.assert_allclose(sweep["theoretical_stages"][7], single["theoretical_stages"][0])
+    assert (np.diff(sweep["theoretical_stages"]) < 0).all()
+    assert (np.diff(sweep["column_diameter_m"]) > 0).all()
+    assert (sweep["theoretical_stages"] > sweep["minimum_stages"]).all()
+
+
+def test_preliminary_column_sizing_uses_fug():
+    """The sizing tool reports FUG results and rejects infeasible specifications."""
+    result = prelim_distillation_column_sizing(100.0, 80.0, 0.98, 0.02, 0.5, 2.5)
+    assert result.ok
+    assert result["minimum_reflux_ratio"] == 1.24
+    assert result["minimum_stages"] < result["theoretical_stages"] < 2.5 * result["minimum_stages"]
+    assert result["column_diameter_mm"] > 0 and result["reboiler_duty_kw"] > 0
+    assert not prelim_distillation_column_sizing(100.0, 80.0, 0.98, 0.02, 0.5, 2.5, reflux_ratio_factor=0.9).ok
+
+
+def test_preliminary_column_sizing_rejects_invalid_hydraulics():
+    """A pressure below full vacuum or a liquid lighter than its vapour is an error, not a NaN diameter."""
+    assert not prelim_distillation_column_sizing(100.0, 80.0, 0.98, 0.02, 0.5, 2.5, design_pressure_barg=-1.5).ok
+    assert not prelim_distillation_column_sizing(100.0, 80.0, 0.98, 0.02, 0.5, 2.5, liquid_density_kg_m3=1.0).ok
+    design = fug_design([2.5, 1.0], [0.5, 0.5], 100.0, 0, 1, 0.98, 0.98, liquid_density_kg_m3=1.0)
+    assert np.isnan(design["theoretical_stages"]).all() and np.isnan(design["column_diameter_m"]).all()
+
+
+def test_preliminary_column_sizing_operating_pressure():
+    """A lower operating pressure than the design pressure gives a larger diameter."""
+    design_basis = prelim_distillation_column_sizing(100.0, 80.0, 0.98, 0.02, 0.5, 2.5, design_pressure_barg=3.5)
+    operating = prelim_distillation_column_sizing(
+        100.0, 80.0, 0.98, 0.02, 0.5, 2.5, design_pressure_barg=3.5, operating_pressure_barg=0.5
+    )
+    assert operating["column_diameter_mm"] > design_basis["column_diameter_mm"]
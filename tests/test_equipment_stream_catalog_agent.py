@@ -0,0 +1,22 @@
+import json
+from types import SimpleNamespace
+
+from processdesignagents.agents.designers import equipment_stream_catalog_agent as catalog
+
+
+def test_catalog_agent_reprompts_on_duplicate_ids(monkeypatch):
+    """A catalog with a repeated stream ID is a failed attempt, not a crash."""
+    duplicated = {
+        "equipments": [{"id": "P-101", "streams_in": ["1001"], "streams_out": ["1002"]}],
+        "streams": [{"id": "1001"}, {"id": "1001"}],
+    }
+    fixed = {**duplicated, "streams": [{"id": "1001"}, {"id": "1002"}]}
+    replies = [json.dumps(duplicated), json.dumps(fixed)]
+    monkeypatch.setattr(
+        catalog, "get_json_str_from_llm", lambda llm, prompt, state: (SimpleNamespace(content=""), replies.pop(0))
+    )
+    agent = catalog.create_equipment_stream_catalog_agent(SimpleNamespace(temperature=None))
+    result = agent({"flowsheet_description": "", "design_basis": "", "process_requirements": ""})
+    assert not replies
+    assert list(result["flowsheet"].streams) == ["1001", "1002"]
+    assert result["flowsheet_source"] == "equipment_and_stream_template"
@@ -0,0 +1,38 @@
+from processdesignagents.agents.utils.equipment_stream_markdown import (
+    clear_markdown_cache,
+    equipments_and_streams_dict_to_markdown,
+    get_markdown_cache_stats,
+)
+
+
+def _payload(count, temperature=25.0):
+    streams = [
+        {
+            "id": str(1000 + index),
+            "properties": {"temperature": {"value": temperature if index == 0 else 40.0, "unit": "°C"}},
+            "compositions": {"Water": {"value": 1.0, "unit": "molar fraction"}},
+        }
+        for index in range(count)
+    ]
+    return {"equipments": [{"id": "P-101", "streams_in": ["1000"]}], "streams": streams}
+
+
+def test_rendering_is_memoized_by_content():
+    """An equal payload (not the same object) is served from the cache."""
+    clear_markdown_cache()
+    first = equipments_and_streams_dict_to_markdown(_payload(10))
+    second = equipments_and_streams_dict_to_markdown(_payload(10))
+    assert first == second
+    stats = get_markdown_cache_stats()
+    assert stats["payload_hits"] == 1 and stats["chunk_misses"] == 2
+
+
+def test_only_changed_chunks_are_rerendered():
+    """Changing one stream rebuilds only the 8-stream table that holds it."""
+    clear_markdown_cache()
+    _, _, before = equipments_and_streams_dict_to_markdown(_payload(20))
+    _, _, after = equipments_and_streams_dict_to_markdown(_payload(20, temperature=30.0))
+    stats = get_markdown_cache_stats()
+    assert stats["chunk_misses"] == 4 and stats["chunk_hits"] == 2
+    assert "25.0 °C" in before and "30.0 °C" in after
+    assert before.split("\n\n")[1:] == after.split("\n\n")[1:]
@@ -0,0 +1,64 @@
+import pytest
+
+from processdesignagents.agents.utils.flowsheet import Flowsheet, load_flowsheet
+
+PAYLOAD = {
+    "equipments": [{"id": "P-101", "category": "Pump", "streams_in": ["1001"], "streams_out": ["1002"]}],
+    "streams": [{"id": "1001", "from": "Feed", "to": "P-101"}, {"id": "1002", "from": "P-101", "to": "Product"}],
+    "notes_and_assumptions": ["Pump duty TBD"],
+}
+
+
+def test_flowsheet_round_trip():
+    """Records are indexed by ID and serialize back to the same JSON contract."""
+    flowsheet = Flowsheet.from_dict(PAYLOAD)
+    assert flowsheet.streams["1002"]["from"] == "P-101"
+    assert flowsheet.to_dict() == PAYLOAD
+    assert Flowsheet.from_json(flowsheet.to_json()) == flowsheet
+
+
+def test_flowsheet_replaces_lists_without_touching_the_other():
+    """with_streams/with_equipments return copies with only one list replaced."""
+    flowsheet = Flowsheet.from_dict(PAYLOAD)
+    updated = flowsheet.with_streams([{"id": "1001", "properties": {}}])
+    assert list(updated.streams) == ["1001"]
+    assert updated.equipments == flowsheet.equipments
+    assert len(flowsheet.streams) == 2
+
+
+def test_load_flowsheet_prefers_state_object():
+    """The parsed object is used when present, the JSON string otherwise."""
+    flowsheet = Flowsheet.from_dict(PAYLOAD)
+    state = {
+        "flowsheet": flowsheet,
+        "flowsheet_source": "equipment_and_stream_results",
+        "equipment_and_stream_results": "{}",
+    }
+    assert load_flowsheet(state) is flowsheet
+    restored = load_flowsheet({"equipment_and_stream_results": flowsheet.to_json()})
+    assert restored == flowsheet
+
+
+def test_load_flowsheet_honours_key():
+    """A state object built from another key is not returned for this one."""
+    template = Flowsheet.from_dict({"streams": [{"id": "1001"}]})
+    state = {
+        "flowsheet": Flowsheet.from_dict(PAYLOAD),
+        "flowsheet_source": "equipment_and_stream_results",
+        "equipment_and_stream_template": template.to_json(),
+    }
+    assert load_flowsheet(state, "equipment_and_stream_template") == template
+
+
+def test_flowsheet_rejects_invalid_payload():
+    """Payloads without equipment or stream lists raise ValueError."""
+    with pytest.raises(ValueError):
+        Flowsheet.from_dict({"foo": []})
+    with pytest.raises(ValueError):
+        Flowsheet.from_dict({"streams": "1001"})
+
+
+def test_flowsheet_rejects_duplicate_ids():
+    """Two records with the same ID raise instead of one being dropped."""
+    with pytest.raises(ValueError, match="1001"):
+        Flowsheet.from_dict({"streams": [{"id": "1001"}, {"id": "1001", "to": "P-101"}]})
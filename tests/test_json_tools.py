@@ -0,0 +1,81 @@
+import pytest
+
+from processdesignagents.agents.utils.json_tools import (
+    JsonStreamScanner,
+    extract_first_json_document,
+    get_json_parse_stats,
+    parse_llm_json,
+)
+
+
+def test_parse_llm_json_fast_tier():
+    """Valid JSON is parsed without touching the fallbacks."""
+    payload, tier = parse_llm_json('{"streams": [{"id": "1001"}]}', return_tier=True)
+    assert payload == {"streams": [{"id": "1001"}]}
+    assert tier == "fast"
+
+
+def test_parse_llm_json_extract_tier():
+    """Fenced JSON surrounded by prose is handled by the extractor."""
+    raw = 'Here you go:\n```json\n{"equipments": []}\n```'
+    payload, tier = parse_llm_json(raw, return_tier=True)
+    assert payload == {"equipments": []}
+    assert tier == "extract"
+
+
+def test_parse_llm_json_repair_tier():
+    """Broken JSON falls back to json_repair and the tier is counted."""
+    before = get_json_parse_stats().get("repair", 0)
+    payload, tier = parse_llm_json('{"a": 1, "b": [1, 2', return_tier=True)
+    assert payload == {"a": 1, "b": [1, 2]}
+    assert tier == "repair"
+    assert get_json_parse_stats()["repair"] == before + 1
+
+
+def test_parse_llm_json_no_json():
+    """Plain text without any JSON raises ValueError."""
+    with pytest.raises(ValueError):
+        parse_llm_json("")
+
+
+def test_json_stream_scanner_emits_document_when_closed():
+    """The scanner returns a document as soon as its closing bracket arrives."""
+    scanner = JsonStreamScanner()
+    assert scanner.feed('Result: {"streams": [{"id": "10') == []
+    assert scanner.feed('01", "note": "a } brace"}') == []
+    documents = scanner.feed(']} trailing text')
+    assert documents[0][1] == {"streams": [{"id": "1001", "note": "a } brace"}]}
+
+
+def test_extract_first_json_document_skips_prose_braces():
+    """Braces in prose are skipped and nested documents are still found."""
+    _, payload = extract_first_json_document('Use {x} here: {"a": 1}')
+    assert payload == {"a": 1}
+    _, payload = extract_first_json_document('{ note: {"b": 2} }')
+    assert payload == {"b": 2}
+
+
+def test_json_stream_scanner_survives_deep_or_unbalanced_input():
+    """Deeply nested or unbalanced text yields no document instead of raising."""
+    for raw in ("[" * 3000, '{"' + "a{" * 2000, "{" * 5000 + '"a": 1'):
+        assert extract_first_json_document(raw)[1] is None
+    with pytest.raises(ValueError):
+        parse_llm_json("[" * 3000)
+
+
+def test_parse_llm_json_truncated_payload_is_repaired_whole():
+    """A truncated reply is repaired as a whole, not cut down to an inner object."""
+    raw = '{"streams": [{"id": "1001", "name": "Feed"}, {"id": "1002", "name": "Prod'
+    payload, tier = parse_llm_json(raw, return_tier=True)
+    assert tier == "repair"
+    assert [stream["id"] for stream in payload["streams"]] == ["1001", "1002"]
+
+
+def test_parse_llm_json_keeps_escapes_in_fenced_json():
+    """Valid escapes in fenced JSON decode to the real characters, not literal backslashes."""
+    raw = '```json\n{"note": "line1\\nThe next", "t": "a\\tb"}\n```'
+    payload, tier = parse_llm_json(raw, return_tier=True)
+    assert tier == "extract"
+    assert payload == {"note": "line1\nThe next", "t": "a\tb"}
+    payload = parse_llm_json('```json\n{"path": "C:\\data"}\n```')
+    assert payload == {"path": "C:\\data"}
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from processdesignagents.utils.lazy_import import LazyModule, lazy_import
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ["CoolProp", "langchain_openai", "langchain_google_genai", "IPython", "docx", "pypandoc", "sympy"]
+
+
+def test_graph_import_does_not_load_optional_dependencies():
+    """Provider SDKs, CoolProp, export libraries and agent modules load on first use only."""
+    code = (
+        "import sys, processdesignagents.graph.process_design_graph\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+        "print('processdesignagents.agents.designers.equipment_sizing_agent' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.split("\n")[:2] == ["[]", "False"]
+
+
+def test_lazy_import_loads_on_attribute_access():
+    """A LazyModule imports the real module the first time an attribute is read."""
+    module = LazyModule("colorsys")
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0)[0] == 0.0
+    assert lazy_import("sys") is sys
@@ -0,0 +1,84 @@
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+from processdesignagents.agents.utils.presizing import presize_equipment
+
+
+def _stream(stream_id, mass_flow, pressure, pressure_unit="barg", density=800.0, phase="Liquid"):
+    properties = {
+        "mass_flow": {"value": mass_flow, "unit": "kg/h"},
+        "pressure": {"value": pressure, "unit": pressure_unit},
+    }
+    if density is not None:
+        properties["density"] = {"value": density, "unit": "kg/m3"}
+    return {"id": stream_id, "phase": phase, "properties": properties}
+
+
+def _flowsheet(equipments, streams):
+    return Flowsheet.from_dict({"equipments": equipments, "streams": streams})
+
+
+def _parameters(equipment):
+    return {item["name"]: item["quantity"] for item in equipment["sizing_parameters"]}
+
+
+def test_pump_with_complete_streams_is_sized_without_llm():
+    """A pump with flow, density and both pressures is sized; the template entries are filled in."""
+    flowsheet = _flowsheet(
+        [{
+            "id": "P-101", "category": "Pump", "type": "Centrifugal pump",
+            "streams_in": ["1"], "streams_out": ["2"],
+            "sizing_parameters": [{"name": "head", "quantity": {"value": None, "unit": "m"}}],
+        }],
+        [_stream("1", 8000.0, 1.0), _stream("2", 8000.0, 501.325, "kPa")],
+    )
+    report = presize_equipment(flowsheet)
+    assert report.complete and report.sized_ids == ["P-101"]
+    parameters = _parameters(report.flowsheet.equipments["P-101"])
+    assert parameters["flow_rate"] == {"value": 10.0, "unit": "m³/h"}
+    assert parameters["discharge_pressure"]["value"] == 4.0
+    assert abs(parameters["head"]["value"] - 3e5 / (800.0 * 9.81)) < 0.01
+    assert len(report.flowsheet.equipments["P-101"]["sizing_parameters"]) == 8
+    # The input flowsheet is left untouched.
+    assert flowsheet.equipments["P-101"]["sizing_parameters"][0]["quantity"]["value"] is None
+
+
+def test_incomplete_or_ambiguous_equipment_is_left_for_llm():
+    """Missing density, unknown units, gas service and unmapped categories stay pending."""
+    flowsheet = _flowsheet(
+        [
+            {"id": "P-1", "category": "Pump", "streams_in": ["1"], "streams_out": ["2"]},
+            {"id": "P-2", "category": "Pump", "streams_in": ["3"], "streams_out": ["4"]},
+            {"id": "P-3", "category": "Pump", "streams_in": ["5"], "streams_out": ["6"]},
+            {"id": "V-1", "category": "Vessel", "type": "Surge drum", "streams_in": ["6"], "streams_out": ["7"]},
+            {"id": "E-1", "category": "Heat Exchanger", "streams_in": ["1"], "streams_out": ["2"]},
+        ],
+        [
+            _stream("1", 1000.0, 1.0, density=None), _stream("2", 1000.0, 3.0, density=None),
+            _stream("3", 1000.0, 1.0, "kg/cm2g"), _stream("4", 1000.0, 3.0),
+            _stream("5", 1000.0, 0.5, phase="Vapor"), _stream("6", 1000.0, 2.0),
+            _stream("7", 1000.0, 2.0),
+        ],
+    )
+    report = presize_equipment(flowsheet)
+    assert report.sized_ids == ["V-1"]
+    assert report.pending_ids == ["P-1", "P-2", "P-3", "E-1"]
+    assert list(report.pending_flowsheet().equipments) == report.pending_ids
+    assert _parameters(report.flowsheet.equipments["V-1"])["volume"]["unit"] == "m³"
+
+
+def test_merge_keeps_order_and_deterministic_results():
+    """LLM results fill pending items only; pre-sized items and the original order are kept."""
+    flowsheet = _flowsheet(
+        [
+            {"id": "E-1", "category": "Heat Exchanger", "streams_in": ["1"], "streams_out": ["2"]},
+            {"id": "P-1", "category": "Pump", "streams_in": ["1"], "streams_out": ["2"]},
+        ],
+        [_stream("1", 1000.0, 0.0), _stream("2", 1000.0, 2.0)],
+    )
+    report = presize_equipment(flowsheet)
+    merged = report.merge([
+        {"id": "P-1", "category": "Pump", "notes": "from llm"},
+        {"id": "E-1", "category": "Heat Exchanger", "notes": "from llm"},
+    ])
+    assert list(merged.equipments) == ["E-1", "P-1"]
+    assert merged.equipments["E-1"]["notes"] == "from llm"
+    assert "pre-sizing" in merged.equipments["P-1"]["notes"]
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from processdesignagents.agents.utils.prompt_cache import (
+    PromptCacheStats,
+    cacheable_system_message,
+    supports_cache_control,
+)
+
+
+def _openrouter(model):
+    return SimpleNamespace(model_name=model, openai_api_base="https://openrouter.ai/api/v1")
+
+
+def test_cache_control_only_for_supported_models():
+    """OpenRouter Anthropic/Gemini models get a cache breakpoint; others a plain message."""
+    assert supports_cache_control(_openrouter("anthropic/claude-sonnet-4"))
+    assert supports_cache_control(_openrouter("google/gemini-2.5-flash"))
+    assert not supports_cache_control(_openrouter("openai/gpt-4o"))
+    assert not supports_cache_control(SimpleNamespace(model_name="anthropic/x", openai_api_base="http://localhost"))
+
+    cached = cacheable_system_message("static prompt", _openrouter("anthropic/claude-sonnet-4"))
+    assert cached.content == [
+        {"type": "text", "text": "static prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    plain = cacheable_system_message("static prompt", _openrouter("openai/gpt-4o"))
+    assert plain.content == "static prompt"
+
+
+def test_stats_split_cached_and_uncached_tokens():
+    """Usage metadata of AI messages is accumulated per label."""
+    stats = PromptCacheStats()
+    usage = {
+        "input_tokens": 1000,
+        "output_tokens": 50,
+        "total_tokens": 1050,
+        "input_token_details": {"cache_read": 800},
+    }
+    combined = stats.record_all(
+        "sizing",
+        [HumanMessage("ignored"), AIMessage("a", usage_metadata=usage), AIMessage("b", usage_metadata=usage)],
+    )
+    assert combined.calls == 2
+    total = stats.total()
+    assert (total.input_tokens, total.cached_tokens, total.uncached_tokens) == (2000, 1600, 400)
+    assert total.cached_ratio == 0.8
+    assert "sizing" in stats.summary()
+
+    stats.record("sizing", AIMessage("no usage"))
+    assert stats.total().calls == 2
@@ -12,3 +12,42 @@ def test_load_prompt_not_found():
     """Test loading a non-existent prompt file."""
     with pytest.raises(FileNotFoundError):
         load_prompt("non_existent_prompt.txt")
+
+
+def test_registry_reads_each_file_once(tmp_path):
+    """Prompt files are read once and served from memory afterwards."""
+    from processdesignagents.agents.utils.prompt_utils import PromptRegistry
+
+    prompt_file = tmp_path / "system.md"
+    prompt_file.write_text("first", encoding="utf-8")
+    registry = PromptRegistry(tmp_path)
+    assert registry.load("system.md") == "first"
+    prompt_file.write_text("second", encoding="utf-8")
+    assert registry.load("system.md") == "first"
+
+
+def test_registry_watch_mode_reloads_on_change(tmp_path):
+    """With watch=True an edited prompt file is picked up."""
+    import os
+    from processdesignagents.agents.utils.prompt_utils import PromptRegistry
+
+    prompt_file = tmp_path / "system.md"
+    prompt_file.write_text("first", encoding="utf-8")
+    registry = PromptRegistry(tmp_path, watch=True)
+    assert registry.load("system.md") == "first"
+    prompt_file.write_text("second", encoding="utf-8")
+    stat = prompt_file.stat()
+    os.utime(prompt_file, (stat.st_atime, stat.st_mtime + 10))
+    assert registry.load("system.md") == "second"
+
+
+def test_build_chat_prompt_keeps_braces_and_reuses_system_message():
+    """Chat prompts pass literal braces through and share the system message."""
+    from processdesignagents.agents.utils.prompt_utils import build_chat_prompt
+
+    first = build_chat_prompt("System {{ not_a_var }}", 'Return {"a": 1}')
+    second = build_chat_prompt("System {{ not_a_var }}", "Other")
+    messages = first.invoke({}).to_messages()
+    assert messages[0].content == "System {{ not_a_var }}"
+    assert messages[1].content == 'Return {"a": 1}'
+    assert first.messages[0] is second.messages[0]
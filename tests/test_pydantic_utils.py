@@ -0,0 +1,67 @@
+import json
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+
+from processdesignagents.utils.pydantic_utils import (
+    EquipmentAndStreamList,
+    Stream,
+    cached_json_schema,
+    cached_type_adapter,
+    equipment_and_stream_errors,
+    validate_equipment_and_stream_list,
+)
+
+STREAM = {
+    "id": "1001",
+    "name": "Feed",
+    "description": "Fresh feed",
+    "from": "Battery limit",
+    "to": "E-101",
+    "phase": "Liquid",
+    "properties": {"mass_flow": {"value": 1000.0, "unit": "kg/h"}},
+    "compositions": {"Water": {"value": 1.0, "unit": "molar fraction"}},
+}
+EQUIPMENT = {
+    "id": "E-101",
+    "name": "Feed heater",
+    "service": "Heat feed",
+    "type": "Shell-and-tube",
+    "category": "Heat Exchanger",
+    "streams_in": ["1001"],
+    "streams_out": ["1002"],
+    "design_criteria": "Outlet 80 °C",
+    "sizing_parameters": [{"name": "Area", "quantity": {"value": 12.0, "unit": "m²"}}],
+}
+PAYLOAD = {"equipments": [EQUIPMENT], "streams": [STREAM], "notes_and_assumptions": ["TBD"]}
+
+
+def test_schema_and_adapters_are_cached():
+    """Schemas and TypeAdapters are built once per type."""
+    assert cached_json_schema(EquipmentAndStreamList) is cached_json_schema(EquipmentAndStreamList)
+    assert cached_type_adapter(List[Stream]) is cached_type_adapter(List[Stream])
+
+
+def test_validate_from_bytes_and_trusted_path_agree():
+    """JSON bytes validation and the model_construct fast path give the same dump."""
+    raw = json.dumps(PAYLOAD).encode()
+    validated = validate_equipment_and_stream_list(raw)
+    constructed = validate_equipment_and_stream_list(raw, trusted=True)
+    assert validated.streams[0].source == "Battery limit"
+    assert constructed.streams[0].properties["mass_flow"].value == 1000.0
+    assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+
+def test_errors_are_reported_per_field():
+    """Each invalid field is reported with its dotted location."""
+    broken = json.loads(json.dumps(PAYLOAD))
+    broken["streams"][0]["properties"]["mass_flow"]["value"] = "lots"
+    del broken["equipments"][0]["service"]
+    errors = equipment_and_stream_errors(broken)
+    assert len(errors) == 2
+    assert any(error.startswith("streams.0.properties.mass_flow.value:") for error in errors)
+    assert any(error.startswith("equipments.0.service:") for error in errors)
+    assert equipment_and_stream_errors(PAYLOAD) == []
+    with pytest.raises(ValidationError):
+        validate_equipment_and_stream_list(json.dumps(broken))
@@ -0,0 +1,53 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.preliminary import prelim_pressure_safety_valve_sizing
+from processdesignagents.sizing_tools.relief import (
+    ORIFICE_AREAS_MM2,
+    relief_valve_design,
+    select_orifices,
+    vapor_relief_area,
+)
+
+
+def test_vapor_area_matches_api_520_example():
+    """API 520 Part I worked example: 24 270 kg/h, 670 kPa(a), M 51, k 1.11, Z 0.9 needs about 3 698 mm²."""
+    area, critical = vapor_relief_area(
+        np.array(24270.0), np.array(670.0), np.array(101.325), np.array(348.0), np.array(51.0), np.array(1.11), np.array(0.9)
+    )
+    assert critical
+    np.testing.assert_allclose(area, 3698.0, rtol=1e-3)
+
+
+def test_orifice_selection_picks_smallest_sufficient_orifice():
+    """The binary search returns the first orifice at least as large; oversize loads use several T valves."""
+    index, valves = select_orifices(np.array([ORIFICE_AREAS_MM2[3], ORIFICE_AREAS_MM2[3] + 1.0, 2.5 * ORIFICE_AREAS_MM2[-1]]))
+    assert index.tolist() == [3, 4, len(ORIFICE_AREAS_MM2) - 1]
+    assert valves.tolist() == [1.0, 1.0, 3.0]
+
+
+def test_batch_covers_every_phase_in_one_call():
+    """Vapour, liquid and steam items are sized together and unsupported phases come back empty."""
+    design = relief_valve_design(
+        [24270.0, 5000.0, 30000.0, 1000.0, 8000.0],
+        [5.0, 10.0, 8.0, 5.0, 3.0],
+        [0.0, 0.0, 0.0, 0.0, 2.0],
+        phase=["vapor", "liquid", "steam", "two-phase", "gas"],
+        molecular_weight=51.0,
+        liquid_density_kg_m3=900.0,
+    )
+    assert design["flow_regime"].tolist() == ["critical", "liquid", "steam", "", "subcritical"]
+    assert design["orifice"][3] == "" and np.isnan(design["required_area_mm2"][3])
+    sized = np.array([0, 1, 2, 4])
+    assert (design["orifice_area_mm2"][sized] >= design["required_area_mm2"][sized]).all()
+    assert (design["inlet_loss_percent_of_set"][sized] <= 3.0).all()
+    assert (design["built_up_back_pressure_percent_of_set"][sized] <= 10.0).all()
+    assert (design["inlet_line_nps"][sized] >= design["valve_inlet_nps"][sized]).all()
+
+
+def test_preliminary_psv_reports_real_orifice():
+    """The sizing tool reports the selected orifice and refuses vapour cases without molecular weight."""
+    result = prelim_pressure_safety_valve_sizing("V-101", 5000.0, 10.0, 0.0, "liquid", fluid_density_kg_m3=900.0)
+    assert result["orifice_designation"] == "D"
+    assert result["valve_size_class"] == '1" x D x 2"'
+    assert result["valve_capacity_kg_h"] >= 5000.0
+    assert not prelim_pressure_safety_valve_sizing("V-101", 24270.0, 5.0, 0.0, "vapor").ok
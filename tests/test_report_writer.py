@@ -0,0 +1,69 @@
+from processdesignagents.graph.process_design_graph import ProcessDesignGraph
+
+STATE = {
+    "problem_statement": "Design a water heater.",
+    "process_requirements": "  Heat 1000 kg/h of water.  ",
+    "design_basis": "",
+    "equipment_and_stream_results": '{"equipments": [], "streams": [{"id": "1001"}]}',
+    "project_manager_report": "Approved.",
+}
+
+
+def _graph():
+    graph = ProcessDesignGraph.__new__(ProcessDesignGraph)
+    graph.config = {}
+    return graph
+
+
+def test_markdown_report_is_streamed_in_the_joined_format(tmp_path):
+    """The streamed file matches the join-based layout and skips empty sections."""
+    graph = _graph()
+    path = graph._write_markdown_report(STATE, tmp_path / "nested" / "report.md")
+    text = path.read_text(encoding="utf-8")
+
+    expected_lines = []
+    for title, content in graph._compose_report_sections(STATE):
+        if content:
+            expected_lines += [f"# {title}", content.strip(), ""]
+    assert text == "\n".join(expected_lines).rstrip() + "\n"
+    assert "# Design Basis" not in text
+    assert "**1001**" in text
+
+
+def test_report_sections_are_lazy():
+    """Sections are produced one at a time; later ones are not rendered up front."""
+    sections = _graph()._iter_report_sections({"problem_statement": "x"})
+    assert next(sections) == ("Problem Statement", "x")
+
+
+def test_native_word_export_renders_headings_and_tables(tmp_path):
+    """The python-docx renderer turns report headings and pipe tables into Word objects."""
+    from docx import Document
+
+    from processdesignagents.utils.word_export import export_markdown_to_word
+
+    markdown = tmp_path / "report.md"
+    _graph()._write_markdown_report(STATE, markdown)
+    output = export_markdown_to_word(markdown, tmp_path / "report.docx", engine="docx")
+
+    document = Document(output)
+    headings = [p.text for p in document.paragraphs if p.style.name.startswith("Heading")]
+    assert headings[0] == "Problem Statement"
+    assert document.tables[0].cell(0, 1).text == "1001"
+
+
+def test_background_word_export(tmp_path):
+    """Word export runs in a worker process and leaves the markdown input when asked to."""
+    from processdesignagents.utils.word_export import shutdown_word_export_worker
+
+    graph = _graph()
+    graph.config = {"save_dir": str(tmp_path), "word_export_engine": "docx"}
+    markdown = graph._write_markdown_report(STATE, tmp_path / "report.md")
+    graph._write_word_report(STATE, tmp_path / "report.docx", markdown_path=markdown)
+    assert graph.word_export_future.result(timeout=60).endswith("report.docx")
+    assert markdown.exists()
+
+    graph._write_word_report(STATE, tmp_path / "only.docx")
+    graph.word_export_future.result(timeout=60)
+    shutdown_word_export_worker()
+    assert (tmp_path / "only.docx").exists()
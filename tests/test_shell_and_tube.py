@@ -0,0 +1,62 @@
+import numpy as np
+
+from processdesignagents.sizing_tools.preliminary import prelim_basic_heat_exchanger_sizing
+from processdesignagents.sizing_tools.shell_and_tube import (
+    design_shell_and_tube,
+    lmtd_correction_factor,
+    rate_shell_and_tube,
+)
+
+HOT_WATER = {"mass_flow_kg_s": 7.96, "density_kg_m3": 977.0, "viscosity_pa_s": 4.0e-4, "cp_j_kgk": 4190.0,
+             "conductivity_w_mk": 0.66}
+COLD_WATER = {"mass_flow_kg_s": 11.9, "density_kg_m3": 995.0, "viscosity_pa_s": 8.0e-4, "cp_j_kgk": 4180.0,
+              "conductivity_w_mk": 0.61}
+
+
+def test_ft_matches_one_two_formula_and_improves_with_shells():
+    """One shell reproduces the classic 1-2 Ft; a second shell rescues a profile one shell cannot meet."""
+    r, p = 1.5, 0.4
+    s = np.sqrt(r**2 + 1.0)
+    classic = s * np.log((1 - p) / (1 - p * r)) / ((r - 1) * np.log((2 - p * (1 + r - s)) / (2 - p * (1 + r + s))))
+    np.testing.assert_allclose(lmtd_correction_factor(r, p), classic)
+    one, two = lmtd_correction_factor(1.0, 0.6, [1, 2])
+    assert np.isnan(one) and two > 0.75
+
+
+def test_bell_delaware_rating_is_vectorized_and_physical():
+    """A baffle-spacing sweep rates in one call: closer baffles raise both h and shell pressure drop."""
+    ratios = np.array([0.2, 0.3, 0.45, 0.6, 1.0])
+    rating = rate_shell_and_tube(1, 150, 0.01905, 0.00211, 4.88, 2, 30, ratios, COLD_WATER, HOT_WATER)
+    single = rate_shell_and_tube(1, 150, 0.01905, 0.00211, 4.88, 2, 30, ratios[2], COLD_WATER, HOT_WATER)
+    np.testing.assert_allclose(single["u_w_m2k"], rating["u_w_m2k"][2])
+    assert (np.diff(rating["shell_h_w_m2k"]) < 0).all()
+    assert (np.diff(rating["shell_pressure_drop_pa"]) < 0).all()
+    for factor in ("jc", "jl", "jb"):
+        assert ((rating[factor] > 0.2) & (rating[factor] < 1.2)).all()
+    np.testing.assert_allclose(rating["tube_pressure_drop_pa"], rating["tube_pressure_drop_pa"][0])
+
+
+def test_design_meets_duty_and_pressure_drop_limits():
+    """The selected geometry covers the required area; a tighter limit is honoured at a larger area."""
+    design = design_shell_and_tube(1e6, 90.0, 60.0, 20.0, 40.0, COLD_WATER, HOT_WATER)
+    tight = design_shell_and_tube(1e6, 90.0, 60.0, 20.0, 40.0, COLD_WATER, HOT_WATER,
+                                  max_shell_pressure_drop_pa=10e3, max_tube_pressure_drop_pa=10e3)
+    for result, limit in ((design, 70e3), (tight, 10e3)):
+        assert result["area_m2"] >= result["required_area_m2"]
+        assert result["shell_pressure_drop_pa"] <= limit and result["tube_pressure_drop_pa"] <= limit
+    assert tight["area_m2"] > design["area_m2"]
+    assert np.isnan(design_shell_and_tube(1e6, 90.0, 60.0, 20.0, 40.0, COLD_WATER, HOT_WATER,
+                                          max_shell_pressure_drop_pa=1.0)["area_m2"])
+
+
+def test_preliminary_exchanger_rates_with_fluid_data():
+    """With compositions the tool reports real pressure drops; without them it keeps the U-estimate path."""
+    rated = prelim_basic_heat_exchanger_sizing(1000.0, 90.0, 60.0, 20.0, 40.0, 800.0,
+                                               hot_components=["water"], cold_components=["water"])
+    assert 0 < rated["pressure_drop_shell_kpa"] <= 70.0 and 0 < rated["pressure_drop_tube_kpa"] <= 70.0
+    assert rated["area_m2"] >= rated["required_area_m2"]
+    estimate = prelim_basic_heat_exchanger_sizing(1000.0, 90.0, 60.0, 20.0, 40.0, 800.0, configuration="2-4")
+    assert estimate["pressure_drop_shell_kpa"] is None and estimate["ft_correction_factor"] > 0.98
+    condensing = prelim_basic_heat_exchanger_sizing(1000.0, 150.0, 90.0, 25.0, 45.0, 800.0, hot_components=["water"],
+                                                    cold_components=["water"], hot_pressure_kpa=101.325)
+    assert "single-phase" in condensing.error
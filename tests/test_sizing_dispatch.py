@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from processdesignagents.sizing_tools import config as sizing_config
+from processdesignagents.sizing_tools import interface
+
+
+@pytest.fixture(autouse=True)
+def restore_sizing_config(monkeypatch):
+    monkeypatch.setattr(sizing_config, "_config", sizing_config.get_config())
+    yield
+    interface.clear_sizing_dispatch_cache()
+
+
+def test_routes_are_compiled_once_and_rebuilt_on_set_config():
+    """The dispatch table is reused until set_config changes the configuration."""
+    route = interface.get_sizing_route("pump_sizing")
+    assert interface.get_sizing_route("pump_sizing") is route
+    assert route.category == "pump"
+
+    sizing_config.set_config({"sizing_tool_methods": {"pump_sizing": "advanced, preliminary"}})
+    updated = interface.get_sizing_route("pump_sizing")
+    assert updated is not route
+    assert updated.primary == ("advanced", "preliminary")
+    assert [(vendor, bool(impls)) for vendor, _, impls in updated.vendors] == [
+        ("advanced", False),
+        ("preliminary", True),
+    ]
+
+
+def test_summary_and_quiet_log_modes(capsys):
+    """Summary mode prints one SIZING line per call; quiet mode prints no dispatch output."""
+    sizing_config.set_config({"sizing_log_mode": "summary"})
+    result = interface.equipment_sizing("pump_sizing", 10000.0, 1e5, 5e5, 1000.0)
+    assert result["volumetric_flow_m3_h"] == pytest.approx(10.0)
+    out = capsys.readouterr().out
+    assert "SIZING: method=pump_sizing category=pump vendors=preliminary status=ok" in out
+    assert "Calling method" not in out
+
+    sizing_config.set_config({"sizing_log_mode": "quiet"})
+    interface.equipment_sizing("pump_sizing", 10000.0, 1e5, 5e5, 1000.0)
+    out = capsys.readouterr().out
+    assert "SIZING:" not in out and "Attempting" not in out
+
+
+def test_unknown_method_is_rejected():
+    """Methods outside the dispatch table raise ValueError."""
+    with pytest.raises(ValueError):
+        interface.equipment_sizing("flux_capacitor_sizing")
+    with pytest.raises(ValueError):
+        interface.get_category_for_method("flux_capacitor_sizing")
+
+
+def test_results_are_objects_until_the_tool_boundary():
+    """Sizing returns SizingResult objects; only the LangChain tool serializes them."""
+    from processdesignagents.agents.utils.agent_sizing_tools import size_pump_basic
+
+    result = interface.equipment_sizing("pump_sizing", 10000.0, 1e5, 5e5, 1000.0)
+    assert result.ok and result.method == "pump_sizing"
+    tool_output = size_pump_basic.invoke(
+        {
+            "mass_flow_kg_h": 10000.0,
+            "inlet_pressure_pa": 1e5,
+            "outlet_pressure_pa": 5e5,
+            "fluid_density_kg_m3": 1000.0,
+        }
+    )
+    assert json.loads(tool_output) == result.values
+
+    failed = interface.equipment_sizing("pump_sizing", -1.0, 1e5, 5e5, 1000.0)
+    assert not failed.ok
+    assert json.loads(failed.to_json()) == {"error": failed.error}
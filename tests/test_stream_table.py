@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from processdesignagents.agents.utils.flowsheet import Flowsheet
+from processdesignagents.agents.utils.stream_table import StreamTable
+
+STREAMS = [
+    {
+        "id": "1001",
+        "name": "Feed",
+        "from": "Battery limit",
+        "to": "E-101",
+        "phase": "Liquid",
+        "properties": {
+            "mass_flow": {"value": 3600.0, "unit": "kg/h"},
+            "temperature": {"value": 25.1, "unit": "°C"},
+            "pressure": {"value": 2, "unit": "barg"},
+            "density": {"value": "TBD", "unit": "kg/m³"},
+        },
+        "compositions": {
+            "Water": {"value": 0.9, "unit": "molar fraction"},
+            "Ethanol": {"value": 0.1, "unit": "molar fraction"},
+            "m_Water": {"value": 0.78, "unit": "mass fraction"},
+            "m_Ethanol": {"value": 0.22, "unit": "mass fraction"},
+        },
+        "notes": "Feed",
+    },
+    {
+        "id": "1002",
+        "from": "E-101",
+        "to": "Product",
+        "properties": {"mass_flow": {"value": 7200.0, "unit": "kg/h"}},
+        "compositions": {"Ethanol": {"value": 1.0, "unit": "molar fraction"}},
+        "custom_tag": ["kept"],
+    },
+]
+
+
+def test_stream_table_round_trip_is_lossless():
+    """to_streams reproduces the input, including irregular entries and extra keys."""
+    table = StreamTable.from_streams(STREAMS)
+    assert table.to_streams() == STREAMS
+    assert isinstance(table.to_streams()[0]["properties"]["pressure"]["value"], int)
+    assert len(table) == 2 and table.index["1002"] == 1
+
+
+def test_stream_table_columns_are_si():
+    """Property columns hold SI values and missing cells are NaN."""
+    table = StreamTable.from_streams(STREAMS)
+    np.testing.assert_allclose(table.column("mass_flow"), [1.0, 2.0])
+    assert table.column("temperature")[0] == pytest.approx(298.25)
+    assert table.column("pressure")[0] == pytest.approx(301325.0)
+    assert np.isnan(table.column("temperature")[1])
+    assert np.isnan(table.column("unknown")).all()
+
+
+def test_stream_table_fraction_matrices():
+    """Mass and molar fractions are split into separate dense matrices."""
+    table = StreamTable.from_streams(STREAMS)
+    names, mass = table.fraction_matrix("mass")
+    assert names == ["Water", "Ethanol"]
+    np.testing.assert_allclose(mass[0], [0.78, 0.22])
+    assert np.isnan(mass[1]).all()
+    names, molar = table.fraction_matrix("molar")
+    assert names == ["Water", "Ethanol"]
+    np.testing.assert_allclose(np.nansum(molar, axis=1), [1.0, 1.0])
+
+
+def test_flowsheet_stream_table():
+    """Flowsheet.stream_table builds the table from the indexed streams."""
+    flowsheet = Flowsheet.from_dict({"equipments": [], "streams": STREAMS})
+    assert flowsheet.stream_table().to_streams() == STREAMS
+
+
+def test_stream_table_flags_unconvertible_units():
+    """Unparsed or wrong-dimension units give NaN, are flagged and round-trip verbatim."""
+    streams = [
+        {"id": "1", "properties": {"mass_flow": {"value": 10.0, "unit": "kg/hr"}}},
+        {"id": "2", "properties": {"mass_flow": {"value": 5.0, "unit": "°C"}}},
+        {"id": "3", "properties": {"mass_flow": {"value": 3600.0, "unit": "kg/h"},
+                                   "pressure": {"value": 2.0, "unit": "bar(a)"}}},
+    ]
+    table = StreamTable.from_streams(streams)
+    flow = table.column("mass_flow")
+    assert np.isnan(flow[:2]).all() and flow[2] == pytest.approx(1.0)
+    assert table.irregular_mask("mass_flow").tolist() == [True, True, False]
+    assert table.irregular_mask("pressure").tolist() == [False, False, True]
+    assert table.to_streams() == streams
+
+
+def test_stream_table_round_trip_is_exact():
+    """Source values come back bit for bit, not rounded after the SI conversion."""
+    rng = np.random.default_rng(3)
+    values = [float(value) for value in rng.uniform(-50.0, 500.0, 200)]
+    streams = [{"id": str(row), "properties": {"temperature": {"value": value, "unit": "°F"}}}
+               for row, value in enumerate(values)]
+    rebuilt = StreamTable.from_streams(streams).to_streams()
+    assert [stream["properties"]["temperature"]["value"] for stream in rebuilt] == values